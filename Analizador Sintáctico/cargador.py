@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Carga de módulos por ruta, compartida por todo el repositorio.
+
+Cada fase del curso vive en su propio directorio (con espacios y acentos en
+el nombre) y varios módulos se llaman igual (`main.py`, `lexer_parser.py`),
+así que no se agregan directorios a sys.path: cada módulo se registra en
+sys.modules con un nombre único. Quien necesita `importar` carga este
+archivo con `runpy.run_path`, que no depende de él.
+"""
+
+import importlib.util
+import sys
+
+
+def importar(nombre, ruta):
+    """Carga el módulo de `ruta` como `nombre` (una sola vez) y lo retorna."""
+    if nombre in sys.modules:
+        return sys.modules[nombre]
+    spec = importlib.util.spec_from_file_location(nombre, ruta)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[nombre] = mod
+    spec.loader.exec_module(mod)
+    return mod
@@ -1,90 +1,19 @@
 #!/usr/bin/env python3
 
+import os
 import re
+import runpy
+from array import array
 
-# ==========================
-# 1) Definición de clases
-# ==========================
-
-class ElementoPila:
-    def muestra(self):
-        raise NotImplementedError("Debe implementarse en la subclase.")
-
-
-class Terminal(ElementoPila):
-    def __init__(self, tipo, lexema):
-        self.tipo = tipo
-        self.lexema = lexema
-
-    def muestra(self):
-        print(f"Terminal({self.lexema})", end=' ')
-
-    def get_tipo(self):
-        return self.tipo
-
-    def get_lexema(self):
-        return self.lexema
-
-
-class NoTerminal(ElementoPila):
-    def __init__(self, simbolo, nombre):
-        self.simbolo = simbolo
-        self.nombre = nombre
-
-    def muestra(self):
-        print(f"NoTerminal({self.nombre})", end=' ')
-
-    def get_simbolo(self):
-        return self.simbolo
-
-    def get_nombre(self):
-        return self.nombre
-
+_AQUI = os.path.dirname(os.path.abspath(__file__))
 
-class Estado(ElementoPila):
-    def __init__(self, numero):
-        self.numero = numero
 
-    def muestra(self):
-        print(f"Estado({self.numero})", end=' ')
-
-    def get_numero(self):
-        return self.numero
-
-
-# ==========================
-# 2) Pila de objetos
-# ==========================
-
-class Pila:
-    def __init__(self):
-        self.lista = []
-
-    def push(self, elemento):
-        self.lista.append(elemento)
-
-    def pop(self):
-        if not self.empty():
-            return self.lista.pop()
-        return None
-
-    def top(self):
-        if not self.empty():
-            return self.lista[-1]
-        return None
-
-    def empty(self):
-        return (len(self.lista) == 0)
-
-    def muestra(self):
-        print("Contenido de la pila (base -> tope):")
-        for elem in self.lista:
-            elem.muestra()
-        print("\n")
+# importar(nombre, ruta): carga por ruta con un nombre único (ver cargador.py)
+importar = runpy.run_path(os.path.join(_AQUI, 'cargador.py'))['importar']
 
 
 # ==========================
-# 3) Tabla LR y Reglas
+# 1) Tabla LR y Reglas
 # ==========================
 
 reglas = [
@@ -116,7 +45,22 @@ tabla = {
 
 
 # ==========================
-# 4) Analizador léxico simple
+# 2) Tabla compilada a enteros
+# ==========================
+
+# tabla_lr.py también lo usa 'Avances en la Construcción de tu Traductor'.
+# Convención de enteros: n > 0 shift o goto, -1 aceptar, n < -1 reducir por
+# reglas[-n - 2] y 0 error (ver tabla_lr.py).
+tabla_lr = importar('analizador_sintactico_tabla_lr', os.path.join(_AQUI, 'tabla_lr.py'))
+ACEPTAR, ERROR = tabla_lr.ACEPTAR, tabla_lr.ERROR
+compilar_tabla, decodificar = tabla_lr.compilar_tabla, tabla_lr.decodificar
+leer_lr_file, cargar_tabla = tabla_lr.leer_lr_file, tabla_lr.cargar_tabla
+
+reglas, filas = cargar_tabla(tabla, reglas)
+
+
+# ==========================
+# 3) Analizador léxico simple
 # ==========================
 
 def lexico_rapido(cadena):
@@ -135,85 +79,104 @@ def lexico_rapido(cadena):
 
 
 # ==========================
-# 5) Función principal de análisis
+# 4) Función principal de análisis
 # ==========================
 
-def analizar(tokens):
-    stack = Pila()
-    stack.push(Estado(0))
-
-    i = 0 
+def analizar(tokens, traza=None, valores=None, reglas=reglas, filas=filas):
+    """
+    Parser LR con la pila de estados en un array('i') y la tabla en filas de
+    enteros (ver compilar_tabla): el ciclo no construye tuplas ni compara
+    cadenas. `reglas` y `filas` deben venir de cargar_tabla(), que las valida.
+
+    :param traza: callable opcional traza(estados, tipo, lexema, accion),
+                  llamado antes de aplicar cada acción (ver TrazaPila).
+    :param valores: lista opcional que se usa como pila de valores
+                    semánticos: un shift apila el lexema y una reducción
+                    reemplaza sus `rhs_len` valores por (nombre, hijos).
+                    Al aceptar, valores[-1] es la raíz del árbol.
+    """
+    estados = array('i', [0])
+    num_cols = len(filas[0])
+    n = len(tokens)
+    i = 0
     while True:
-        top_elem = stack.top()
-        if not top_elem:
-            print("Error: la pila está vacía.")
-            return False
-        if not isinstance(top_elem, Estado):
-            print("Error: el tope de la pila no es un Estado.")
-            return False
-
-        estado_actual = top_elem.get_numero()
-
-        if i >= len(tokens):
+        if i >= n:
             print("No hay más tokens, se esperaba '$'.")
             return False
-
         tipo_token, lexema_token = tokens[i]
-
-        if (estado_actual, tipo_token) not in tabla:
+        estado_actual = estados[-1]
+        try:
+            accion = filas[estado_actual][tipo_token] if 0 <= tipo_token < num_cols else ERROR
+        except TypeError:
+            accion = ERROR      # tipo que no es entero (None, ...)
+        if accion == ERROR:
             print(f"Error: no hay acción para estado {estado_actual} con token '{lexema_token}'")
             return False
+        if traza is not None:
+            traza(estados, tipo_token, lexema_token, accion)
 
-        accion = tabla[(estado_actual, tipo_token)]
-
-        stack.muestra()
-        print(f"Token actual: {lexema_token} (tipo={tipo_token})")
-        print(f"Acción: {accion}\n")
-
-        if accion[0] == 's':
-            estado_destino = accion[1]
-            stack.push(Terminal(tipo_token, lexema_token))
-            stack.push(Estado(estado_destino))
+        if accion > 0:
+            estados.append(accion)
+            if valores is not None:
+                valores.append(lexema_token)
             i += 1
 
-        elif accion[0] == 'r':
-            num_regla = accion[1] 
-            lhs, rhs_len, lhs_nombre = reglas[num_regla]
-            for _ in range(rhs_len):
-                stack.pop()
-                stack.pop()
-
-            top_state = stack.top()
-            if not isinstance(top_state, Estado):
-                print("Error: tras la reducción el tope no es un Estado.")
+        elif accion < ACEPTAR:
+            lhs, rhs_len, lhs_nombre = reglas[-accion - 2]
+            if rhs_len >= len(estados):
+                print("Error: pila insuficiente para reducción.")
                 return False
-
-            nuevo_estado = top_state.get_numero()
-            if (nuevo_estado, lhs) not in tabla:
+            hijos = []
+            if rhs_len:
+                del estados[-rhs_len:]
+                if valores is not None:
+                    hijos = valores[-rhs_len:]
+                    del valores[-rhs_len:]
+            nuevo_estado = estados[-1]
+            goto = filas[nuevo_estado][lhs]
+            if goto <= 0:
                 print(f"Error: no hay goto para estado {nuevo_estado} con símbolo {lhs_nombre}")
                 return False
+            estados.append(goto)
+            if valores is not None:
+                valores.append((lhs_nombre, hijos))
 
-            goto_accion = tabla[(nuevo_estado, lhs)]
-            if goto_accion[0] != 'g':
-                print("Error: se esperaba 'g' tras una reducción.")
-                return False
-
-            estado_destino = goto_accion[1]
-
-            stack.push(NoTerminal(lhs, lhs_nombre))
-            stack.push(Estado(estado_destino))
-
-        elif accion[0] == 'acc':
+        else:
             print("¡Cadena aceptada correctamente!\n")
             return True
 
-        else:
-            print(f"Acción desconocida: {accion}")
-            return False
+
+class TrazaPila:
+    """
+    Traza para `analizar`: imprime la pila en cada paso con el formato de
+    la antigua pila de objetos (Estado/Terminal/NoTerminal). Reconstruye los
+    símbolos a partir de las acciones, así que solo cuesta cuando se usa.
+    """
+    def __init__(self, reglas=reglas):
+        self.reglas = reglas
+        self.simbolos = []
+
+    def __call__(self, estados, tipo, lexema, accion):
+        partes = [f"Estado({estados[0]})"]
+        for simbolo, estado in zip(self.simbolos, estados[1:]):
+            partes.append(simbolo)
+            partes.append(f"Estado({estado})")
+        print("Contenido de la pila (base -> tope):")
+        print(' '.join(partes), end=' ')
+        print("\n")
+        print(f"Token actual: {lexema} (tipo={tipo})")
+        print(f"Acción: {decodificar(accion)}\n")
+
+        if accion > 0:
+            self.simbolos.append(f"Terminal({lexema})")
+        elif accion < ACEPTAR:
+            _, rhs_len, lhs_nombre = self.reglas[-accion - 2]
+            del self.simbolos[len(self.simbolos) - rhs_len:]
+            self.simbolos.append(f"NoTerminal({lhs_nombre})")
 
 
 # ==========================
-# 6) Pruebas / Main
+# 5) Pruebas / Main
 # ==========================
 
 def main():
@@ -229,7 +192,7 @@ def main():
         print("======================================")
         print(f"Analizando la cadena: {cadena}")
         tokens = lexico_rapido(cadena)
-        aceptado = analizar(tokens)
+        aceptado = analizar(tokens, traza=TrazaPila())
         print("Resultado:", "ACEPTADO" if aceptado else "RECHAZADO")
         print("======================================\n")
 
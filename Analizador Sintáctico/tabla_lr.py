@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tablas LR como filas de enteros, compartidas por `Analizador Sintáctico/main.py`
+y `Avances en la Construcción de tu Traductor/main.py`.
+
+Convención de enteros (la misma de compilador.lr):
+  n > 0   shift al estado n (en columnas de terminales) o goto (en no terminales)
+  -1      aceptar
+  n < -1  reducir por reglas[-n - 2]
+  0       error (celda vacía)
+
+`cargar_tabla` y `leer_lr_file` validan la tabla al cargarla (validar_tabla):
+destinos y reglas dentro de rango y todas las filas del mismo ancho. Así el
+ciclo de `analizar` solo revisa el tipo de cada token.
+"""
+
+ACEPTAR = -1
+ERROR = 0
+
+
+def compilar_tabla(tabla):
+    """
+    Convierte una tabla {(estado, símbolo): ('s', n) | ('g', n) | ('r', k) | ('acc',)}
+    en una lista de filas de enteros, una por estado, indexadas por símbolo.
+    """
+    destinos = [a[1] for a in tabla.values() if a[0] in ('s', 'g')]
+    num_filas = 1 + max([e for e, _ in tabla] + destinos)
+    num_cols = 1 + max(s for _, s in tabla)
+    filas = [[ERROR] * num_cols for _ in range(num_filas)]
+    for (estado, simbolo), accion in tabla.items():
+        if accion[0] in ('s', 'g'):
+            if accion[1] <= 0:
+                raise ValueError(f"Destino inválido en ({estado}, {simbolo}): {accion}")
+            filas[estado][simbolo] = accion[1]
+        elif accion[0] == 'r':
+            filas[estado][simbolo] = -accion[1] - 2
+        elif accion[0] == 'acc':
+            filas[estado][simbolo] = ACEPTAR
+        else:
+            raise ValueError(f"Acción desconocida en ({estado}, {simbolo}): {accion}")
+    return filas
+
+
+def validar_tabla(reglas, filas):
+    """
+    Revisa que todo shift/goto lleve a una fila existente, que toda reducción
+    nombre una regla existente y que el lado izquierdo de cada regla sea una
+    columna de la tabla. Lanza ValueError; si no, retorna (reglas, filas).
+    """
+    if not filas:
+        raise ValueError("La tabla no tiene estados")
+    num_filas, num_cols = len(filas), len(filas[0])
+    for estado, fila in enumerate(filas):
+        if len(fila) != num_cols:
+            raise ValueError(f"El estado {estado} tiene {len(fila)} columnas; se esperaban {num_cols}")
+        for simbolo, accion in enumerate(fila):
+            if accion >= num_filas:
+                raise ValueError(f"Destino inválido en ({estado}, {simbolo}): {accion}")
+            if accion < ACEPTAR and -accion - 2 >= len(reglas):
+                raise ValueError(f"Regla inexistente en ({estado}, {simbolo}): {accion}")
+    for k, (lhs, rhs_len, nombre) in enumerate(reglas):
+        if not 0 <= lhs < num_cols or rhs_len < 0:
+            raise ValueError(f"Regla {k} inválida: {(lhs, rhs_len, nombre)}")
+    return reglas, filas
+
+
+def decodificar(accion):
+    """Entero -> acción en el formato del dict ('s', n), ('r', k) o ('acc',)."""
+    if accion > 0:
+        return ('s', accion)
+    if accion == ACEPTAR:
+        return ('acc',)
+    if accion < ACEPTAR:
+        return ('r', -accion - 2)
+    return None
+
+
+def leer_lr_file(filename):
+    """Lee un archivo con el formato de compilador.lr; retorna (reglas, filas)."""
+    with open(filename, "r", encoding="utf-8") as f:
+        lines = [line.split() for line in f if line.strip()]
+    num_reglas = int(lines[0][0])
+    reglas_lr = [(int(p[0]), int(p[1]), p[2]) for p in lines[1:1 + num_reglas]]
+    num_filas = int(lines[1 + num_reglas][0])
+    inicio = 2 + num_reglas
+    filas_lr = [[int(x) for x in p] for p in lines[inicio:inicio + num_filas]]
+    return validar_tabla(reglas_lr, filas_lr)
+
+
+def cargar_tabla(origen, reglas_origen=None):
+    """
+    Carga una tabla LR en forma de filas de enteros. `origen` puede ser un
+    dict como `tabla` (junto con sus `reglas_origen`) o la ruta de un
+    archivo .lr como compilador.lr. Retorna (reglas, filas).
+    """
+    if isinstance(origen, dict):
+        return validar_tabla(list(reglas_origen), compilar_tabla(origen))
+    return leer_lr_file(origen)
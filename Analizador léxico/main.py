@@ -1,4 +1,10 @@
+import os
 import re
+import runpy
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+# importar(nombre, ruta): carga por ruta con un nombre único
+importar = runpy.run_path(os.path.join(_AQUI, '..', 'Analizador Sintáctico', 'cargador.py'))['importar']
 
 class TokenType:
     IDENTIFICADOR = 0
@@ -28,125 +34,119 @@ class TokenType:
 
     PALABRAS_RESERVADAS = {"if": IF, "while": WHILE, "return": RETURN, "else": ELSE, "int": TIPO, "float": TIPO}
 
+# El léxico trabaja sobre bytes, con las tablas de 256 entradas y la
+# política de caracteres de `Analizador léxico/tablas_bytes.py`; aquí solo
+# se dan los tipos de token de cada operador.
+tablas_bytes = importar('analizador_lexico_tablas_bytes',
+                        os.path.join(_AQUI, 'tablas_bytes.py'))
+C_INVALIDO, C_ESPACIO, C_LETRA = tablas_bytes.C_INVALIDO, tablas_bytes.C_ESPACIO, tablas_bytes.C_LETRA
+C_DIGITO, C_OPERADOR = tablas_bytes.C_DIGITO, tablas_bytes.C_OPERADOR
+CLASE_BYTE, LEXEMA_BYTE, PUNTO = tablas_bytes.CLASE_BYTE, tablas_bytes.LEXEMA_BYTE, tablas_bytes.PUNTO
+OPERADORES, COMPUESTOS, LEXEMA_COMPUESTO = tablas_bytes.tablas_operadores({
+    '+': TokenType.OP_SUMA, '-': TokenType.OP_SUMA, '*': TokenType.OP_MUL, '/': TokenType.OP_MUL,
+    ';': TokenType.PUNTO_Y_COMA, ',': TokenType.COMA,
+    '(': TokenType.PARENTESIS_ABRE, ')': TokenType.PARENTESIS_CIERRA, '{': TokenType.LLAVE_ABRE, '}': TokenType.LLAVE_CIERRA,
+    '=': TokenType.ASIGNACION, '!': TokenType.OP_NOT, '<': TokenType.OP_RELAC, '>': TokenType.OP_RELAC, '$': TokenType.FIN,
+    '==': TokenType.OP_IGUALDAD, '!=': TokenType.OP_IGUALDAD, '<=': TokenType.OP_RELAC, '>=': TokenType.OP_RELAC,
+    '&&': TokenType.OP_AND, '||': TokenType.OP_OR,
+})
+
 class Lexico:
     def __init__(self, fuente=""):
-        self.fuente = fuente
-        self.ind = 0
+        self.entrada(fuente)
         self.simbolo = ""
         self.tipo = None
     
     def entrada(self, fuente):
+        """`fuente` puede ser str (se codifica en UTF-8), bytes o memoryview."""
         self.fuente = fuente
+        self.datos = fuente.encode('utf-8') if isinstance(fuente, str) else bytes(fuente)
         self.ind = 0
     
     def sig_caracter(self):
         if self.terminado():
             return '$'
-        c = self.fuente[self.ind]
+        b = self.datos[self.ind]
         self.ind += 1
-        return c
+        return LEXEMA_BYTE[b] if b < 128 else chr(b)
     
     def retroceso(self):
         if self.ind > 0:
             self.ind -= 1
     
     def sig_simbolo(self):
-        self.simbolo = ""
-        c = self.sig_caracter()
-        
+        datos, clase = self.datos, CLASE_BYTE
+        n, i = len(datos), self.ind
+
         # Ignorar espacios en blanco
-        while c.isspace():
-            c = self.sig_caracter()
-        
+        while i < n and clase[datos[i]] == C_ESPACIO:
+            i += 1
+        # Al terminar la entrada se devuelve el fin '$'
+        if i >= n:
+            self.ind = i
+            self.simbolo = '$'
+            self.tipo = TokenType.FIN
+            return self.tipo
+
+        b = datos[i]
+        c = clase[b]
+        j = i + 1
+
         # Identificadores o palabras reservadas
-        if c.isalpha():
-            self.simbolo += c
-            while not self.terminado():
-                c = self.sig_caracter()
-                if c.isalnum():
-                    self.simbolo += c
-                else:
-                    self.retroceso()
-                    break
+        if c == C_LETRA:
+            while j < n and C_LETRA <= clase[datos[j]] <= C_DIGITO:
+                j += 1
+            self.ind = j
+            self.simbolo = datos[i:j].decode('ascii')
             self.tipo = TokenType.PALABRAS_RESERVADAS.get(self.simbolo, TokenType.IDENTIFICADOR)
             return self.tipo
-        
+
         # Números enteros y reales
-        elif c.isdigit():
-            self.simbolo += c
-            while not self.terminado():
-                c = self.sig_caracter()
-                if c.isdigit():
-                    self.simbolo += c
-                elif c == '.':
-                    self.simbolo += c
-                    c = self.sig_caracter()
-                    if c.isdigit():
-                        self.simbolo += c
-                        while not self.terminado():
-                            c = self.sig_caracter()
-                            if c.isdigit():
-                                self.simbolo += c
-                            else:
-                                self.retroceso()
-                                break
-                        self.tipo = TokenType.REAL
-                        return self.tipo
-                    else:
-                        self.retroceso()
-                        break
-                else:
-                    self.retroceso()
-                    break
+        if c == C_DIGITO:
+            while j < n and clase[datos[j]] == C_DIGITO:
+                j += 1
             self.tipo = TokenType.ENTERO
+            if j < n and datos[j] == PUNTO:
+                j += 1
+                if j < n and clase[datos[j]] == C_DIGITO:
+                    j += 1
+                    while j < n and clase[datos[j]] == C_DIGITO:
+                        j += 1
+                    self.tipo = TokenType.REAL
+                # Sin dígito tras el punto queda un entero con el punto
+                # incluido ('12.'), como en la versión por caracteres
+            self.ind = j
+            self.simbolo = datos[i:j].decode('ascii')
             return self.tipo
-        
-        # Operadores y símbolos especiales
-        operadores = {
-            '+': TokenType.OP_SUMA, '-': TokenType.OP_SUMA,
-            '*': TokenType.OP_MUL, '/': TokenType.OP_MUL,
-            '=': TokenType.ASIGNACION, ';': TokenType.PUNTO_Y_COMA,
-            ',': TokenType.COMA, '(': TokenType.PARENTESIS_ABRE, ')': TokenType.PARENTESIS_CIERRA,
-            '{': TokenType.LLAVE_ABRE, '}': TokenType.LLAVE_CIERRA,
-            '!': TokenType.OP_NOT, '<': TokenType.OP_RELAC, '>': TokenType.OP_RELAC
-        }
 
-        if c in operadores:
-            self.simbolo = c
-            if c in ('<', '>', '!', '='):
-                c2 = self.sig_caracter()
-                if c2 == '=':
-                    self.simbolo += c2
-                    self.tipo = TokenType.OP_IGUALDAD if c in ('!', '=') else TokenType.OP_RELAC
-                    return self.tipo
-                else:
-                    self.retroceso()
-            self.tipo = operadores[c]
-            return self.tipo
-        
-        # Operadores lógicos
-        if c == '&' and self.sig_caracter() == '&':
-            self.simbolo = '&&'
-            self.tipo = TokenType.OP_AND
+        # Operadores y símbolos especiales (==, !=, <=, >=, && y || primero).
+        # El segundo carácter solo se mira si existe: al final de la entrada
+        # no se retrocede, así que 'a <' termina.
+        if c == C_OPERADOR:
+            if j < n:
+                par = (b, datos[j])
+                tipo = COMPUESTOS.get(par)
+                if tipo is not None:
+                    self.ind = j + 1
+                    self.simbolo = LEXEMA_COMPUESTO[par]
+                    self.tipo = tipo
+                    return tipo
+            self.ind = j
+            self.simbolo = LEXEMA_BYTE[b]
+            self.tipo = OPERADORES.get(b)     # '&' o '|' solos: None
             return self.tipo
-        if c == '|' and self.sig_caracter() == '|':
-            self.simbolo = '||'
-            self.tipo = TokenType.OP_OR
-            return self.tipo
-        
-        # Fin de la entrada
-        if c == '$':
-            self.simbolo = c
-            self.tipo = TokenType.FIN
-            return self.tipo
-        
-        # Si no es un token válido
-        self.simbolo = c
+
+        # Si no es token válido: el carácter completo (UTF-8 si b >= 0x80)
+        if b >= 0xC0:
+            while j < n and 0x80 <= datos[j] < 0xC0:
+                j += 1
+        self.ind = j
+        self.simbolo = datos[i:j].decode('utf-8', 'replace')
         self.tipo = None
         return None
     
     def terminado(self):
-        return self.ind >= len(self.fuente)
+        return self.ind >= len(self.datos)
     
     def tipo_acad(self, tipo):
         return tipo
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tablas de bytes de los `Lexico` del repositorio. Esta es la única copia:
+`Analizador léxico/main.py`, `Avances en la Construcción de tu
+Traductor/main.py` y `Gramatica del compilador/main.py` la cargan por ruta y
+solo aportan sus propios tipos de token a `tablas_operadores`.
+
+El léxico trabaja sobre bytes. Cada byte se clasifica con una tabla de 256
+entradas, sin métodos Unicode de `str` ni un `str` por carácter.
+
+Política de caracteres: letras y dígitos son solo ASCII ([A-Za-z] y
+[0-9]). Un byte >= 0x80 no es letra, dígito ni espacio. El carácter UTF-8
+completo que empieza ahí se devuelve como símbolo inválido (tipo None), así
+que 'año' o 'x²' son un error léxico en la 'ñ' o en el '²'.
+"""
+
+C_INVALIDO, C_ESPACIO, C_LETRA, C_DIGITO, C_OPERADOR = range(5)
+
+# Caracteres con los que empieza un operador
+CARACTERES_OPERADOR = '+-*/;,(){}=!<>&|$'
+
+CLASE_BYTE = bytearray(256)
+for _b in range(128):
+    _c = chr(_b)
+    if _c.isspace():
+        CLASE_BYTE[_b] = C_ESPACIO
+    elif _c.isalpha():
+        CLASE_BYTE[_b] = C_LETRA
+    elif _c.isdigit():
+        CLASE_BYTE[_b] = C_DIGITO
+    elif _c in CARACTERES_OPERADOR:
+        CLASE_BYTE[_b] = C_OPERADOR
+CLASE_BYTE = bytes(CLASE_BYTE)
+
+# Lexemas de un byte ya construidos
+LEXEMA_BYTE = [chr(_b) for _b in range(128)]
+PUNTO = ord('.')
+
+
+def tablas_operadores(tipos):
+    """
+    Convierte {lexema: tipo} (operadores de uno y dos caracteres) en
+    (OPERADORES, COMPUESTOS, LEXEMA_COMPUESTO):
+
+      OPERADORES        byte -> tipo de los operadores de un carácter
+      COMPUESTOS        (primer byte, segundo byte) -> tipo
+      LEXEMA_COMPUESTO  (primer byte, segundo byte) -> lexema
+
+    Lanza ValueError si un operador no empieza con un byte de clase
+    C_OPERADOR, porque el Lexico nunca lo alcanzaría.
+    """
+    operadores, compuestos = {}, {}
+    for lexema, tipo in tipos.items():
+        if not 1 <= len(lexema) <= 2 or lexema[0] not in CARACTERES_OPERADOR:
+            raise ValueError(f"Operador inválido: {lexema!r}")
+        if len(lexema) == 1:
+            operadores[ord(lexema)] = tipo
+        else:
+            compuestos[(ord(lexema[0]), ord(lexema[1]))] = tipo
+    lexema_compuesto = {par: chr(par[0]) + chr(par[1]) for par in compuestos}
+    return operadores, compuestos, lexema_compuesto
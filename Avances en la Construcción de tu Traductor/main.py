@@ -1,8 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 import re
+import runpy
 import sys
+from array import array
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+
+
+# importar(nombre, ruta): carga por ruta con un nombre único
+importar = runpy.run_path(os.path.join(_AQUI, '..', 'Analizador Sintáctico', 'cargador.py'))['importar']
+
 
 # ====================================================
 # ANALIZADOR LÉXICO
@@ -44,184 +54,134 @@ class TokenType:
         "void": TIPO
     }
 
+# El léxico trabaja sobre bytes, con las tablas de 256 entradas y la
+# política de caracteres de `Analizador léxico/tablas_bytes.py`; aquí solo
+# se dan los tipos de token de cada operador.
+tablas_bytes = importar('analizador_lexico_tablas_bytes',
+                        os.path.join(_AQUI, '..', 'Analizador léxico', 'tablas_bytes.py'))
+C_INVALIDO, C_ESPACIO, C_LETRA = tablas_bytes.C_INVALIDO, tablas_bytes.C_ESPACIO, tablas_bytes.C_LETRA
+C_DIGITO, C_OPERADOR = tablas_bytes.C_DIGITO, tablas_bytes.C_OPERADOR
+CLASE_BYTE, LEXEMA_BYTE, PUNTO = tablas_bytes.CLASE_BYTE, tablas_bytes.LEXEMA_BYTE, tablas_bytes.PUNTO
+OPERADORES, COMPUESTOS, LEXEMA_COMPUESTO = tablas_bytes.tablas_operadores({
+    '+': TokenType.OP_SUMA, '-': TokenType.OP_SUMA, '*': TokenType.OP_MUL, '/': TokenType.OP_MUL,
+    ';': TokenType.PUNTO_Y_COMA, ',': TokenType.COMA,
+    '(': TokenType.PARENTESIS_ABRE, ')': TokenType.PARENTESIS_CIERRA, '{': TokenType.LLAVE_ABRE, '}': TokenType.LLAVE_CIERRA,
+    '=': TokenType.ASIGNACION, '!': TokenType.OP_NOT, '<': TokenType.OP_RELAC, '>': TokenType.OP_RELAC, '$': TokenType.FIN,
+    '==': TokenType.OP_IGUALDAD, '!=': TokenType.OP_IGUALDAD, '<=': TokenType.OP_RELAC, '>=': TokenType.OP_RELAC,
+    '&&': TokenType.OP_AND, '||': TokenType.OP_OR,
+})
+
 class Lexico:
     def __init__(self, fuente=""):
-        self.fuente = fuente
-        self.ind = 0
+        self.entrada(fuente)
         self.simbolo = ""
         self.tipo = None
 
     def entrada(self, fuente):
+        """`fuente` puede ser str (se codifica en UTF-8), bytes o memoryview."""
         self.fuente = fuente
+        self.datos = fuente.encode('utf-8') if isinstance(fuente, str) else bytes(fuente)
         self.ind = 0
 
     def sig_caracter(self):
         if self.terminado():
             return '$'
-        c = self.fuente[self.ind]
+        b = self.datos[self.ind]
         self.ind += 1
-        return c
+        return LEXEMA_BYTE[b] if b < 128 else chr(b)
 
     def retroceso(self):
         if self.ind > 0:
             self.ind -= 1
 
     def sig_simbolo(self):
-        self.simbolo = ""
-        c = self.sig_caracter()
+        datos, clase = self.datos, CLASE_BYTE
+        n, i = len(datos), self.ind
 
         # Ignorar espacios en blanco
-        while c.isspace():
-            c = self.sig_caracter()
+        while i < n and clase[datos[i]] == C_ESPACIO:
+            i += 1
+        # Al terminar la entrada se devuelve el fin '$'
+        if i >= n:
+            self.ind = i
+            self.simbolo = '$'
+            self.tipo = TokenType.FIN
+            return self.tipo
+
+        b = datos[i]
+        c = clase[b]
+        j = i + 1
 
         # Identificadores o palabras reservadas
-        if c.isalpha():
-            self.simbolo += c
-            while not self.terminado():
-                c = self.sig_caracter()
-                if c.isalnum():
-                    self.simbolo += c
-                else:
-                    self.retroceso()
-                    break
+        if c == C_LETRA:
+            while j < n and C_LETRA <= clase[datos[j]] <= C_DIGITO:
+                j += 1
+            self.ind = j
+            self.simbolo = datos[i:j].decode('ascii')
             self.tipo = TokenType.PALABRAS_RESERVADAS.get(self.simbolo, TokenType.IDENTIFICADOR)
             return self.tipo
 
         # Números enteros y reales
-        elif c.isdigit():
-            self.simbolo += c
-            while not self.terminado():
-                c = self.sig_caracter()
-                if c.isdigit():
-                    self.simbolo += c
-                elif c == '.':
-                    self.simbolo += c
-                    c = self.sig_caracter()
-                    if c.isdigit():
-                        self.simbolo += c
-                        while not self.terminado():
-                            c = self.sig_caracter()
-                            if c.isdigit():
-                                self.simbolo += c
-                            else:
-                                self.retroceso()
-                                break
-                        self.tipo = TokenType.REAL
-                        return self.tipo
-                    else:
-                        self.retroceso()
-                        # Reportar error léxico: punto sin dígito
-                        print(f"Error léxico: Se encontró un punto sin dígito tras el número en '{self.simbolo}'")
-                        return None
-                else:
-                    self.retroceso()
-                    break
+        if c == C_DIGITO:
+            while j < n and clase[datos[j]] == C_DIGITO:
+                j += 1
             self.tipo = TokenType.ENTERO
-            return self.tipo
-
-        # Operadores y símbolos especiales
-        operadores = {
-            '+': TokenType.OP_SUMA, '-': TokenType.OP_SUMA,
-            '*': TokenType.OP_MUL, '/': TokenType.OP_MUL,
-            '=': TokenType.ASIGNACION, ';': TokenType.PUNTO_Y_COMA,
-            ',': TokenType.COMA, '(': TokenType.PARENTESIS_ABRE, ')': TokenType.PARENTESIS_CIERRA,
-            '{': TokenType.LLAVE_ABRE, '}': TokenType.LLAVE_CIERRA,
-            '!': TokenType.OP_NOT, '<': TokenType.OP_RELAC, '>': TokenType.OP_RELAC
-        }
-        if c in operadores:
-            self.simbolo = c
-            if c in ('<', '>', '!', '='):
-                c2 = self.sig_caracter()
-                if c2 == '=':
-                    self.simbolo += c2
-                    self.tipo = TokenType.OP_IGUALDAD if c in ('!', '=') else TokenType.OP_RELAC
-                    return self.tipo
+            if j < n and datos[j] == PUNTO:
+                j += 1
+                if j < n and clase[datos[j]] == C_DIGITO:
+                    j += 1
+                    while j < n and clase[datos[j]] == C_DIGITO:
+                        j += 1
+                    self.tipo = TokenType.REAL
                 else:
-                    self.retroceso()
-            self.tipo = operadores[c]
+                    # Error léxico: punto sin dígito
+                    self.ind = j
+                    self.simbolo = datos[i:j].decode('ascii')
+                    print(f"Error léxico: Se encontró un punto sin dígito tras el número en '{self.simbolo}'")
+                    self.tipo = None
+                    return None
+            self.ind = j
+            self.simbolo = datos[i:j].decode('ascii')
             return self.tipo
 
-        # Operadores lógicos
-        if c == '&' and self.sig_caracter() == '&':
-            self.simbolo = '&&'
-            self.tipo = TokenType.OP_AND
-            return self.tipo
-        if c == '|' and self.sig_caracter() == '|':
-            self.simbolo = '||'
-            self.tipo = TokenType.OP_OR
-            return self.tipo
-
-        # Fin de la entrada
-        if c == '$':
-            self.simbolo = c
-            self.tipo = TokenType.FIN
+        # Operadores y símbolos especiales (==, !=, <=, >=, && y || primero).
+        # El segundo carácter solo se mira si existe: al final de la entrada
+        # no se retrocede, así que 'a <' termina.
+        if c == C_OPERADOR:
+            if j < n:
+                par = (b, datos[j])
+                tipo = COMPUESTOS.get(par)
+                if tipo is not None:
+                    self.ind = j + 1
+                    self.simbolo = LEXEMA_COMPUESTO[par]
+                    self.tipo = tipo
+                    return tipo
+            self.ind = j
+            self.simbolo = LEXEMA_BYTE[b]
+            self.tipo = OPERADORES.get(b)     # '&' o '|' solos: None
+            if self.tipo is None:
+                print(f"Error léxico: Carácter no válido '{self.simbolo}'")
             return self.tipo
 
+        # Si no es token válido: el carácter completo (UTF-8 si b >= 0x80)
+        if b >= 0xC0:
+            while j < n and 0x80 <= datos[j] < 0xC0:
+                j += 1
+        self.ind = j
+        self.simbolo = datos[i:j].decode('utf-8', 'replace')
         # Token no válido: Reportar error léxico
-        print(f"Error léxico: Carácter no válido '{c}'")
-        self.simbolo = c
+        print(f"Error léxico: Carácter no válido '{self.simbolo}'")
         self.tipo = None
         return None
 
     def terminado(self):
-        return self.ind >= len(self.fuente)
+        return self.ind >= len(self.datos)
 
 
 # ====================================================
 # ANALIZADOR SINTÁCTICO (Parser LR)
 # ====================================================
 
-class ElementoPila:
-    def muestra(self):
-        raise NotImplementedError("Debe implementarse en la subclase.")
-
-class Terminal(ElementoPila):
-    def __init__(self, tipo, lexema):
-        self.tipo = tipo
-        self.lexema = lexema
-    def muestra(self):
-        print(f"Terminal({self.lexema})", end=' ')
-    def get_tipo(self):
-        return self.tipo
-
-class NoTerminal(ElementoPila):
-    def __init__(self, simbolo, nombre):
-        self.simbolo = simbolo
-        self.nombre = nombre
-    def muestra(self):
-        print(f"NoTerminal({self.nombre})", end=' ')
-    def get_simbolo(self):
-        return self.simbolo
-
-class Estado(ElementoPila):
-    def __init__(self, numero):
-        self.numero = numero
-    def muestra(self):
-        print(f"Estado({self.numero})", end=' ')
-    def get_numero(self):
-        return self.numero
-
-class Pila:
-    def __init__(self):
-        self.lista = []
-    def push(self, elemento):
-        self.lista.append(elemento)
-    def pop(self):
-        if not self.empty():
-            return self.lista.pop()
-        return None
-    def top(self):
-        if not self.empty():
-            return self.lista[-1]
-        return None
-    def empty(self):
-        return len(self.lista) == 0
-    def muestra(self):
-        print("Contenido de la pila (base -> tope):")
-        for elem in self.lista:
-            elem.muestra()
-        print("\n")
-
 reglas = [
     (3, 3, "E"),  # Regla 0: E -> id + E
     (3, 1, "E"),  # Regla 1: E -> id
@@ -239,6 +199,17 @@ tabla = {
     (4, 2): ('r', 0),   # En estado 4, con token '$' (2): reduce por regla 0.
 }
 
+# tabla_lr.py vive en 'Analizador Sintáctico' y lo comparten ambos main.py.
+# Convención de enteros: n > 0 shift o goto, -1 aceptar, n < -1 reducir por
+# reglas[-n - 2] y 0 error (ver tabla_lr.py).
+tabla_lr = importar('analizador_sintactico_tabla_lr',
+                     os.path.join(_AQUI, '..', 'Analizador Sintáctico', 'tabla_lr.py'))
+ACEPTAR, ERROR = tabla_lr.ACEPTAR, tabla_lr.ERROR
+compilar_tabla, decodificar = tabla_lr.compilar_tabla, tabla_lr.decodificar
+leer_lr_file, cargar_tabla = tabla_lr.leer_lr_file, tabla_lr.cargar_tabla
+
+reglas, filas = cargar_tabla(tabla, reglas)
+
 def lexico_rapido(cadena):
     tokens = []
     partes = re.split(r'\s+', cadena.strip())
@@ -251,62 +222,97 @@ def lexico_rapido(cadena):
             tokens.append((0, p))  # Todo lo demás se considera 'id'
     return tokens
 
-def analizar(tokens):
-    stack = Pila()
-    stack.push(Estado(0))
+def analizar(tokens, traza=None, valores=None, reglas=reglas, filas=filas):
+    """
+    Parser LR con la pila de estados en un array('i') y la tabla en filas de
+    enteros (ver compilar_tabla): el ciclo no construye tuplas ni compara
+    cadenas. `reglas` y `filas` deben venir de cargar_tabla(), que las valida.
+
+    :param traza: callable opcional traza(estados, tipo, lexema, accion),
+                  llamado antes de aplicar cada acción (ver TrazaPila).
+    :param valores: lista opcional que se usa como pila de valores
+                    semánticos: un shift apila el lexema y una reducción
+                    reemplaza sus `rhs_len` valores por (nombre, hijos).
+                    Al aceptar, valores[-1] es la raíz del árbol.
+    """
+    estados = array('i', [0])
+    num_cols = len(filas[0])
+    n = len(tokens)
     i = 0
     while True:
-        top_elem = stack.top()
-        if not top_elem:
-            print("Error: la pila está vacía.")
-            return False
-        if not isinstance(top_elem, Estado):
-            print("Error: el tope de la pila no es un Estado.")
-            return False
-        estado_actual = top_elem.get_numero()
-        if i >= len(tokens):
+        if i >= n:
             print("No hay más tokens, se esperaba '$'.")
             return False
         tipo_token, lexema_token = tokens[i]
-        if (estado_actual, tipo_token) not in tabla:
+        estado_actual = estados[-1]
+        try:
+            accion = filas[estado_actual][tipo_token] if 0 <= tipo_token < num_cols else ERROR
+        except TypeError:
+            accion = ERROR      # tipo que no es entero (None, ...)
+        if accion == ERROR:
             print(f"Error: no hay acción para estado {estado_actual} con token '{lexema_token}'")
             return False
-        accion = tabla[(estado_actual, tipo_token)]
-        stack.muestra()
-        print(f"Token actual: {lexema_token} (tipo={tipo_token})")
-        print(f"Acción: {accion}\n")
-        if accion[0] == 's':
-            estado_destino = accion[1]
-            stack.push(Terminal(tipo_token, lexema_token))
-            stack.push(Estado(estado_destino))
+        if traza is not None:
+            traza(estados, tipo_token, lexema_token, accion)
+
+        if accion > 0:
+            estados.append(accion)
+            if valores is not None:
+                valores.append(lexema_token)
             i += 1
-        elif accion[0] == 'r':
-            num_regla = accion[1]
-            lhs, rhs_len, lhs_nombre = reglas[num_regla]
-            for _ in range(rhs_len):
-                stack.pop()  # Quitar estado
-                stack.pop()  # Quitar símbolo
-            top_state = stack.top()
-            if not isinstance(top_state, Estado):
-                print("Error: tras la reducción el tope no es un Estado.")
+
+        elif accion < ACEPTAR:
+            lhs, rhs_len, lhs_nombre = reglas[-accion - 2]
+            if rhs_len >= len(estados):
+                print("Error: pila insuficiente para reducción.")
                 return False
-            nuevo_estado = top_state.get_numero()
-            if (nuevo_estado, lhs) not in tabla:
+            hijos = []
+            if rhs_len:
+                del estados[-rhs_len:]
+                if valores is not None:
+                    hijos = valores[-rhs_len:]
+                    del valores[-rhs_len:]
+            nuevo_estado = estados[-1]
+            goto = filas[nuevo_estado][lhs]
+            if goto <= 0:
                 print(f"Error: no hay goto para estado {nuevo_estado} con símbolo {lhs_nombre}")
                 return False
-            goto_accion = tabla[(nuevo_estado, lhs)]
-            if goto_accion[0] != 'g':
-                print("Error: se esperaba 'g' tras una reducción.")
-                return False
-            estado_destino = goto_accion[1]
-            stack.push(NoTerminal(lhs, lhs_nombre))
-            stack.push(Estado(estado_destino))
-        elif accion[0] == 'acc':
+            estados.append(goto)
+            if valores is not None:
+                valores.append((lhs_nombre, hijos))
+
+        else:
             print("¡Cadena aceptada correctamente!\n")
             return True
-        else:
-            print(f"Acción desconocida: {accion}")
-            return False
+
+
+class TrazaPila:
+    """
+    Traza para `analizar`: imprime la pila en cada paso con el formato de
+    la antigua pila de objetos (Estado/Terminal/NoTerminal). Reconstruye los
+    símbolos a partir de las acciones, así que solo cuesta cuando se usa.
+    """
+    def __init__(self, reglas=reglas):
+        self.reglas = reglas
+        self.simbolos = []
+
+    def __call__(self, estados, tipo, lexema, accion):
+        partes = [f"Estado({estados[0]})"]
+        for simbolo, estado in zip(self.simbolos, estados[1:]):
+            partes.append(simbolo)
+            partes.append(f"Estado({estado})")
+        print("Contenido de la pila (base -> tope):")
+        print(' '.join(partes), end=' ')
+        print("\n")
+        print(f"Token actual: {lexema} (tipo={tipo})")
+        print(f"Acción: {decodificar(accion)}\n")
+
+        if accion > 0:
+            self.simbolos.append(f"Terminal({lexema})")
+        elif accion < ACEPTAR:
+            _, rhs_len, lhs_nombre = self.reglas[-accion - 2]
+            del self.simbolos[len(self.simbolos) - rhs_len:]
+            self.simbolos.append(f"NoTerminal({lhs_nombre})")
 
 def main():
     if len(sys.argv) > 1:
@@ -335,7 +341,7 @@ def main():
     print("")
     # Uso del parser LR:
     print("=== Análisis sintáctico LR ===")
-    resultado = analizar(tokens)
+    resultado = analizar(tokens, traza=TrazaPila())
     print(f"Resultado final: {'ACEPTADO' if resultado else 'RECHAZADO'}")
 
 if __name__ == "__main__":
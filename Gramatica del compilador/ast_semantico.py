@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Acciones semánticas para las reglas de compilador.lr.
+
+Cada regla (índice en `rules`, 0 = R1 del archivo) tiene un constructor que
+recibe los valores de su lado derecho y devuelve un nodo de las clases de
+`analizador_semantico/lexer_parser.py`. Con `parser_lr_ast` un solo análisis
+LR produce un `ProgramNode` listo para `validate_types()`.
+
+`tokenizar` entrega cada lexema como `Lexema`, un `str` con el offset del
+token en `pos`. `parser_lr` y el bosque de glr.py lo pasan tal cual a las
+acciones, que se lo dan a los nodos (el del nombre, del operador o de la
+palabra reservada, como el Parser de lexer_parser.py); así los errores
+semánticos salen con su prefijo `línea:columna`.
+
+`main.py` se carga por ruta como `gramatica_compilador` y los nodos son los
+de su `semantico`, sin tocar sys.path. Quien ya tenga cargada la gramática
+con otro nombre (benchmarks.cargar_modulo) se la pasa a `tokenizar`.
+
+Uso:
+    python ast_semantico.py archivo.src     # el fuente debe terminar en '$'
+"""
+
+import os
+import runpy
+import sys
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+
+
+importar = runpy.run_path(os.path.join(_AQUI, '..', 'Analizador Sintáctico', 'cargador.py'))['importar']
+gramatica = importar('gramatica_compilador', os.path.join(_AQUI, 'main.py'))
+
+# main.py ya cargó analizador_semantico/lexer_parser.py como `semantico_lexer_parser`
+from semantico_lexer_parser import (Node, SymbolTable, LineIndex, ProgramNode,  # noqa: E402
+                                    VarDeclNode, ParamNode, FuncDeclNode, AssignNode,
+                                    ReturnNode, BinaryOpNode, FuncCallNode, NumberNode,
+                                    IdentifierNode)
+
+
+class Lexema(str):
+    """Lexema de un token con su offset en el fuente (`pos`)."""
+    def __new__(cls, texto, pos):
+        lexema = super().__new__(cls, texto)
+        lexema.pos = pos
+        return lexema
+
+
+def _pos(lexema):
+    return getattr(lexema, 'pos', None)     # None si el token no trae offset
+
+
+# ====================================================
+# Nodos que la gramática de compilador.lr tiene y el analizador semántico no
+# ====================================================
+class IfNode(Node):
+    def __init__(self, cond, then_body, else_body, pos=None):
+        self.pos = pos
+        self.cond = cond
+        self.then_body = then_body
+        self.else_body = else_body
+
+    def validate_types(self):
+        self.cond.validate_types()
+        for stmt in self.then_body:
+            stmt.validate_types()
+        for stmt in self.else_body:
+            stmt.validate_types()
+
+
+class WhileNode(Node):
+    def __init__(self, cond, body, pos=None):
+        self.pos = pos
+        self.cond = cond
+        self.body = body
+
+    def validate_types(self):
+        self.cond.validate_types()
+        for stmt in self.body:
+            stmt.validate_types()
+
+
+class EmptyReturnNode(Node):
+    def __init__(self, pos=None):
+        self.pos = pos
+
+    def validate_types(self):
+        return None
+
+
+class UnaryOpNode(Node):
+    def __init__(self, op, expr, pos=None):
+        self.pos = pos
+        self.op = op
+        self.expr = expr
+
+    def validate_types(self):
+        return self.expr.validate_types()
+
+
+class StringNode(Node):
+    def __init__(self, value, pos=None):
+        self.pos = pos
+        self.value = value
+
+    def validate_types(self):
+        return 'string'
+
+
+# ====================================================
+# Constructores por regla (mismo orden que compilador.lr)
+# ====================================================
+def _vacia():
+    return []
+
+
+def _primero(x):
+    return x
+
+
+def _lista(x):
+    return [x]
+
+
+def _cabeza_cola(x, resto):
+    return [x] + resto
+
+
+def _concatenar(xs, resto):
+    return xs + resto
+
+
+def _def_var(tipo, nombre, lista, _pyc):
+    return [VarDeclNode(tipo, n, _pos(n)) for n in [nombre] + lista]
+
+
+def _parametros(tipo, nombre, resto):
+    return [ParamNode(nombre, tipo, _pos(nombre))] + resto
+
+
+def _binaria(izq, op, der):
+    return BinaryOpNode(izq, op, der, _pos(op))
+
+
+def _unaria(op, expr):
+    return UnaryOpNode(op, expr, _pos(op))
+
+
+def _numero(lexema):
+    return NumberNode(float(lexema) if '.' in lexema else int(lexema), _pos(lexema))
+
+
+ACCIONES = [
+    lambda defs: ProgramNode(defs),                              # R1  programa -> Definiciones
+    _vacia,                                                      # R2  Definiciones -> ε
+    _concatenar,                                                 # R3  Definiciones -> Definicion Definiciones
+    _primero,                                                    # R4  Definicion -> DefVar
+    _lista,                                                      # R5  Definicion -> DefFunc
+    _def_var,                                                    # R6  DefVar -> tipo id ListaVar ;
+    _vacia,                                                      # R7  ListaVar -> ε
+    lambda _coma, nombre, resto: [nombre] + resto,               # R8  ListaVar -> , id ListaVar
+    lambda tipo, nombre, _pa, params, _pc, cuerpo:
+        FuncDeclNode(tipo, nombre, params, cuerpo, _pos(nombre)),  # R9  DefFunc -> tipo id ( Parametros ) BloqFunc
+    _vacia,                                                      # R10 Parametros -> ε
+    _parametros,                                                 # R11 Parametros -> tipo id ListaParam
+    _vacia,                                                      # R12 ListaParam -> ε
+    lambda _coma, tipo, nombre, resto: _parametros(tipo, nombre, resto),  # R13 ListaParam -> , tipo id ListaParam
+    lambda _lla, locales, _llc: locales,                         # R14 BloqFunc -> { DefLocales }
+    _vacia,                                                      # R15 DefLocales -> ε
+    _concatenar,                                                 # R16 DefLocales -> DefLocal DefLocales
+    _primero,                                                    # R17 DefLocal -> DefVar
+    _lista,                                                      # R18 DefLocal -> Sentencia
+    _vacia,                                                      # R19 Sentencias -> ε
+    _cabeza_cola,                                                # R20 Sentencias -> Sentencia Sentencias
+    lambda nombre, _asig, expr, _pyc:
+        AssignNode(nombre, expr, _pos(nombre)),                  # R21 Sentencia -> id = Expresion ;
+    lambda si, _pa, cond, _pc, cuerpo, otro:
+        IfNode(cond, cuerpo, otro, _pos(si)),                    # R22 Sentencia -> if ( Expresion ) SentenciaBloque Otro
+    lambda mientras, _pa, cond, _pc, cuerpo:
+        WhileNode(cond, cuerpo, _pos(mientras)),                 # R23 Sentencia -> while ( Expresion ) Bloque
+    lambda ret, valor, _pyc:
+        ReturnNode(valor, _pos(ret)) if valor is not None
+        else EmptyReturnNode(_pos(ret)),                         # R24 Sentencia -> return ValorRegresa ;
+    lambda llamada, _pyc: llamada,                               # R25 Sentencia -> LlamadaFunc ;
+    _vacia,                                                      # R26 Otro -> ε
+    lambda _else, cuerpo: cuerpo,                                # R27 Otro -> else SentenciaBloque
+    lambda _lla, sentencias, _llc: sentencias,                   # R28 Bloque -> { Sentencias }
+    lambda: None,                                                # R29 ValorRegresa -> ε
+    _primero,                                                    # R30 ValorRegresa -> Expresion
+    _vacia,                                                      # R31 Argumentos -> ε
+    _cabeza_cola,                                                # R32 Argumentos -> Expresion ListaArgumentos
+    _vacia,                                                      # R33 ListaArgumentos -> ε
+    lambda _coma, expr, resto: [expr] + resto,                   # R34 ListaArgumentos -> , Expresion ListaArgumentos
+    _primero,                                                    # R35 Termino -> LlamadaFunc
+    lambda nombre: IdentifierNode(nombre, _pos(nombre)),         # R36 Termino -> id
+    _numero,                                                     # R37 Termino -> entero
+    _numero,                                                     # R38 Termino -> real
+    lambda cadena: StringNode(cadena, _pos(cadena)),             # R39 Termino -> cadena
+    lambda nombre, _pa, args, _pc:
+        FuncCallNode(nombre, args, _pos(nombre)),                # R40 LlamadaFunc -> id ( Argumentos )
+    _lista,                                                      # R41 SentenciaBloque -> Sentencia
+    _primero,                                                    # R42 SentenciaBloque -> Bloque
+    lambda _pa, expr, _pc: expr,                                 # R43 Expresion -> ( Expresion )
+    _unaria,                                                     # R44 Expresion -> opSuma Expresion
+    _unaria,                                                     # R45 Expresion -> opNot Expresion
+    _binaria,                                                    # R46 Expresion -> Expresion opMul Expresion
+    _binaria,                                                    # R47 Expresion -> Expresion opSuma Expresion
+    _binaria,                                                    # R48 Expresion -> Expresion opRelac Expresion
+    _binaria,                                                    # R49 Expresion -> Expresion opIgualdad Expresion
+    _binaria,                                                    # R50 Expresion -> Expresion opAnd Expresion
+    _binaria,                                                    # R51 Expresion -> Expresion opOr Expresion
+    _primero,                                                    # R52 Expresion -> Termino
+]
+
+
+def tokenizar(fuente, gram=gramatica):
+    """
+    Tokens (tipo, Lexema) con el `Lexico` del módulo `gram`. Los lexemas
+    válidos son ASCII, y el primer byte no ASCII es un token inválido que
+    corta aquí, así que los offsets en bytes del Lexico son también offsets
+    en caracteres de `fuente`.
+    """
+    lexico = gram.Lexico(fuente)
+    tokens = []
+    while not lexico.terminado():
+        t = lexico.sig_simbolo()
+        if t is None:
+            raise ValueError(f"Token no reconocido: '{lexico.simbolo}'")
+        simbolo = lexico.simbolo
+        tokens.append((t, Lexema(simbolo, lexico.ind - len(simbolo))))
+    return tokens
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Uso: python ast_semantico.py <archivo.src>")
+        sys.exit(1)
+    with open(sys.argv[1], encoding='utf-8') as f:
+        fuente = f.read()
+    lr = os.path.join(_AQUI, 'compilador.lr')
+    rules, _, _, table = gramatica.leer_lr_file(lr)
+    if len(rules) != len(ACCIONES):
+        print(f"Error: compilador.lr tiene {len(rules)} reglas y hay {len(ACCIONES)} acciones.")
+        sys.exit(1)
+
+    ast = gramatica.parser_lr_ast(tokenizar(fuente), rules, table, ACCIONES)
+    if ast is None:
+        sys.exit(1)
+    Node.tabla_simbolos = SymbolTable(LineIndex(fuente))
+    Node.ambito = ''
+    ast.validate_types()
+    for e in Node.tabla_simbolos.errors:
+        print(e)
+    if not Node.tabla_simbolos.errors:
+        print("¡Análisis semántico sin errores!")
+    sys.exit(1 if Node.tabla_simbolos.errors else 0)
+
+
+if __name__ == '__main__':
+    main()
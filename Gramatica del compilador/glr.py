@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parser GLR (pila estructurada en grafo) para tablas LR con conflictos.
+
+La tabla tiene el mismo formato que `compilador.lr` (reglas `(nt_id, lon,
+nt_name)` y una matriz de enteros), más un dict `conflictos` que para cada
+celda en conflicto da todas sus acciones. Mientras haya una sola cabeza de
+pila y la celda no tenga conflicto, se avanza como un LR normal; solo en
+las regiones ambiguas la pila se bifurca. El resultado es un bosque
+compartido y empaquetado (SPPF): un nodo por (símbolo, inicio, fin) con
+todas sus alternativas.
+
+`tabla_slr` construye tabla y conflictos a partir de una gramática escrita
+con nombres; `GRAMATICA_COMPILADOR` es la de `compilador.lr` sin
+precedencias, así que las expresiones quedan ambiguas.
+
+Uso:
+    python glr.py archivo.src     # el fuente debe terminar en '$'
+"""
+
+import gc
+import os
+import runpy
+import sys
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+
+
+importar = runpy.run_path(os.path.join(_AQUI, '..', 'Analizador Sintáctico', 'cargador.py'))['importar']
+# ast_semantico.py carga main.py como `gramatica_compilador` y define `tokenizar`
+ast_semantico = importar('ast_semantico', os.path.join(_AQUI, 'ast_semantico.py'))
+gramatica, tokenizar = ast_semantico.gramatica, ast_semantico.tokenizar
+
+
+# ====================================================
+# 1) GRAMÁTICA DE compilador.lr (mismo orden de reglas)
+# ====================================================
+TERMINALES = ['id', 'entero', 'real', 'cadena', 'tipo', 'opSuma', 'opMul', 'opRelac',
+              'opOr', 'opAnd', 'opNot', 'opIgualdad', ';', ',', '(', ')', '{', '}',
+              '=', 'if', 'while', 'return', 'else', '$']
+
+NO_TERMINALES = ['programa', 'Definiciones', 'Definicion', 'DefVar', 'ListaVar', 'DefFunc',
+                 'Parametros', 'ListaParam', 'BloqFunc', 'DefLocales', 'DefLocal',
+                 'Sentencias', 'Sentencia', 'Otro', 'Bloque', 'ValorRegresa', 'Argumentos',
+                 'ListaArgumentos', 'Termino', 'LlamadaFunc', 'SentenciaBloque', 'Expresion']
+
+GRAMATICA_COMPILADOR = [
+    ('programa', ['Definiciones']),
+    ('Definiciones', []),
+    ('Definiciones', ['Definicion', 'Definiciones']),
+    ('Definicion', ['DefVar']),
+    ('Definicion', ['DefFunc']),
+    ('DefVar', ['tipo', 'id', 'ListaVar', ';']),
+    ('ListaVar', []),
+    ('ListaVar', [',', 'id', 'ListaVar']),
+    ('DefFunc', ['tipo', 'id', '(', 'Parametros', ')', 'BloqFunc']),
+    ('Parametros', []),
+    ('Parametros', ['tipo', 'id', 'ListaParam']),
+    ('ListaParam', []),
+    ('ListaParam', [',', 'tipo', 'id', 'ListaParam']),
+    ('BloqFunc', ['{', 'DefLocales', '}']),
+    ('DefLocales', []),
+    ('DefLocales', ['DefLocal', 'DefLocales']),
+    ('DefLocal', ['DefVar']),
+    ('DefLocal', ['Sentencia']),
+    ('Sentencias', []),
+    ('Sentencias', ['Sentencia', 'Sentencias']),
+    ('Sentencia', ['id', '=', 'Expresion', ';']),
+    ('Sentencia', ['if', '(', 'Expresion', ')', 'SentenciaBloque', 'Otro']),
+    ('Sentencia', ['while', '(', 'Expresion', ')', 'Bloque']),
+    ('Sentencia', ['return', 'ValorRegresa', ';']),
+    ('Sentencia', ['LlamadaFunc', ';']),
+    ('Otro', []),
+    ('Otro', ['else', 'SentenciaBloque']),
+    ('Bloque', ['{', 'Sentencias', '}']),
+    ('ValorRegresa', []),
+    ('ValorRegresa', ['Expresion']),
+    ('Argumentos', []),
+    ('Argumentos', ['Expresion', 'ListaArgumentos']),
+    ('ListaArgumentos', []),
+    ('ListaArgumentos', [',', 'Expresion', 'ListaArgumentos']),
+    ('Termino', ['LlamadaFunc']),
+    ('Termino', ['id']),
+    ('Termino', ['entero']),
+    ('Termino', ['real']),
+    ('Termino', ['cadena']),
+    ('LlamadaFunc', ['id', '(', 'Argumentos', ')']),
+    ('SentenciaBloque', ['Sentencia']),
+    ('SentenciaBloque', ['Bloque']),
+    ('Expresion', ['(', 'Expresion', ')']),
+    ('Expresion', ['opSuma', 'Expresion']),
+    ('Expresion', ['opNot', 'Expresion']),
+    ('Expresion', ['Expresion', 'opMul', 'Expresion']),
+    ('Expresion', ['Expresion', 'opSuma', 'Expresion']),
+    ('Expresion', ['Expresion', 'opRelac', 'Expresion']),
+    ('Expresion', ['Expresion', 'opIgualdad', 'Expresion']),
+    ('Expresion', ['Expresion', 'opAnd', 'Expresion']),
+    ('Expresion', ['Expresion', 'opOr', 'Expresion']),
+    ('Expresion', ['Termino']),
+]
+
+
+# ====================================================
+# 2) CONSTRUCCIÓN DE TABLAS SLR (CON CONFLICTOS)
+# ====================================================
+def tabla_slr(gramatica, terminales, no_terminales):
+    """
+    :param gramatica: lista de (lado_izq, [símbolos del lado derecho]) por
+                      nombre; el lado izquierdo de la primera regla es el
+                      símbolo inicial.
+    :param terminales: nombres en orden de columna; el último es el fin ('$').
+    :param no_terminales: nombres en orden de columna, después de los terminales.
+    :return: (rules, table, conflictos) con la convención de `leer_lr_file`
+             (shift/goto n > 0, aceptar -1, reducir por rules[-n - 2]).
+             En cada celda con conflicto `table` guarda la primera acción
+             (el shift, si lo hay, como hace yacc) y `conflictos` la tupla
+             con todas.
+    """
+    col = {t: k for k, t in enumerate(terminales)}
+    base = len(terminales)
+    for k, nt in enumerate(no_terminales):
+        col[nt] = base + k
+    fin = col[terminales[-1]]
+    inicial = gramatica[0][0]
+    # La regla aumentada S' -> inicial va al final y no forma parte de `rules`
+    prods = [(col[izq], [col[s] for s in der]) for izq, der in gramatica]
+    aumentada = len(prods)
+    prods.append((-1, [col[inicial]]))
+    por_nt = {}
+    for r, (izq, _) in enumerate(prods):
+        por_nt.setdefault(izq, []).append(r)
+
+    # Anulables, FIRST y FOLLOW
+    anulable = set()
+    primeros = {col[nt]: set() for nt in no_terminales}
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, der in prods[:aumentada]:
+            antes = (izq in anulable, len(primeros[izq]))
+            todos = True
+            for s in der:
+                if s < base:
+                    primeros[izq].add(s)
+                    todos = False
+                    break
+                primeros[izq] |= primeros[s]
+                if s not in anulable:
+                    todos = False
+                    break
+            if todos:
+                anulable.add(izq)
+            cambio |= antes != (izq in anulable, len(primeros[izq]))
+
+    siguientes = {c: set() for c in primeros}
+    siguientes[col[inicial]].add(fin)
+    cambio = True
+    while cambio:
+        cambio = False
+        for izq, der in prods[:aumentada]:
+            for k, s in enumerate(der):
+                if s < base:
+                    continue
+                antes = len(siguientes[s])
+                resto_anulable = True
+                for t in der[k + 1:]:
+                    if t < base:
+                        siguientes[s].add(t)
+                        resto_anulable = False
+                        break
+                    siguientes[s] |= primeros[t]
+                    if t not in anulable:
+                        resto_anulable = False
+                        break
+                if resto_anulable:
+                    siguientes[s] |= siguientes[izq]
+                cambio |= antes != len(siguientes[s])
+
+    # Colección canónica LR(0); un item es (regla, punto)
+    def cerradura(items):
+        items = set(items)
+        pendientes = list(items)
+        while pendientes:
+            r, p = pendientes.pop()
+            der = prods[r][1]
+            if p < len(der) and der[p] >= base:
+                for r2 in por_nt[der[p]]:
+                    if (r2, 0) not in items:
+                        items.add((r2, 0))
+                        pendientes.append((r2, 0))
+        return items
+
+    estados = [cerradura({(aumentada, 0)})]
+    indice = {frozenset({(aumentada, 0)}): 0}
+    transiciones = []
+    k = 0
+    while k < len(estados):
+        destinos = {}
+        for r, p in sorted(estados[k]):
+            der = prods[r][1]
+            if p < len(der):
+                destinos.setdefault(der[p], set()).add((r, p + 1))
+        trans = {}
+        for s, nucleo in sorted(destinos.items()):
+            clave = frozenset(nucleo)
+            if clave not in indice:
+                indice[clave] = len(estados)
+                estados.append(cerradura(nucleo))
+            trans[s] = indice[clave]
+        transiciones.append(trans)
+        k += 1
+
+    ncols = base + len(no_terminales)
+    table = [[0] * ncols for _ in estados]
+    conflictos = {}
+
+    def poner(e, c, accion):
+        previa = table[e][c]
+        if previa == 0:
+            table[e][c] = accion
+        elif previa != accion:
+            todas = conflictos.setdefault((e, c), (previa,))
+            if accion not in todas:
+                conflictos[(e, c)] = todas + (accion,)
+
+    for e, items in enumerate(estados):
+        for s, destino in transiciones[e].items():
+            poner(e, s, destino)
+        for r, p in sorted(items):
+            izq, der = prods[r]
+            if p < len(der):
+                continue
+            if r == aumentada:
+                poner(e, fin, -1)
+            else:
+                for a in sorted(siguientes[izq]):
+                    poner(e, a, -r - 2)
+
+    rules = [(col[izq], len(der), izq) for izq, der in gramatica]
+    return rules, table, conflictos
+
+
+# ====================================================
+# 3) BOSQUE COMPARTIDO (SPPF) Y PILA EN GRAFO (GSS)
+# ====================================================
+class NodoSPPF:
+    """
+    Terminal: `alternativas` es None y `nombre` es el lexema.
+    No terminal: `alternativas` es la lista de (regla, hijos); hay más de
+    una solo donde la entrada es ambigua.
+    """
+    __slots__ = ('simbolo', 'nombre', 'inicio', 'fin', 'alternativas')
+
+    def __init__(self, simbolo, nombre, inicio, fin, alternativas=None):
+        self.simbolo = simbolo
+        self.nombre = nombre
+        self.inicio = inicio
+        self.fin = fin
+        self.alternativas = alternativas
+
+    def es_ambiguo(self):
+        return self.alternativas is not None and len(self.alternativas) > 1
+
+    def __repr__(self):
+        return f"NodoSPPF({self.nombre!r}, {self.inicio}, {self.fin})"
+
+
+class NodoGSS:
+    """Un estado de la pila en grafo; `aristas` es [(nodo_anterior, nodo_sppf)]."""
+    __slots__ = ('estado', 'nivel', 'aristas')
+
+    def __init__(self, estado, nivel):
+        self.estado = estado
+        self.nivel = nivel
+        self.aristas = []
+
+
+# ====================================================
+# 4) PARSER GLR
+# ====================================================
+def parser_glr(tokens, rules, table, conflictos=None, stats=None):
+    """
+    :param tokens: lista de tokens (tipo, lexema), como en `parser_lr`.
+    :param rules: reglas de `leer_lr_file` o `tabla_slr`.
+    :param table: tabla LR (matriz de enteros).
+    :param conflictos: dict opcional (estado, columna) -> tupla de acciones.
+    :param stats: dict opcional; recibe 'shifts', 'reductions', 'forks'
+                  (tokens procesados por el camino general) y 'max_heads'.
+    :return: la raíz del bosque (NodoSPPF del símbolo inicial) o None.
+    """
+    conflictos = conflictos or {}
+    ncols = len(table[0])
+    # Copia de la tabla con None en las celdas en conflicto: el camino
+    # determinista solo consulta una celda por paso
+    filas = [list(fila) for fila in table]
+    for estado, columna in conflictos:
+        filas[estado][columna] = None
+    desplazamientos = reducciones = bifurcaciones = 0
+    max_cabezas = 1
+
+    v = NodoGSS(0, 0)    # única cabeza mientras el análisis es determinista
+    cabezas = None       # estado -> NodoGSS cuando hay más de una
+    i = 0
+    nodos = {}           # (simbolo, inicio) -> NodoSPPF terminados en i (camino general)
+    # El bosque solo crece durante el análisis: sin pausar el GC, cada
+    # recolección recorre todos los nodos ya creados
+    reactivar_gc = gc.isenabled()
+    gc.disable()
+
+    def nodo_nt(regla, inicio, hijos):
+        nt_id, _, nt_name = rules[regla]
+        nodo = nodos.get((nt_id, inicio))
+        if nodo is None:
+            nodo = nodos[(nt_id, inicio)] = NodoSPPF(nt_id, nt_name, inicio, i, [(regla, hijos)])
+        elif (regla, hijos) not in nodo.alternativas:
+            nodo.alternativas.append((regla, hijos))
+        return nodo
+
+    try:
+        while True:
+            if i >= len(tokens):
+                print("Error: fin de tokens sin encontrar aceptación.")
+                return None
+            tipo, lexema = tokens[i]
+            if tipo < 0 or tipo >= ncols:
+                print(f"Error: token {lexema} (tipo={tipo}) fuera de rango en la tabla.")
+                return None
+
+            # ---- Camino determinista: una cabeza y una sola acción ----
+            if cabezas is None:
+                accion = filas[v.estado][tipo]
+                if accion is not None:
+                    if accion > 0:
+                        w = NodoGSS(accion, i + 1)
+                        w.aristas.append((v, NodoSPPF(tipo, lexema, i, i + 1)))
+                        v = w
+                        i += 1
+                        desplazamientos += 1
+                        continue
+                    if accion == -1:
+                        return v.aristas[0][1]
+                    if accion == 0:
+                        print(f"Error: token inesperado '{lexema}' (tipo={tipo}) en la posición {i}.")
+                        return None
+                    regla = -accion - 2
+                    nt_id, lon, nt_name = rules[regla]
+                    if lon == 1 and len(v.aristas) == 1:
+                        base, hijo = v.aristas[0]
+                        hijos, lon = (hijo,), 0
+                    else:
+                        base, hijos = v, []
+                        while lon and len(base.aristas) == 1:
+                            base, hijo = base.aristas[0]
+                            hijos.append(hijo)
+                            lon -= 1
+                        hijos = tuple(reversed(hijos))
+                    if not lon:
+                        w = NodoGSS(table[base.estado][nt_id], i)
+                        w.aristas.append((base, NodoSPPF(nt_id, nt_name, base.nivel, i, [(regla, hijos)])))
+                        v = w
+                        reducciones += 1
+                        continue
+                    # La pila se bifurca más abajo: se resuelve por el camino general
+                cabezas = {v.estado: v}
+                _registrar(v, i, nodos)
+
+            # ---- Camino general: reducir hasta el cierre y desplazar ----
+            bifurcaciones += 1
+            hechas = set()
+            # (cabeza, arista): con arista solo se recorren los caminos que
+            # empiezan por ella. Si hay aristas vacías (base en el mismo
+            # nivel), un camino desde otra cabeza también puede pasar por
+            # ella y se recorre todo de nuevo.
+            pendientes = [(u, None) for u in cabezas.values()]
+            vacias = any(b.nivel == i for u in cabezas.values() for b, _ in u.aristas)
+            while pendientes:
+                u, primera = pendientes.pop()
+                for accion in conflictos.get((u.estado, tipo), (table[u.estado][tipo],)):
+                    if accion >= -1:
+                        continue
+                    regla = -accion - 2
+                    nt_id, lon, _ = rules[regla]
+                    for camino, hijos, base in _caminos(u, lon, primera):
+                        if (regla, camino) in hechas:
+                            continue
+                        hechas.add((regla, camino))
+                        reducciones += 1
+                        nodo = nodo_nt(regla, base.nivel, hijos)
+                        vacias = vacias or base.nivel == i
+                        goto = table[base.estado][nt_id]
+                        w = cabezas.get(goto)
+                        if w is None:
+                            w = cabezas[goto] = NodoGSS(goto, i)
+                            w.aristas.append((base, nodo))
+                            pendientes.append((w, None))
+                        elif all(b is not base for b, _ in w.aristas):
+                            # Arista nueva hacia una cabeza ya procesada (las
+                            # reducciones ya hechas se saltan gracias a `hechas`)
+                            arista = (base, nodo)
+                            w.aristas.append(arista)
+                            if vacias:
+                                pendientes.extend((x, None) for x in cabezas.values())
+                            else:
+                                pendientes.append((w, arista))
+            max_cabezas = max(max_cabezas, len(cabezas))
+
+            siguientes = {}
+            terminal = NodoSPPF(tipo, lexema, i, i + 1)
+            for u in cabezas.values():
+                for accion in conflictos.get((u.estado, tipo), (table[u.estado][tipo],)):
+                    if accion == -1:
+                        return u.aristas[0][1]
+                    if accion > 0:
+                        w = siguientes.get(accion)
+                        if w is None:
+                            w = siguientes[accion] = NodoGSS(accion, i + 1)
+                            desplazamientos += 1
+                        w.aristas.append((u, terminal))
+            if not siguientes:
+                print(f"Error: token inesperado '{lexema}' (tipo={tipo}) en la posición {i}.")
+                return None
+            nodos = {}
+            i += 1
+            if len(siguientes) == 1:
+                (v,) = siguientes.values()
+                cabezas = None
+            else:
+                cabezas = siguientes
+    finally:
+        if reactivar_gc:
+            gc.enable()
+        if stats is not None:
+            stats['shifts'] = stats.get('shifts', 0) + desplazamientos
+            stats['reductions'] = stats.get('reductions', 0) + reducciones
+            stats['forks'] = stats.get('forks', 0) + bifurcaciones
+            stats['max_heads'] = max(stats.get('max_heads', 0), max_cabezas)
+
+
+def _registrar(v, i, nodos):
+    """
+    Al pasar al camino general, indexa los nodos que el camino determinista
+    creó en la posición `i`, para que las reducciones nuevas los compartan.
+    """
+    pila, bosque, vistos = [v], [], set()
+    while pila:
+        u = pila.pop()
+        if u.nivel != i or id(u) in vistos:
+            continue
+        vistos.add(id(u))
+        for anterior, hijo in u.aristas:
+            pila.append(anterior)
+            bosque.append(hijo)
+    while bosque:
+        nodo = bosque.pop()
+        if nodo.alternativas is None or nodo.fin != i or (nodo.simbolo, nodo.inicio) in nodos:
+            continue
+        nodos[(nodo.simbolo, nodo.inicio)] = nodo
+        for _, hijos in nodo.alternativas:
+            bosque.extend(hijos)
+
+
+def _caminos(v, lon, primera=None):
+    """
+    Caminos de `lon` aristas desde `v`: (nodos del camino, hijos, base).
+    Con `primera` solo los que empiezan por esa arista.
+    """
+    if lon == 0:
+        if primera is None:
+            yield (v,), (), v
+        return
+    for anterior, hijo in (v.aristas if primera is None else (primera,)):
+        for camino, hijos, base in _caminos(anterior, lon - 1):
+            yield (v,) + camino, hijos + (hijo,), base
+
+
+# ====================================================
+# 5) RECORRIDOS DEL BOSQUE
+# ====================================================
+def contar_arboles(raiz):
+    """Número de árboles de derivación distintos que representa el bosque."""
+    memo = {}
+
+    def contar(nodo):
+        if nodo.alternativas is None:
+            return 1
+        clave = id(nodo)
+        if clave in memo:
+            return memo[clave]
+        memo[clave] = 0    # un ciclo (gramática cíclica) no suma árboles finitos
+        total = 0
+        for _, hijos in nodo.alternativas:
+            n = 1
+            for h in hijos:
+                n *= contar(h)
+            total += n
+        memo[clave] = total
+        return total
+
+    return contar(raiz)
+
+
+def nodos_ambiguos(raiz):
+    """Nodos del bosque con más de una alternativa, en orden de aparición."""
+    vistos, salida, pendientes = set(), [], [raiz]
+    while pendientes:
+        nodo = pendientes.pop()
+        if nodo.alternativas is None or id(nodo) in vistos:
+            continue
+        vistos.add(id(nodo))
+        if len(nodo.alternativas) > 1:
+            salida.append(nodo)
+        for _, hijos in nodo.alternativas:
+            pendientes.extend(hijos)
+    salida.sort(key=lambda n: (n.inicio, -n.fin))
+    return salida
+
+
+def extraer_arbol(raiz, acciones=None, elegir=None):
+    """
+    Un solo árbol del bosque. `elegir(nodo)` da el índice de la alternativa
+    en los nodos ambiguos (por defecto la primera). Con `acciones` (las de
+    `parser_lr`) cada regla construye su valor; sin ellas se devuelven
+    tuplas (nt_name, hijos).
+    """
+    if isinstance(acciones, dict):
+        acciones = [acciones.get(k) for k in range(max(acciones) + 1)]
+
+    def construir(nodo):
+        if nodo.alternativas is None:
+            return nodo.nombre
+        k = elegir(nodo) if elegir and len(nodo.alternativas) > 1 else 0
+        regla, hijos = nodo.alternativas[k]
+        valores = [construir(h) for h in hijos]
+        constructor = acciones[regla] if acciones and regla < len(acciones) else None
+        return constructor(*valores) if constructor else (nodo.nombre, valores)
+
+    return construir(raiz)
+
+
+# ====================================================
+# 6) MAIN
+# ====================================================
+def main():
+    if len(sys.argv) != 2:
+        print("Uso: python glr.py <archivo.src>")
+        sys.exit(1)
+    with open(sys.argv[1], encoding='utf-8') as f:
+        tokens = tokenizar(f.read())
+
+    rules_lr = gramatica.leer_lr_file(os.path.join(_AQUI, 'compilador.lr'))[0]
+    rules, table, conflictos = tabla_slr(GRAMATICA_COMPILADOR, TERMINALES, NO_TERMINALES)
+    if rules != rules_lr:
+        print("Aviso: las reglas de GRAMATICA_COMPILADOR no coinciden con compilador.lr")
+    print(f"Tabla SLR: {len(table)} estados, {len(conflictos)} celdas en conflicto")
+
+    stats = {}
+    raiz = parser_glr(tokens, rules, table, conflictos, stats)
+    print(f"Estadísticas: {stats}")
+    if raiz is None:
+        print("Resultado final: RECHAZADO")
+        sys.exit(1)
+    ambiguos = nodos_ambiguos(raiz)
+    print(f"Resultado final: ACEPTADO ({contar_arboles(raiz)} árboles, {len(ambiguos)} nodos ambiguos)")
+    for nodo in ambiguos[:10]:
+        texto = ' '.join(lex for _, lex in tokens[nodo.inicio:nodo.fin])
+        print(f"  {nodo.nombre} [{nodo.inicio}, {nodo.fin}): {len(nodo.alternativas)} alternativas: {texto}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import io
+import os
 import re
+import runpy
+import sys
+from contextlib import redirect_stdout
+
+_AQUI = os.path.dirname(os.path.abspath(__file__))
+
+
+# importar(nombre, ruta): carga por ruta con un nombre único
+importar = runpy.run_path(os.path.join(_AQUI, '..', 'Analizador Sintáctico', 'cargador.py'))['importar']
+
+
+# Nodos, tabla de símbolos y Profiler del analizador semántico
+semantico = importar('semantico_lexer_parser',
+                     os.path.join(_AQUI, '..', 'analizador_semantico', 'lexer_parser.py'))
 
 # ====================================================
 # 1) DEFINICIÓN DE LOS TOKENS SEGÚN compilador.inf
@@ -45,138 +61,118 @@ class TokenType:
 # ====================================================
 # 2) ANALIZADOR LÉXICO
 # ====================================================
+# El léxico trabaja sobre bytes, con las tablas de 256 entradas y la
+# política de caracteres de `Analizador léxico/tablas_bytes.py`; aquí solo
+# se dan los tipos de token de cada operador.
+tablas_bytes = importar('analizador_lexico_tablas_bytes',
+                        os.path.join(_AQUI, '..', 'Analizador léxico', 'tablas_bytes.py'))
+C_INVALIDO, C_ESPACIO, C_LETRA = tablas_bytes.C_INVALIDO, tablas_bytes.C_ESPACIO, tablas_bytes.C_LETRA
+C_DIGITO, C_OPERADOR = tablas_bytes.C_DIGITO, tablas_bytes.C_OPERADOR
+CLASE_BYTE, LEXEMA_BYTE, PUNTO = tablas_bytes.CLASE_BYTE, tablas_bytes.LEXEMA_BYTE, tablas_bytes.PUNTO
+OPERADORES, COMPUESTOS, LEXEMA_COMPUESTO = tablas_bytes.tablas_operadores({
+    '+': TokenType.opSuma, '-': TokenType.opSuma, '*': TokenType.opMul, '/': TokenType.opMul,
+    ';': TokenType.PYC, ',': TokenType.COMA,
+    '(': TokenType.PA, ')': TokenType.PC, '{': TokenType.LLA, '}': TokenType.LLC,
+    '=': TokenType.ASIG, '!': TokenType.opNot, '<': TokenType.opRelac, '>': TokenType.opRelac, '$': TokenType.FIN,
+    '==': TokenType.opIgualdad, '!=': TokenType.opIgualdad, '<=': TokenType.opRelac, '>=': TokenType.opRelac,
+    '&&': TokenType.opAnd, '||': TokenType.opOr,
+})
+
+
 class Lexico:
     def __init__(self, fuente=""):
-        self.fuente = fuente
-        self.ind = 0
+        self.entrada(fuente)
         self.simbolo = ""
         self.tipo = None
 
     def entrada(self, fuente):
+        """`fuente` puede ser str (se codifica en UTF-8), bytes o memoryview."""
         self.fuente = fuente
+        self.datos = fuente.encode('utf-8') if isinstance(fuente, str) else bytes(fuente)
         self.ind = 0
 
     def sig_caracter(self):
         if self.terminado():
             return '$'
-        c = self.fuente[self.ind]
+        b = self.datos[self.ind]
         self.ind += 1
-        return c
+        return LEXEMA_BYTE[b] if b < 128 else chr(b)
 
     def retroceso(self):
         if self.ind > 0:
             self.ind -= 1
 
     def sig_simbolo(self):
-        self.simbolo = ""
-        c = self.sig_caracter()
+        datos, clase = self.datos, CLASE_BYTE
+        n, i = len(datos), self.ind
 
         # Ignorar espacios en blanco
-        while c.isspace():
-            c = self.sig_caracter()
+        while i < n and clase[datos[i]] == C_ESPACIO:
+            i += 1
+        # Al terminar la entrada se devuelve el fin '$'
+        if i >= n:
+            self.ind = i
+            self.simbolo = '$'
+            self.tipo = TokenType.FIN
+            return self.tipo
+
+        b = datos[i]
+        c = clase[b]
+        j = i + 1
 
         # Identificadores o palabras reservadas
-        if c.isalpha():
-            self.simbolo += c
-            while not self.terminado():
-                c = self.sig_caracter()
-                if c.isalnum():
-                    self.simbolo += c
-                else:
-                    self.retroceso()
-                    break
+        if c == C_LETRA:
+            while j < n and C_LETRA <= clase[datos[j]] <= C_DIGITO:
+                j += 1
+            self.ind = j
+            self.simbolo = datos[i:j].decode('ascii')
             self.tipo = TokenType.PALABRAS_RESERVADAS.get(self.simbolo, TokenType.identificador)
             return self.tipo
 
         # Números enteros y reales
-        elif c.isdigit():
-            self.simbolo += c
-            while not self.terminado():
-                c = self.sig_caracter()
-                if c.isdigit():
-                    self.simbolo += c
-                elif c == '.':
-                    self.simbolo += c
-                    c = self.sig_caracter()
-                    if c.isdigit():
-                        self.simbolo += c
-                        while not self.terminado():
-                            c = self.sig_caracter()
-                            if c.isdigit():
-                                self.simbolo += c
-                            else:
-                                self.retroceso()
-                                break
-                        self.tipo = TokenType.real
-                        return self.tipo
-                    else:
-                        self.retroceso()
-                        break
-                else:
-                    self.retroceso()
-                    break
+        if c == C_DIGITO:
+            while j < n and clase[datos[j]] == C_DIGITO:
+                j += 1
             self.tipo = TokenType.entero
+            if j < n and datos[j] == PUNTO:
+                j += 1
+                if j < n and clase[datos[j]] == C_DIGITO:
+                    j += 1
+                    while j < n and clase[datos[j]] == C_DIGITO:
+                        j += 1
+                    self.tipo = TokenType.real
+                # Sin dígito tras el punto queda un entero con el punto
+                # incluido ('12.'), como en la versión por caracteres
+            self.ind = j
+            self.simbolo = datos[i:j].decode('ascii')
             return self.tipo
 
-        # Operadores y símbolos especiales
-        # Se asume que cada operador es de un solo carácter (salvo para los compuestos, que se gestionan a continuación)
-        operadores = {
-            '+': TokenType.opSuma, '-': TokenType.opSuma,
-            '*': TokenType.opMul, '/': TokenType.opMul,
-            ';': TokenType.PYC, ',': TokenType.COMA,
-            '(': TokenType.PA, ')': TokenType.PC,
-            '{': TokenType.LLA, '}': TokenType.LLC,
-            '=': TokenType.ASIG,
-            '!': TokenType.opNot, '<': TokenType.opRelac, '>': TokenType.opRelac
-        }
-        if c in operadores:
-            self.simbolo = c
-            # Para compuestos: ==, !=, <=, >=
-            if c in ('<', '>', '!', '='):
-                c2 = self.sig_caracter()
-                if c2 == '=':
-                    self.simbolo += c2
-                    if self.simbolo in ('==', '!='):
-                        self.tipo = TokenType.opIgualdad
-                    else:
-                        self.tipo = TokenType.opRelac
-                    return self.tipo
-                else:
-                    self.retroceso()
-            self.tipo = operadores[c]
+        # Operadores y símbolos especiales (==, !=, <=, >=, && y || primero)
+        if c == C_OPERADOR:
+            if j < n:
+                par = (b, datos[j])
+                tipo = COMPUESTOS.get(par)
+                if tipo is not None:
+                    self.ind = j + 1
+                    self.simbolo = LEXEMA_COMPUESTO[par]
+                    self.tipo = tipo
+                    return tipo
+            self.ind = j
+            self.simbolo = LEXEMA_BYTE[b]
+            self.tipo = OPERADORES.get(b)     # '&' o '|' solos: None
             return self.tipo
 
-        # Operadores lógicos && y ||
-        if c == '&':
-            c2 = self.sig_caracter()
-            if c2 == '&':
-                self.simbolo = '&&'
-                self.tipo = TokenType.opAnd
-                return self.tipo
-            else:
-                self.retroceso()
-        if c == '|':
-            c2 = self.sig_caracter()
-            if c2 == '|':
-                self.simbolo = '||'
-                self.tipo = TokenType.opOr
-                return self.tipo
-            else:
-                self.retroceso()
-
-        # Fin de la entrada
-        if c == '$':
-            self.simbolo = c
-            self.tipo = TokenType.FIN
-            return self.tipo
-
-        # Si no es token válido
-        self.simbolo = c
+        # Si no es token válido: el carácter completo (UTF-8 si b >= 0x80)
+        if b >= 0xC0:
+            while j < n and 0x80 <= datos[j] < 0xC0:
+                j += 1
+        self.ind = j
+        self.simbolo = datos[i:j].decode('utf-8', 'replace')
         self.tipo = None
         return None
 
     def terminado(self):
-        return self.ind >= len(self.fuente)
+        return self.ind >= len(self.datos)
 
 
 # ====================================================
@@ -226,85 +222,134 @@ def leer_lr_file(filename):
 # ====================================================
 # 4) PARSER LR (PILA DE ENTEROS)
 # ====================================================
-def parser_lr(tokens, rules, table):
+def imprimir_paso(pila, tipo, lexema, accion):
+    print(f"Pila: {pila} | Token: ({tipo}, '{lexema}') | Acción: {accion}")
+
+
+def parser_lr(tokens, rules, table, stats=None, valores=None, acciones=None, traza=True):
     """
     :param tokens: lista de tokens en forma (tipo, lexema)
     :param rules: lista de reglas leídas del archivo LR (nt_id, lon, nt_name)
     :param table: la tabla LR (matriz de enteros)
+    :param stats: dict opcional; al terminar recibe 'shifts' y 'reductions'.
+    :param valores: lista opcional usada como pila de valores semánticos.
+                    Un shift apila el lexema; una reducción saca `lon`
+                    valores y apila acciones[regla](*hijos), o la tupla
+                    (nt_name, hijos) si la regla no tiene acción.
+    :param acciones: lista (o dict) regla -> constructor; ver ast_semantico.py.
+    :param traza: True imprime la pila en cada paso (imprimir_paso); False
+                  no imprime nada; un callable recibe
+                  traza(pila, tipo, lexema, accion) con una copia de la pila.
     :return: True si se acepta la cadena, False en caso de error.
     
     Se utiliza la convención:
       - Si la celda contiene un número positivo: SHIFT a ese estado.
-      - Si contiene un número negativo: REDUCE por la regla (-accion - 1).
+      - Si contiene un número negativo: REDUCE por la regla R(-accion - 1),
+        numerada desde 1 como en el archivo (es decir, rules[-accion - 2]).
       - Se asume que la acción de aceptación es -1.
     """
+    if traza is True:
+        traza = imprimir_paso
     stack = [0]  # pila de estados (enteros)
     i = 0  # índice de token actual
+    reducciones = 0
+    if valores is not None and isinstance(acciones, dict):
+        acciones = [acciones.get(k) for k in range(len(rules))]
+    elif valores is not None and acciones is None:
+        acciones = [None] * len(rules)
+
+    try:
+        while True:
+            state = stack[-1]
+            if i >= len(tokens):
+                print("Error: fin de tokens sin encontrar aceptación.")
+                return False
 
-    while True:
-        state = stack[-1]
-        if i >= len(tokens):
-            print("Error: fin de tokens sin encontrar aceptación.")
-            return False
-
-        token_type, token_lex = tokens[i]
-        # Se asume que token_type es el número que indica la columna en la tabla LR
-        if token_type < 0 or token_type >= len(table[state]):
-            print(f"Error: token {token_lex} (tipo={token_type}) fuera de rango en la tabla.")
-            return False
-
-        accion = table[state][token_type]
-        print(f"Pila: {stack} | Token: ({token_type}, '{token_lex}') | Acción: {accion}")
-
-        if accion > 0:
-            # SHIFT
-            stack.append(token_type)  # opcional, para almacenar el símbolo
-            stack.append(accion)       # nuevo estado
-            i += 1  # consumimos token
-
-        elif accion < 0:
-            # Si la convención es que -1 es aceptación, se chequea primero:
-            if accion == -1:
-                print("¡Cadena aceptada!")
-                return True
-            # De lo contrario, es reducción: 
-            regla_idx = -accion - 1  # Por ejemplo, si accion == -2, se reduce por la regla 1.
-            if regla_idx < 0 or regla_idx >= len(rules):
-                print(f"Error: regla {regla_idx} fuera de rango.")
+            token_type, token_lex = tokens[i]
+            # Se asume que token_type es el número que indica la columna en la tabla LR
+            if token_type < 0 or token_type >= len(table[state]):
+                print(f"Error: token {token_lex} (tipo={token_type}) fuera de rango en la tabla.")
                 return False
 
-            nt_id, lon, nt_name = rules[regla_idx]
-            # Sacar 2*lon elementos (símbolos y estados)
-            for _ in range(lon):
-                if len(stack) < 2:
-                    print("Error: pila insuficiente para reducción.")
+            accion = table[state][token_type]
+            if traza:
+                traza(stack[:], token_type, token_lex, accion)
+
+            if accion > 0:
+                # SHIFT
+                stack.append(token_type)  # opcional, para almacenar el símbolo
+                stack.append(accion)       # nuevo estado
+                if valores is not None:
+                    valores.append(token_lex)
+                i += 1  # consumimos token
+
+            elif accion < 0:
+                # Si la convención es que -1 es aceptación, se chequea primero:
+                if accion == -1:
+                    print("¡Cadena aceptada!")
+                    return True
+                # De lo contrario, es reducción: 
+                regla_idx = -accion - 2  # Por ejemplo, si accion == -2, se reduce por la regla 1 (rules[0]).
+                if regla_idx < 0 or regla_idx >= len(rules):
+                    print(f"Error: regla {regla_idx} fuera de rango.")
+                    return False
+
+                nt_id, lon, nt_name = rules[regla_idx]
+                reducciones += 1
+                # Sacar 2*lon elementos (símbolos y estados)
+                for _ in range(lon):
+                    if len(stack) < 2:
+                        print("Error: pila insuficiente para reducción.")
+                        return False
+                    stack.pop()  # Estado
+                    stack.pop()  # Símbolo
+
+                # Después de reducción, el tope es un estado
+                top_state = stack[-1]
+                goto = table[top_state][nt_id]
+                if goto < 0 or goto >= len(table):
+                    print(f"Error: GOTO inválido para estado {top_state} con nt_id {nt_id}.")
                     return False
-                stack.pop()  # Estado
-                stack.pop()  # Símbolo
-
-            # Después de reducción, el tope es un estado
-            top_state = stack[-1]
-            goto = table[top_state][nt_id]
-            if goto < 0 or goto >= len(table):
-                print(f"Error: GOTO inválido para estado {top_state} con nt_id {nt_id}.")
+                stack.append(nt_id)  # Apilamos el no terminal
+                stack.append(goto)   # Nuevo estado
+
+                # Acción semántica: los `lon` valores del tope son los hijos
+                if valores is not None:
+                    if lon:
+                        hijos = valores[-lon:]
+                        del valores[-lon:]
+                    else:
+                        hijos = []
+                    constructor = acciones[regla_idx]
+                    valores.append(constructor(*hijos) if constructor else (nt_name, hijos))
+            elif accion == 0:
+                print("Error: acción 0 (celda vacía) en la tabla.")
                 return False
-            stack.append(nt_id)  # Apilamos el no terminal
-            stack.append(goto)   # Nuevo estado
-        elif accion == 0:
-            print("Error: acción 0 (celda vacía) en la tabla.")
-            return False
-        else:
-            print(f"Acción desconocida: {accion}")
-            return False
+            else:
+                print(f"Acción desconocida: {accion}")
+                return False
+    finally:
+        if stats is not None:
+            stats['shifts'] = stats.get('shifts', 0) + i
+            stats['reductions'] = stats.get('reductions', 0) + reducciones
+
+
+def parser_lr_ast(tokens, rules, table, acciones):
+    """Un solo análisis LR que construye el árbol; retorna la raíz o None."""
+    valores = []
+    if parser_lr(tokens, rules, table, valores=valores, acciones=acciones, traza=False):
+        return valores[-1]
+    return None
 
 # ====================================================
 # 5) MAIN: INTEGRANDO TODO
 # ====================================================
-def main():
+def ejecutar(perfil):
     # 1) Leer la tabla LR desde el archivo (ejemplo: compilador.lr)
     lr_filename = "compilador.lr"
     try:
-        rules, num_rows, num_cols, table = leer_lr_file(lr_filename)
+        with perfil.phase('read'):
+            rules, num_rows, num_cols, table = leer_lr_file(lr_filename)
     except Exception as e:
         print("Error al leer el archivo LR:", e)
         return
@@ -327,14 +372,16 @@ def main():
     print("")
 
     # 3) Tokenizar la entrada usando el analizador léxico
-    lexico = Lexico(fuente)
-    tokens = []
-    while not lexico.terminado():
-        t = lexico.sig_simbolo()
-        if t is None:
-            print(f"Token no reconocido: '{lexico.simbolo}'")
-            break
-        tokens.append((t, lexico.simbolo))
+    with perfil.phase('lex'):
+        lexico = Lexico(fuente)
+        tokens = []
+        while not lexico.terminado():
+            t = lexico.sig_simbolo()
+            if t is None:
+                print(f"Token no reconocido: '{lexico.simbolo}'")
+                break
+            tokens.append((t, lexico.simbolo))
+    perfil.count('tokens', len(tokens))
     print("=== Tokens generados ===")
     for tok in tokens:
         print(tok)
@@ -342,8 +389,26 @@ def main():
 
     # 4) Analizar sintácticamente (parser LR)
     print("=== Análisis sintáctico LR ===")
-    resultado = parser_lr(tokens, rules, table)
+    stats = {} if perfil.enabled else None
+    # La fase medida analiza sin traza (la traza copia la pila en cada paso);
+    # la traza y los mensajes salen de una segunda pasada, fuera de la fase
+    with perfil.phase('parse'), redirect_stdout(io.StringIO()):
+        resultado = parser_lr(tokens, rules, table, stats, traza=False)
+    parser_lr(tokens, rules, table)
+    if stats:
+        for nombre, n in stats.items():
+            perfil.count(nombre, n)
     print(f"Resultado final: {'ACEPTADO' if resultado else 'RECHAZADO'}")
 
+
+def main():
+    # --profile: tiempos por fase, contadores y memoria pico en JSON (stderr)
+    perfil = semantico.Profiler('--profile' in sys.argv[1:])
+    try:
+        ejecutar(perfil)
+    finally:
+        perfil.emit()
+
+
 if __name__ == "__main__":
     main()
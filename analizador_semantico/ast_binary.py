@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+Formato binario del AST de lexer_parser.py (archivos `.astb`).
+
+Sirve para pasar el AST a otras herramientas sin volver a parsear ni usar
+pickle. Todo es little-endian y está alineado a 4 bytes:
+
+    cabecera   magic 'ASTB', versión u16, flags u16 (0), nodos u32,
+               hijos u32, cadenas u32, bytes de cadenas u32      (24 bytes)
+    nodos      5 palabras u32 por nodo:
+                 0  tipo (índice en KINDS) | flags << 8 | c << 16
+                 1  offset en el fuente (NO_POS si es None)
+                 2  a, 3  b: campos según el tipo (ver FIELDS)
+                 4  primer hijo (índice en la tabla de hijos)
+    hijos      u32 por hijo: índice del nodo
+    cadenas    (cadenas + 1) offsets u32 y después los bytes UTF-8
+
+El nodo 0 es la raíz. Los hijos de cada nodo ocupan un tramo de la tabla
+de hijos y los tramos van en orden de nodo, así que la cantidad de hijos
+del nodo i es el primer hijo de i + 1 menos el suyo (el último usa el
+total de la cabecera). Los nodos se numeran en anchura, de modo que los
+hijos de un nodo también son índices consecutivos, pero el lector no
+depende de eso. `c` es la cantidad de parámetros de un FuncDeclNode (los
+primeros hijos; el resto es el cuerpo). Las cadenas (nombres, tipos,
+operadores) se guardan una sola vez.
+
+Un NUMBER entero que cabe en 64 bits o un float va en `a`/`b` (8 bytes);
+un entero más grande va como texto en la tabla de cadenas.
+
+`AstView` lee un archivo (o bytes) sin reconstruir objetos: abre el archivo
+con `mmap` y responde por índice de nodo con `memoryview.cast`. Al abrir
+valida una vez las tablas (tipos, hijos y cadenas dentro de rango) y lanza
+FormatError, así que recorrer el árbol no falla con un archivo
+dañado. `NodeView` expone los mismos atributos que las clases de Node
+(`decls`, `name`, `body`, `left`...), y `to_node()` reconstruye el AST
+original.
+
+Uso:
+    python ast_binary.py ARCHIVO.src [-o SALIDA.astb]
+    python ast_binary.py --show ARCHIVO.astb
+"""
+import gc, os, sys, mmap, struct, argparse
+from array import array
+from itertools import chain, compress
+from operator import ge, le, or_, sub
+
+from lexer_parser import (Lexer, Parser, LexError, ParseError, ProgramNode, VarDeclNode,
+                          ParamNode, FuncDeclNode, AssignNode, ReturnNode, BinaryOpNode,
+                          FuncCallNode, NumberNode, IdentifierNode, ImportNode)
+
+MAGIC = b'ASTB'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIII')
+WORDS = 5                    # palabras u32 por nodo
+MAX_PARAMS = 0xFFFF
+NO_POS = 0xFFFFFFFF
+
+# Flags de NumberNode
+F_FLOAT, F_BIGINT = 1, 2
+
+KINDS = [ProgramNode, VarDeclNode, ParamNode, FuncDeclNode, AssignNode, ReturnNode,
+         BinaryOpNode, FuncCallNode, NumberNode, IdentifierNode, ImportNode]
+KIND_INDEX = {cls: i for i, cls in enumerate(KINDS)}
+
+# Atributo -> palabra (2: a, 3: b) con índice de cadena
+FIELDS = {
+    VarDeclNode:    {'vtype': 2, 'name': 3},
+    ParamNode:      {'name': 2, 'ptype': 3},
+    FuncDeclNode:   {'return_type': 2, 'name': 3},
+    AssignNode:     {'name': 2},
+    BinaryOpNode:   {'op': 2},
+    FuncCallNode:   {'name': 2},
+    IdentifierNode: {'name': 2},
+    ImportNode:     {'module': 2},
+}
+
+class FormatError(Exception):
+    pass
+
+# Tablas de bytes.translate indexadas por tipo (256 entradas, como pide translate)
+# Hijos mínimos de cada tipo (los que usa el lector)
+_MIN_CHILDREN = bytes(1 if cls in (AssignNode, ReturnNode) else 2 if cls is BinaryOpNode else 0
+                      for cls in KINDS).ljust(256, b'\0')
+# 1 si el tipo guarda un índice de cadena en la palabra 2 (a) o 3 (b)
+_STRING_A = bytes(int(2 in FIELDS.get(cls, {}).values()) for cls in KINDS).ljust(256, b'\0')
+_STRING_B = bytes(int(3 in FIELDS.get(cls, {}).values()) for cls in KINDS).ljust(256, b'\0')
+_KNOWN_KINDS = bytes(range(len(KINDS)))
+# Flags -> 1 si llevan F_BIGINT
+_BIGINT_FLAG = bytes(int(bool(f & F_BIGINT)) for f in range(256))
+
+_INT64 = struct.Struct('<q')
+_FLOAT64 = struct.Struct('<d')
+_WORD_PAIR = struct.Struct('<II')
+
+# ------------------------------------------------
+# Escritura
+# ------------------------------------------------
+def _children(node):
+    if isinstance(node, ProgramNode):
+        return node.decls
+    if isinstance(node, FuncDeclNode):
+        return node.params + node.body
+    if isinstance(node, (AssignNode, ReturnNode)):
+        return [node.expr]
+    if isinstance(node, BinaryOpNode):
+        return [node.left, node.right]
+    if isinstance(node, FuncCallNode):
+        return node.args
+    return []
+
+def dumps(ast):
+    """AST (ProgramNode) -> bytes en formato `.astb`."""
+    strings, blob, offsets = {}, bytearray(), array('I', [0])
+    def intern(s):
+        i = strings.get(s)
+        if i is None:
+            i = strings[s] = len(offsets) - 1
+            blob.extend(s.encode('utf-8'))
+            offsets.append(len(blob))
+        return i
+
+    words, children = array('I'), array('I')
+    order = [ast]
+    i = 0
+    while i < len(order):
+        node = order[i]
+        i += 1
+        cls = type(node)
+        kind = KIND_INDEX.get(cls)
+        if kind is None:
+            raise TypeError(f"nodo sin formato binario: {cls.__name__}")
+        flags, a, b, c = 0, 0, 0, 0
+        if cls is NumberNode:
+            v = node.value
+            if isinstance(v, float):
+                flags = F_FLOAT
+                a, b = _WORD_PAIR.unpack(_FLOAT64.pack(v))
+            elif -2**63 <= v < 2**63:
+                a, b = _WORD_PAIR.unpack(_INT64.pack(v))
+            else:
+                flags, a = F_BIGINT, intern(str(v))
+        elif cls is FuncDeclNode:
+            c = len(node.params)
+            if c > MAX_PARAMS:
+                raise ValueError(f"'{node.name}' tiene más de {MAX_PARAMS} parámetros")
+        fields = FIELDS.get(cls)
+        if fields:
+            slots = [a, b]
+            for attr, w in fields.items():
+                slots[w - 2] = intern(getattr(node, attr))
+            a, b = slots
+        kids = _children(node)
+        pos = NO_POS if node.pos is None else node.pos
+        words.extend((kind | flags << 8 | c << 16, pos, a, b, len(children)))
+        for k in kids:
+            children.append(len(order))
+            order.append(k)
+
+    if sys.byteorder == 'big':
+        for arr in (words, children, offsets):
+            arr.byteswap()
+    header = HEADER.pack(MAGIC, VERSION, 0, len(order), len(children),
+                         len(offsets) - 1, len(blob))
+    return b''.join((header, words.tobytes(), children.tobytes(), offsets.tobytes(), blob))
+
+def dump(ast, path):
+    with open(path, 'wb') as f:
+        f.write(dumps(ast))
+
+# ------------------------------------------------
+# Lectura
+# ------------------------------------------------
+class AstView:
+    """
+    AST en formato `.astb` sobre un buffer (bytes, mmap). Nada se copia ni
+    se decodifica hasta que se pide: `kind(i)`, `pos(i)`, `children(i)` y
+    `string(j)` leen directamente del buffer.
+    """
+    def __init__(self, data):
+        self._mmap = None
+        mv = memoryview(data)
+        error = self._load(mv)
+        if error:
+            # Se sueltan las vistas antes de lanzar: así quien abrió el mmap
+            # lo puede cerrar
+            self.close()
+            mv.release()
+            raise FormatError(error)
+
+    def _load(self, mv):
+        """Lee la cabecera y arma las vistas; retorna un mensaje de error o None."""
+        if len(mv) < HEADER.size:
+            return "archivo truncado"
+        magic, version, _, n, m, s, size = HEADER.unpack_from(mv)
+        if magic != MAGIC:
+            return "no es un AST binario (magic)"
+        if version != VERSION:
+            return f"versión {version} no soportada (se espera {VERSION})"
+        off = HEADER.size
+        ends = [off + 4 * WORDS * n, 0, 0]
+        ends[1] = ends[0] + 4 * m
+        ends[2] = ends[1] + 4 * (s + 1)
+        if len(mv) < ends[2] + size:
+            return "archivo truncado"
+        self.node_count, self.child_count, self.string_count = n, m, s
+        self._buf = mv
+        self._words = self._u32(mv[off:ends[0]])
+        self._children = self._u32(mv[ends[0]:ends[1]])
+        self._offsets = self._u32(mv[ends[1]:ends[2]])
+        self._blob = mv[ends[2]:ends[2] + size]
+        return self._validate(mv[off:ends[0]], size)
+
+    def _validate(self, nodes, size):
+        """
+        Revisa las tablas una vez, con recorridos en C (bytes.translate,
+        map, set) para que abrir siga siendo barato. Después de esto cada
+        nodo tiene un tipo conocido y los hijos que su tipo usa, sus índices
+        de hijos y de cadenas caen dentro de las tablas, y los hijos forman
+        un árbol: cada nodo salvo la raíz es hijo exactamente una vez.
+        `nodes` son los bytes de la tabla de nodos (little-endian, así que
+        el byte 0 de cada nodo es el tipo y el 1, los flags). Retorna un
+        mensaje de error o None.
+        """
+        n, m, s = self.node_count, self.child_count, self.string_count
+        words, kids, offsets = self._words, self._children, self._offsets
+        if n == 0:
+            return "el AST no tiene nodos"
+        kinds = bytes(nodes[0::4 * WORDS])
+        if kinds.translate(None, _KNOWN_KINDS):
+            return "tipo de nodo desconocido"
+
+        # Hijos de cada nodo: primer hijo del siguiente (m para el último)
+        # menos el suyo; si alguno es negativo la tabla está desordenada
+        counts = list(map(sub, chain(words[4 + WORDS::WORDS], (m,)), words[4::WORDS]))
+        if min(counts) < 0:
+            return "tabla de hijos desordenada o fuera de rango"
+        if not all(map(ge, counts, kinds.translate(_MIN_CHILDREN))):
+            return "un nodo tiene menos hijos de los que requiere su tipo"
+        params = array('H')
+        params.frombytes(nodes.cast('H')[1::2 * WORDS].tobytes())
+        if sys.byteorder == 'big':
+            params.byteswap()
+        if not all(map(ge, counts, params)):
+            return "un FuncDeclNode tiene más parámetros que hijos"
+        distinct = set(kids)
+        if m != n - 1 or len(distinct) != m or 0 in distinct or (m and max(distinct) >= n):
+            return "la tabla de hijos no forma un árbol"
+
+        if not all(map(le, offsets, offsets[1:])) or offsets[s] > size:
+            return "tabla de cadenas desordenada o fuera de rango"
+        # Índices de cadena: los campos de FIELDS y `a` de los NUMBER con F_BIGINT
+        bigint = bytes(nodes[1::4 * WORDS]).translate(_BIGINT_FLAG)
+        for w, uses in ((2, bytes(map(or_, kinds.translate(_STRING_A), bigint))),
+                        (3, kinds.translate(_STRING_B))):
+            if max(compress(words[w::WORDS], uses), default=-1) >= s:
+                return "índice de cadena fuera de rango"
+        return None
+
+    @staticmethod
+    def _u32(mv):
+        if sys.byteorder == 'little':
+            return mv.cast('I')
+        a = array('I')          # máquina big-endian: una copia
+        a.frombytes(mv)
+        a.byteswap()
+        return a
+
+    @classmethod
+    def open(cls, path):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise FormatError("archivo vacío")     # mmap no acepta tamaño 0
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            view = cls(mm)
+        except FormatError:
+            mm.close()
+            raise
+        view._mmap = mm
+        return view
+
+    def close(self):
+        for attr in ('_words', '_children', '_offsets', '_blob', '_buf'):
+            v = getattr(self, attr, None)
+            if isinstance(v, memoryview):
+                v.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Acceso por índice
+    def kind(self, i):
+        return KINDS[self._words[i * WORDS] & 0xFF]
+
+    def flags(self, i):
+        return self._words[i * WORDS] >> 8 & 0xFF
+
+    def param_count(self, i):
+        return self._words[i * WORDS] >> 16
+
+    def pos(self, i):
+        p = self._words[i * WORDS + 1]
+        return None if p == NO_POS else p
+
+    def word(self, i, w):
+        return self._words[i * WORDS + w]
+
+    def children(self, i):
+        first = self._words[i * WORDS + 4]
+        end = self._words[i * WORDS + WORDS + 4] if i + 1 < self.node_count else self.child_count
+        return self._children[first:end].tolist()   # copia: no retiene el buffer
+
+    def string(self, j):
+        try:
+            return str(self._blob[self._offsets[j]:self._offsets[j + 1]], 'utf-8')
+        except UnicodeDecodeError as e:
+            raise FormatError(f"cadena {j} no es UTF-8 válido") from e
+
+    def number(self, i):
+        base = i * WORDS
+        flags = self._words[base] >> 8 & 0xFF
+        if flags & F_BIGINT:
+            text = self.string(self._words[base + 2])
+            try:
+                return int(text)
+            except ValueError:
+                raise FormatError(f"NUMBER inválido en el nodo {i}: {text!r}") from None
+        raw = _WORD_PAIR.pack(self._words[base + 2], self._words[base + 3])
+        return (_FLOAT64 if flags & F_FLOAT else _INT64).unpack(raw)[0]
+
+    @property
+    def root(self):
+        return NodeView(self, 0)
+
+    def to_node(self, i=0):
+        """Reconstruye el AST (objetos Node) desde el nodo `i`."""
+        return _build(self, i)
+
+class NodeView:
+    """Un nodo de un AstView con los atributos de su clase Node."""
+    __slots__ = ('view', 'index')
+
+    def __init__(self, view, index):
+        self.view, self.index = view, index
+
+    @property
+    def type(self):
+        return self.view.kind(self.index)
+
+    @property
+    def pos(self):
+        return self.view.pos(self.index)
+
+    @property
+    def children(self):
+        view = self.view
+        return [NodeView(view, k) for k in view.children(self.index)]
+
+    def __getattr__(self, attr):
+        view, i = self.view, self.index
+        cls = view.kind(i)
+        w = FIELDS.get(cls, {}).get(attr)
+        if w is not None:
+            return view.string(view.word(i, w))
+        kids = view.children(i)
+        if cls is ProgramNode and attr == 'decls':
+            return [NodeView(view, k) for k in kids]
+        if cls is FuncDeclNode and attr in ('params', 'body'):
+            c = view.param_count(i)
+            return [NodeView(view, k) for k in (kids[:c] if attr == 'params' else kids[c:])]
+        if cls in (AssignNode, ReturnNode) and attr == 'expr':
+            return NodeView(view, kids[0])
+        if cls is BinaryOpNode and attr in ('left', 'right'):
+            return NodeView(view, kids[0 if attr == 'left' else 1])
+        if cls is FuncCallNode and attr == 'args':
+            return [NodeView(view, k) for k in kids]
+        if cls is NumberNode and attr in ('value', 'ntype'):
+            if attr == 'ntype':
+                return 'float' if view.flags(i) & F_FLOAT else 'int'
+            return view.number(i)
+        raise AttributeError(f"{cls.__name__} no tiene '{attr}'")
+
+    def __repr__(self):
+        return f"<{self.type.__name__} #{self.index}>"
+
+def _build(view, root):
+    """
+    Reconstrucción de abajo hacia arriba, sin recursión. Las palabras y la
+    tabla de hijos se pasan a listas una vez y cada cadena se decodifica una
+    sola vez (y queda compartida, como en el AST del Parser).
+    """
+    # El árbol solo crece: sin pausar el GC, cada recolección recorre todos
+    # los nodos ya creados
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _build_nodes(view, root)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+def _build_nodes(view, root):
+    words, table = view._words.tolist(), view._children.tolist()
+    n, strs = view.node_count, [None] * view.string_count
+    def s(j):
+        v = strs[j]
+        if v is None:
+            v = strs[j] = view.string(j)
+        return v
+    def kids_range(i):
+        first = words[i * WORDS + 4]
+        return table[first:words[i * WORDS + WORDS + 4] if i + 1 < n else len(table)]
+
+    order = [root]
+    for i in order:
+        order.extend(kids_range(i))
+    built = {}
+    pop = built.pop
+    for i in reversed(order):
+        base = i * WORDS
+        w0, pos, a = words[base], words[base + 1], words[base + 2]
+        cls = KINDS[w0 & 0xFF]
+        if pos == NO_POS:
+            pos = None
+        kids = [pop(k) for k in kids_range(i)] if cls not in (NumberNode, IdentifierNode) else None
+        if cls is IdentifierNode:
+            node = IdentifierNode(s(a), pos)
+        elif cls is NumberNode:
+            node = NumberNode(view.number(i), pos)
+        elif cls is BinaryOpNode:
+            node = BinaryOpNode(kids[0], s(a), kids[1], pos)
+        elif cls is AssignNode:
+            node = AssignNode(s(a), kids[0], pos)
+        elif cls is FuncCallNode:
+            node = FuncCallNode(s(a), kids, pos)
+        elif cls is ReturnNode:
+            node = ReturnNode(kids[0], pos)
+        elif cls is VarDeclNode:
+            node = VarDeclNode(s(a), s(words[base + 3]), pos)
+        elif cls is ParamNode:
+            node = ParamNode(s(a), s(words[base + 3]), pos)
+        elif cls is FuncDeclNode:
+            c = w0 >> 16
+            node = FuncDeclNode(s(a), s(words[base + 3]), kids[:c], kids[c:], pos)
+        elif cls is ProgramNode:
+            node = ProgramNode(kids)
+        else:
+            node = ImportNode(s(a), pos)
+        built[i] = node
+    return built[root]
+
+def _show(view, out=sys.stdout):
+    pending = [(0, 0)]
+    while pending:
+        i, depth = pending.pop()
+        cls, kids = view.kind(i), view.children(i)
+        node = NodeView(view, i)
+        if cls is NumberNode:
+            detail = repr(node.value)
+        else:
+            detail = ' '.join(f"{a}={getattr(node, a)}" for a in FIELDS.get(cls, {}))
+        print(f"{'  ' * depth}{cls.__name__} {detail}".rstrip(), file=out)
+        pending.extend((k, depth + 1) for k in reversed(kids))
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='AST en formato binario (.astb)')
+    ap.add_argument('file', help='fuente .src, o .astb con --show')
+    ap.add_argument('-o', '--output', help='archivo de salida (por defecto, ARCHIVO.astb)')
+    ap.add_argument('--show', action='store_true', help='imprime el árbol de un .astb')
+    args = ap.parse_args()
+    if args.show:
+        try:
+            with AstView.open(args.file) as view:
+                _show(view)
+        except FormatError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        sys.exit(0)
+    with open(args.file, encoding='utf-8') as f:
+        code = f.read()
+    try:
+        lexer = Lexer(code)
+        ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+    except (LexError, ParseError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    out = args.output or args.file.rsplit('.', 1)[0] + '.astb'
+    data = dumps(ast)
+    with open(out, 'wb') as f:
+        f.write(data)
+    print(f"{out}: {len(data)} bytes")
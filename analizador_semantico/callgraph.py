@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Grafo de llamadas de un programa de lexer_parser.py.
+
+Las aristas salen de `FuncCallNode.target` (resolver.py), así que siguen las
+mismas reglas de visibilidad que el análisis semántico: las llamadas a
+funciones importadas o no declaradas no son aristas. Con esas reglas una
+función solo ve a las declaradas antes y a sí misma, por lo que los ciclos
+de un programa válido son recursión directa; el análisis de componentes es
+general igual.
+
+- Las funciones se numeran en orden de declaración. Una redefinición
+  también es un nodo, pero nunca recibe llamadas (van a la primera
+  declaración), así que aparece como inalcanzable. Las aristas, sin repetidos,
+  van en dos `array` al estilo CSR: los sucesores de `i` son
+  `targets[offsets[i]:offsets[i + 1]]`.
+- `components()` es `tarjan()`, Tarjan iterativo sobre esos arreglos: cada
+  componente sale después de todas las que llama (orden de abajo hacia
+  arriba). scheduler.py usa la misma función para el grafo de módulos.
+- `recursive()` son las componentes con un ciclo, `unreachable()` las
+  funciones que no se alcanzan desde las raíces (`main` y las llamadas del
+  nivel superior) y `levels()` agrupa las componentes por niveles: cada
+  nivel solo llama a niveles anteriores, así que las funciones de un mismo
+  nivel se pueden procesar en paralelo.
+
+Uso:
+    python callgraph.py ARCHIVO [--entry main]
+"""
+import sys, argparse
+from array import array
+
+from lexer_parser import (Lexer, Parser, LexError, ParseError, FuncDeclNode, AssignNode,
+                          ReturnNode, BinaryOpNode, FuncCallNode)
+from resolver import resolve
+
+def _calls(stmts):
+    """FuncCallNode de una lista de sentencias (recorrido iterativo)."""
+    pending = [s.expr if isinstance(s, (AssignNode, ReturnNode)) else s for s in stmts]
+    while pending:
+        n = pending.pop()
+        if isinstance(n, BinaryOpNode):
+            pending += (n.left, n.right)
+        elif isinstance(n, FuncCallNode):
+            yield n
+            pending.extend(n.args)
+
+def tarjan(offsets, targets):
+    """
+    Componentes fuertemente conexas de un grafo CSR con `len(offsets) - 1`
+    nodos (Tarjan iterativo). Cada componente, con sus nodos ordenados, sale
+    después de todas las que alcanza.
+    """
+    n = len(offsets) - 1
+    index, low = array('l', [-1]) * n, array('l', [0]) * n
+    on_stack = bytearray(n)
+    stack, components, counter = [], [], 0
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter; counter += 1
+        stack.append(root); on_stack[root] = 1
+        work = [(root, offsets[root])]     # (nodo, próxima arista)
+        while work:
+            v, e = work[-1]
+            end = offsets[v + 1]
+            while e < end:
+                w = targets[e]
+                e += 1
+                if index[w] < 0:
+                    work[-1] = (v, e)
+                    index[w] = low[w] = counter; counter += 1
+                    stack.append(w); on_stack[w] = 1
+                    work.append((w, offsets[w]))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop(); on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    component.sort()
+                    components.append(component)
+    return components
+
+class CallGraph:
+    def __init__(self, ast, entry='main'):
+        if ast.frame_size is None:
+            resolve(ast)
+        self.funcs, number = [], {}
+        for d in ast.decls:
+            if isinstance(d, FuncDeclNode):
+                number[id(d)] = len(self.funcs)
+                self.funcs.append(d)
+
+        self.offsets, self.targets = array('l', [0]), array('l')
+        for f in self.funcs:
+            seen = set()
+            for call in _calls(f.body):
+                t = number.get(id(call.target), -1) if call.target is not None else -1
+                if t >= 0 and t not in seen:
+                    seen.add(t)
+                    self.targets.append(t)
+            self.offsets.append(len(self.targets))
+
+        roots = {number[id(f)] for f in self.funcs if f.name == entry}
+        top = [d for d in ast.decls if not isinstance(d, FuncDeclNode)]
+        roots.update(number[id(c.target)] for c in _calls(top)
+                     if c.target is not None and id(c.target) in number)
+        self.roots = sorted(roots)
+
+    def __len__(self):
+        return len(self.funcs)
+
+    def callees(self, i):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def components(self):
+        """Componentes fuertemente conexas (índices), de abajo hacia arriba."""
+        return tarjan(self.offsets, self.targets)
+
+    def recursive(self, components=None):
+        """Componentes con un ciclo: más de una función, o una que se llama a sí misma."""
+        out = []
+        for c in components if components is not None else self.components():
+            if len(c) > 1 or c[0] in self.callees(c[0]):
+                out.append(c)
+        return out
+
+    def unreachable(self):
+        """Índices de las funciones que no se alcanzan desde las raíces."""
+        seen = bytearray(len(self.funcs))
+        pending = list(self.roots)
+        for r in pending:
+            seen[r] = 1
+        offsets, targets = self.offsets, self.targets
+        while pending:
+            v = pending.pop()
+            for e in range(offsets[v], offsets[v + 1]):
+                w = targets[e]
+                if not seen[w]:
+                    seen[w] = 1
+                    pending.append(w)
+        return [i for i in range(len(self.funcs)) if not seen[i]]
+
+    def levels(self, components=None):
+        """Componentes agrupadas por nivel; el nivel 0 no llama a otras componentes."""
+        components = components if components is not None else self.components()
+        comp_of = array('l', [0]) * len(self.funcs)
+        for k, c in enumerate(components):
+            for v in c:
+                comp_of[v] = k
+        level = array('l', [0]) * len(components)
+        out = []
+        for k, c in enumerate(components):     # las llamadas ya tienen su nivel
+            lv = 0
+            for v in c:
+                for w in self.callees(v):
+                    kw = comp_of[w]
+                    if kw != k and level[kw] + 1 > lv:
+                        lv = level[kw] + 1
+            level[k] = lv
+            if lv == len(out):
+                out.append([])
+            out[lv].append(c)
+        return out
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Grafo de llamadas: recursión, funciones sin uso y orden')
+    ap.add_argument('file')
+    ap.add_argument('--entry', default='main', help='función de entrada (además de las llamadas globales)')
+    args = ap.parse_args()
+    with open(args.file, encoding='utf-8') as f:
+        code = f.read()
+    try:
+        lexer = Lexer(code)
+        ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+    except (LexError, ParseError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    g = CallGraph(ast, args.entry)
+    comps = g.components()
+    names = lambda c: ', '.join(g.funcs[i].name for i in c)
+    print(f"{len(g)} funciones, {len(g.targets)} aristas, {len(comps)} componentes")
+    for c in g.recursive(comps):
+        print(f"recursión: {names(c)}")
+    for i in g.unreachable():
+        line, col = lexer.lines.position(g.funcs[i].pos)
+        print(f"{line}:{col}: función '{g.funcs[i].name}' nunca se llama desde '{args.entry}'")
+    for k, lv in enumerate(g.levels(comps)):
+        print(f"nivel {k}: {names(i for c in lv for i in c)}")
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Análisis de flujo de datos sobre los cuerpos de función de lexer_parser.py.
+
+Detecta lecturas de variables locales sin asignar y asignaciones cuyo valor
+nunca se lee (stores muertos). Trabaja sobre el AST ya resuelto por
+`resolver.py`: el índice de una variable es su slot LOCAL, así que no se
+busca ningún nombre.
+
+- El grafo de flujo de una función tiene un bloque básico por tramo de
+  sentencias hasta un `return` (que salta a la salida). El lenguaje no
+  tiene saltos, así que el código después de un `return` queda en bloques
+  sin predecesores: es inalcanzable y no se analiza.
+- Los conjuntos son enteros de Python usados como vectores de bits, y
+  `solve()` resuelve un problema de unión genérico (gen/kill por bloque)
+  con una lista de trabajo en orden posorden inverso, hacia adelante o
+  hacia atrás.
+- Dentro de un bloque no se arman vectores por sentencia: el conjunto de
+  entrada del bloque se pasa una vez a un bytearray de un byte por bit y
+  las sentencias lo consultan y modifican en O(1).
+- Definiciones alcanzantes (hacia adelante): cada variable tiene un bit de
+  "valor inicial" y un bit por asignación, contiguos, así que la máscara
+  que mata todas las definiciones de una variable es un solo rango. Un
+  local leído mientras alcanza su valor inicial no fue asignado; los
+  parámetros tienen valor inicial.
+- Variables vivas (hacia atrás): un bit por variable. Una asignación a un
+  local que no está vivo justo después es un store muerto.
+
+El costo es lineal en sentencias, usos y ancho de los vectores por
+bloque, así que funciones con miles de locales se analizan en
+milisegundos.
+
+Uso:
+    python dataflow.py ARCHIVO
+"""
+import sys, argparse
+from collections import deque
+
+from lexer_parser import (Lexer, Parser, LexError, ParseError, FuncDeclNode, VarDeclNode,
+                          AssignNode, ReturnNode, BinaryOpNode, FuncCallNode, IdentifierNode)
+from resolver import resolve, LOCAL
+
+# ------------------------------------------------
+# Grafo de flujo
+# ------------------------------------------------
+class Block:
+    __slots__ = ('stmts', 'succs', 'preds')
+
+    def __init__(self):
+        self.stmts, self.succs, self.preds = [], [], []
+
+class CFG:
+    """Bloques básicos de una función; el bloque 0 es la entrada y EXIT la salida."""
+    EXIT = -1
+
+    def __init__(self, func):
+        self.func = func
+        self.blocks = [Block()]
+        for stmt in func.body:
+            self.blocks[-1].stmts.append(stmt)
+            if isinstance(stmt, ReturnNode):
+                self.blocks.append(Block())
+        for i, b in enumerate(self.blocks):
+            last = b.stmts[-1] if b.stmts else None
+            if isinstance(last, ReturnNode) or i + 1 == len(self.blocks):
+                b.succs.append(CFG.EXIT)
+            else:
+                b.succs.append(i + 1)
+        for i, b in enumerate(self.blocks):
+            for s in b.succs:
+                if s != CFG.EXIT:
+                    self.blocks[s].preds.append(i)
+
+    def reverse_postorder(self):
+        """Bloques alcanzables desde la entrada, en posorden inverso (DFS iterativo)."""
+        seen, post, stack = {0}, [], [(0, iter(self.blocks[0].succs))]
+        while stack:
+            b, succs = stack[-1]
+            for s in succs:
+                if s != CFG.EXIT and s not in seen:
+                    seen.add(s)
+                    stack.append((s, iter(self.blocks[s].succs)))
+                    break
+            else:
+                stack.pop()
+                post.append(b)
+        post.reverse()
+        return post
+
+def solve(cfg, gen, kill, forward=True, entry=0):
+    """
+    Problema de unión: OUT = gen | (IN & ~kill) por bloque. Hacia adelante,
+    IN es el conjunto al entrar al bloque; hacia atrás, al salir (lo que
+    llega de los sucesores) y OUT al entrar. `entry` es el conjunto en la
+    entrada de la función (en la salida, hacia atrás). Retorna (IN, OUT) por
+    bloque; los inalcanzables quedan en 0.
+    """
+    order = cfg.reverse_postorder()
+    if not forward:
+        order.reverse()
+    n = len(cfg.blocks)
+    IN, OUT = [0] * n, [0] * n
+    rank = {b: i for i, b in enumerate(order)}
+    work, queued = deque(order), set(order)
+    while work:
+        b = work.popleft()
+        queued.discard(b)
+        block = cfg.blocks[b]
+        srcs = block.preds if forward else block.succs
+        acc = 0
+        for p in srcs:
+            if p == CFG.EXIT:
+                acc |= entry
+            elif p in rank:
+                acc |= OUT[p]
+        if forward and b == 0:
+            acc |= entry
+        IN[b] = acc
+        out = gen[b] | (acc & ~kill[b])
+        if out != OUT[b]:
+            OUT[b] = out
+            for s in (block.succs if forward else block.preds):
+                if s != CFG.EXIT and s in rank and s not in queued:
+                    queued.add(s)
+                    work.append(s)
+    return IN, OUT
+
+# ------------------------------------------------
+# Usos y definiciones por sentencia
+# ------------------------------------------------
+def _reads(expr):
+    """IdentifierNode locales leídos por una expresión, en orden de evaluación."""
+    out, pending = [], [expr]
+    while pending:
+        n = pending.pop()
+        if isinstance(n, IdentifierNode):
+            if n.slot is not None and n.slot[0] == LOCAL:
+                out.append(n)
+        elif isinstance(n, BinaryOpNode):
+            pending += (n.right, n.left)
+        elif isinstance(n, FuncCallNode):
+            pending.extend(reversed(n.args))
+    return out
+
+def _expr_of(stmt):
+    return stmt.expr if isinstance(stmt, (AssignNode, ReturnNode)) else stmt
+
+def _local_store(stmt):
+    """Slot local que asigna la sentencia, o None."""
+    if isinstance(stmt, AssignNode) and stmt.slot is not None and stmt.slot[0] == LOCAL:
+        return stmt.slot[1]
+    return None
+
+def _bitset(positions, width):
+    """Entero con los bits `positions` en 1, armado en O(width) con un bytearray."""
+    raw = bytearray((width + 8) // 8)
+    for k in positions:
+        raw[k >> 3] |= 1 << (k & 7)
+    return int.from_bytes(raw, 'little')
+
+def _flags(bits, width):
+    """bytearray con un 0/1 por bit de `bits`: consultas y cambios en O(1)."""
+    flags = bytearray(width)
+    s = format(bits, 'b')[::-1].encode()
+    flags[:len(s)] = s
+    return flags.translate(_DIGIT)
+
+_DIGIT = bytes.maketrans(b'01', b'\x00\x01')
+
+# ------------------------------------------------
+# Análisis
+# ------------------------------------------------
+class FunctionFlow:
+    """Definiciones alcanzantes y variables vivas de un FuncDeclNode resuelto."""
+    def __init__(self, func):
+        self.func = func
+        self.cfg = CFG(func)
+        self.size = func.frame_size
+        self.params = len(func.params)
+        self.reads = {}   # id(sentencia) -> IdentifierNode locales leídos
+        for b in self.cfg.blocks:
+            for s in b.stmts:
+                self.reads[id(s)] = [] if isinstance(s, VarDeclNode) else _reads(_expr_of(s))
+
+    def _def_bits(self):
+        """Bit inicial de cada variable y bit de cada asignación, agrupados por variable."""
+        stores = [[] for _ in range(self.size)]
+        for b in self.cfg.blocks:
+            for s in b.stmts:
+                v = _local_store(s)
+                if v is not None:
+                    stores[v].append(s)
+        base, bit_of, width = [0] * (self.size + 1), {}, 0
+        for v in range(self.size):
+            base[v] = width
+            for k, s in enumerate(stores[v], 1):
+                bit_of[id(s)] = width + k
+            width += 1 + len(stores[v])
+        base[self.size] = width
+        return base, bit_of
+
+    def uninitialized(self):
+        """IdentifierNode que pueden leer un local antes de su primera asignación."""
+        base, bit_of = self._def_bits()
+        width, blocks = base[self.size], self.cfg.blocks
+        gen, kill = [0] * len(blocks), [0] * len(blocks)
+        for i, b in enumerate(blocks):
+            last = {}
+            for s in b.stmts:
+                v = _local_store(s)
+                if v is not None:
+                    last[v] = s
+            gen[i] = _bitset((bit_of[id(s)] for s in last.values()), width)
+            kill[i] = _bitset((k for v in last for k in range(base[v], base[v + 1])), width)
+        entry = _bitset(base[:self.size], width)
+        IN, _ = solve(self.cfg, gen, kill, forward=True, entry=entry)
+
+        # Dentro del bloque basta saber qué locales ya se asignaron
+        found = []
+        for b in self.cfg.reverse_postorder():
+            reaching, assigned = _flags(IN[b], width), set()
+            for s in blocks[b].stmts:
+                for ident in self.reads[id(s)]:
+                    v = ident.slot[1]
+                    if v >= self.params and v not in assigned and reaching[base[v]]:
+                        found.append(ident)
+                v = _local_store(s)
+                if v is not None:
+                    assigned.add(v)
+        return found
+
+    def dead_stores(self):
+        """AssignNode a locales cuyo valor no se lee antes de otra asignación o del final."""
+        blocks = self.cfg.blocks
+        gen, kill = [0] * len(blocks), [0] * len(blocks)
+        for i, b in enumerate(blocks):
+            used, stored = set(), set()
+            for s in reversed(b.stmts):
+                v = _local_store(s)
+                if v is not None:
+                    used.discard(v)
+                    stored.add(v)
+                used.update(ident.slot[1] for ident in self.reads[id(s)])
+            gen[i], kill[i] = _bitset(used, self.size), _bitset(stored, self.size)
+        live_out, _ = solve(self.cfg, gen, kill, forward=False)
+
+        found = []
+        for b in self.cfg.reverse_postorder():
+            live = _flags(live_out[b], self.size)
+            for s in reversed(blocks[b].stmts):
+                v = _local_store(s)
+                if v is not None:
+                    if not live[v]:
+                        found.append(s)
+                    live[v] = 0
+                for ident in self.reads[id(s)]:
+                    live[ident.slot[1]] = 1
+        found.reverse()
+        return found
+
+def analyze(ast):
+    """
+    Resuelve el AST si hace falta y analiza cada función. Retorna las
+    advertencias como (offset, mensaje), en orden de aparición.
+    """
+    if ast.frame_size is None:
+        resolve(ast)
+    warnings = []
+    for d in ast.decls:
+        if not isinstance(d, FuncDeclNode):
+            continue
+        flow = FunctionFlow(d)
+        for ident in flow.uninitialized():
+            warnings.append((ident.pos, f"Advertencia: '{ident.name}' se usa sin asignar en función '{d.name}'."))
+        for s in flow.dead_stores():
+            warnings.append((s.pos, f"Advertencia: el valor asignado a '{s.name}' no se usa en función '{d.name}'."))
+    warnings.sort(key=lambda w: w[0])
+    return warnings
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Lecturas sin asignar y stores muertos')
+    ap.add_argument('file')
+    args = ap.parse_args()
+    with open(args.file, encoding='utf-8') as f:
+        code = f.read()
+    try:
+        lexer = Lexer(code)
+        ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+    except (LexError, ParseError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    for pos, msg in analyze(ast):
+        line, col = lexer.lines.position(pos)
+        print(f"{line}:{col}: {msg}")
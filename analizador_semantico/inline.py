@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Inlining de funciones pequeñas para el AST de lexer_parser.py.
+
+Reemplaza llamadas a funciones chicas y no recursivas por su cuerpo. Como
+el lenguaje no tiene expresiones con sentencias, el cuerpo se inserta antes
+de la sentencia que contiene la llamada y la llamada pasa a ser el valor de
+retorno (`k` y `g` globales, `x` local):
+
+    float escala(float v) { float r; r = v * k; return r; }
+    int suma(int a, int b) { return a + b; }
+
+    t = escala(g + 1.0) * 2.0;   ->   float escala_v_1;  escala_v_1 = g + 1.0;
+                                      float escala_r_1;  escala_r_1 = escala_v_1 * k;
+                                      t = escala_r_1 * 2.0;
+    c = suma(x, 1) * 2;          ->   c = (x + 1) * 2;
+
+- Los parámetros y locales del llamado se renombran a `función_nombre_k`,
+  con `k` elegido para no chocar con ningún nombre del programa. Un
+  argumento que es un número o un local del llamador se usa directamente
+  si el llamado no asigna ese parámetro. El valor de retorno reemplaza a la
+  llamada si ya tiene el tipo de retorno; si no, va en una temporal de ese
+  tipo, así que la expresión conserva su tipo. Lo que sigue al primer
+  `return` del llamado no se copia (es inalcanzable).
+- Solo se hace inlining si los tipos de los argumentos coinciden con los
+  de los parámetros (si no, la asignación al parámetro ocultaría el
+  error), si ningún global o función que usa el llamado queda tapado por
+  un local del llamador y si el llamado no tiene errores de tipos, nombres
+  sin resolver ni locales redeclarados (cada copia repetiría el error).
+  Así el análisis semántico da los mismos errores antes y después.
+- El cuerpo pasa a evaluarse antes que el resto de la sentencia. Para no
+  cambiar el orden de los efectos, en cada sentencia solo se toma la
+  primera llamada en orden de evaluación, y solo si lo que se evalúa antes
+  que ella son números y locales (no hay globales que el llamado pueda
+  modificar). Después de cada inlining se vuelve a buscar en la sentencia.
+- Presupuesto: el llamado debe tener a lo sumo `max_callee` nodos y un
+  llamador deja de crecer al pasar de `max_growth` veces su tamaño. Las
+  funciones que están en un ciclo del grafo de llamadas (callgraph.py) no
+  se copian. Las funciones se procesan de abajo hacia arriba, así que un
+  llamado ya trae hechos sus propios inlinings.
+
+Solo cambian los cuerpos de función; las declaraciones quedan (pueden
+llamarse desde el nivel superior o desde otros módulos). Al final se
+vuelve a resolver el AST (resolver.py). `to_source()` imprime el programa
+resultante en la sintaxis de entrada.
+
+Uso:
+    python inline.py ARCHIVO [--max-callee 24] [--max-growth 4] [--print]
+"""
+import sys, argparse
+
+from lexer_parser import (Lexer, Parser, LexError, ParseError, Node, VarDeclNode, FuncDeclNode,
+                          AssignNode, ReturnNode, BinaryOpNode, FuncCallNode, NumberNode,
+                          IdentifierNode, ImportNode, count_nodes)
+from resolver import resolve
+from callgraph import CallGraph
+
+MAX_CALLEE = 24     # nodos de un llamado: parámetros y sentencias hasta el return
+MAX_GROWTH = 4.0    # tamaño máximo de un llamador respecto del original
+
+def _size(nodes):
+    return sum(count_nodes(n) for n in nodes)
+
+def _names(ast):
+    """Todos los nombres que aparecen en el programa."""
+    names, pending = set(), [ast]
+    while pending:
+        n = pending.pop()
+        if isinstance(n, list):
+            pending.extend(n)
+        elif isinstance(n, Node):
+            for k, v in vars(n).items():
+                if k in ('name', 'module'):
+                    names.add(v)
+                elif k != 'target' and isinstance(v, (Node, list)):
+                    pending.append(v)
+    return names
+
+def _expr_of(stmt):
+    return stmt.expr if isinstance(stmt, (AssignNode, ReturnNode)) else stmt
+
+def _has_call(expr):
+    pending = [expr]
+    while pending:
+        n = pending.pop()
+        if isinstance(n, FuncCallNode):
+            return True
+        if isinstance(n, BinaryOpNode):
+            pending += (n.left, n.right)
+    return False
+
+class Inliner:
+    def __init__(self, ast, max_callee=MAX_CALLEE, max_growth=MAX_GROWTH):
+        self.ast = ast
+        self.max_callee, self.max_growth = max_callee, max_growth
+        self.inlined = 0
+        self.used = _names(ast)
+        self.counter = 0
+        self.info = {}          # id(FuncDeclNode) -> datos del llamado, o None
+        self.global_types = {}  # la primera declaración gana, como en resolver.py
+        for d in ast.decls:
+            if isinstance(d, ImportNode):
+                for name, vtype in Node.interfaces.get(d.module, {}).get('globals', {}).items():
+                    self.global_types.setdefault(name, vtype)
+            elif isinstance(d, VarDeclNode):
+                self.global_types.setdefault(d.name, d.vtype)
+
+    def run(self):
+        self.bad = {id(n) for n in resolve(self.ast).unresolved}
+        graph = CallGraph(self.ast)
+        comps = graph.components()
+        recursive = {i for c in graph.recursive(comps) for i in c}
+        for c in comps:     # de abajo hacia arriba
+            for i in c:
+                f = graph.funcs[i]
+                self.inline_into(f)
+                self.info[id(f)] = None if i in recursive else self.callee_info(f)
+        resolve(self.ast)
+        return self.ast
+
+    # ------------------------------------------------
+    # Llamados
+    # ------------------------------------------------
+    def callee_info(self, f):
+        """
+        (sentencias hasta el return, globales y funciones que usa, locales
+        que asigna) o None si no se puede copiar. Un llamado con errores de
+        tipos no se copia: cada copia repetiría el error en el llamador.
+        """
+        stmts = []
+        for s in f.body:
+            stmts.append(s)
+            if isinstance(s, ReturnNode):
+                break
+        if _size(f.params) + _size(stmts) > self.max_callee:
+            return None
+        # Mismo recorrido en orden que el resolver: un nombre es local desde su declaración
+        local = {p.name: p.ptype for p in f.params}
+        external, assigned = set(), set()
+        for s in stmts:
+            if id(s) in self.bad:
+                return None
+            if isinstance(s, VarDeclNode):
+                if s.name in local:
+                    return None     # redeclaración
+                local[s.name] = s.vtype
+                continue
+            if isinstance(s, ReturnNode) and self.type_of(s.expr, local) != f.return_type:
+                return None
+            if isinstance(s, AssignNode):
+                (assigned if s.name in local else external).add(s.name)
+            pending = [_expr_of(s)]
+            while pending:
+                n = pending.pop()
+                if id(n) in self.bad:
+                    return None
+                if isinstance(n, IdentifierNode):
+                    if n.name not in local:
+                        external.add(n.name)
+                elif isinstance(n, BinaryOpNode):
+                    pending += (n.left, n.right)
+                elif isinstance(n, FuncCallNode):
+                    if not self.call_ok(n, local):
+                        return None
+                    external.add(n.name)
+                    pending.extend(n.args)
+        return stmts, external, assigned
+
+    # ------------------------------------------------
+    # Llamadores
+    # ------------------------------------------------
+    def inline_into(self, f):
+        types = {p.name: p.ptype for p in f.params}     # locales declarados hasta aquí
+        names = set(types) | {s.name for s in f.body if isinstance(s, VarDeclNode)}
+        body = f.body
+        limit = self.max_growth * _size(f.params + body)
+        size = _size(f.params + body)
+        i = 0
+        while i < len(body):
+            stmt = body[i]
+            if isinstance(stmt, VarDeclNode):
+                types.setdefault(stmt.name, stmt.vtype)
+            while size <= limit and not isinstance(stmt, VarDeclNode):
+                found = self.first_call(stmt, types)
+                if found is None:
+                    break
+                call, replace = found
+                info = self.info.get(id(call.target))
+                if info is None or not self.fits(call, info, replace, types, names):
+                    break
+                pre, result = self.expand(call, info, replace is None, types)
+                body[i:i] = pre
+                i += len(pre)
+                size += _size(pre) - count_nodes(call) + (count_nodes(result) if result else 0)
+                self.inlined += 1
+                if replace is None:         # la sentencia era la llamada
+                    del body[i]
+                    i -= 1
+                    break
+                replace(result)
+            i += 1
+
+    def first_call(self, stmt, types):
+        """
+        (llamada, función que la reemplaza en su padre) para la primera
+        llamada en orden de evaluación, o None si no hay o si antes se evalúa
+        algo que no es un número o un local. Si la sentencia es la llamada,
+        la función es None.
+        """
+        root = _expr_of(stmt)
+        setter = (lambda v: setattr(stmt, 'expr', v)) if root is not stmt else None
+        impure = False
+        before = {}     # id(llamada) -> impure al empezar sus argumentos
+        work = [(root, setter, False)]
+        while work:
+            n, setter, done = work.pop()
+            if isinstance(n, IdentifierNode):
+                impure = impure or n.name not in types
+            elif isinstance(n, BinaryOpNode):
+                work.append((n.right, self._setter(n, 'right'), False))
+                work.append((n.left, self._setter(n, 'left'), False))
+            elif isinstance(n, FuncCallNode):
+                if done:    # sin llamadas en los argumentos: es la primera
+                    return None if before[id(n)] else (n, setter)
+                before[id(n)] = impure
+                work.append((n, setter, True))
+                for k in range(len(n.args) - 1, -1, -1):
+                    work.append((n.args[k], self._setter(n.args, k), False))
+        return None
+
+    @staticmethod
+    def _setter(parent, key):
+        if isinstance(parent, list):
+            return lambda v: parent.__setitem__(key, v)
+        return lambda v: setattr(parent, key, v)
+
+    def fits(self, call, info, replace, types, names):
+        stmts, external, _ = info
+        if replace is not None and not (stmts and isinstance(stmts[-1], ReturnNode)):
+            return False    # se usa el valor pero el llamado no retorna
+        return not external & names and self.call_ok(call, types)
+
+    def call_ok(self, call, types):
+        """La llamada pasa tantos argumentos como parámetros y del mismo tipo."""
+        if call.target is None or len(call.args) != len(call.target.params):
+            return False
+        return all(self.type_of(a, types) == p.ptype for a, p in zip(call.args, call.target.params))
+
+    def type_of(self, expr, types):
+        """Tipo estático de una expresión del llamador, o None si no se conoce."""
+        if isinstance(expr, NumberNode):
+            return expr.ntype
+        if isinstance(expr, IdentifierNode):
+            return types.get(expr.name) if expr.name in types else self.global_types.get(expr.name)
+        if isinstance(expr, FuncCallNode):
+            return expr.target.return_type if expr.target is not None else None
+        lt, rt = self.type_of(expr.left, types), self.type_of(expr.right, types)
+        if lt is None or rt is None:
+            return None
+        return 'float' if 'float' in (lt, rt) else 'int'
+
+    # ------------------------------------------------
+    # Copia del cuerpo
+    # ------------------------------------------------
+    def fresh(self, callee, names):
+        """Sufijo `k` para que `callee_nombre_k` no exista en el programa."""
+        while True:
+            self.counter += 1
+            new = {n: f"{callee}_{n}_{self.counter}" for n in names}
+            if not self.used.intersection(new.values()):
+                self.used.update(new.values())
+                return new
+
+    def expand(self, call, info, statement, types):
+        """
+        Sentencias a insertar antes de la llamada y la expresión que la
+        reemplaza. Un argumento que es un número o un local del llamador se
+        usa directamente si el llamado no asigna ese parámetro, y el valor
+        de retorno va en su lugar si ya tiene el tipo de retorno.
+        """
+        stmts, _, assigned = info
+        callee, pos = call.target, call.pos
+        ret = stmts[-1] if stmts and isinstance(stmts[-1], ReturnNode) else None
+        direct = [p.name not in assigned and (isinstance(a, NumberNode) or
+                                              isinstance(a, IdentifierNode) and a.name in types)
+                  for p, a in zip(callee.params, call.args)]
+        local = [p.name for p, d in zip(callee.params, direct) if not d]
+        local += [s.name for s in stmts if isinstance(s, VarDeclNode)]
+        rename = self.fresh(callee.name, local + ['ret'])
+
+        pre, visible = [], {}
+        for p, a, d in zip(callee.params, call.args, direct):
+            if d:
+                visible[p.name] = a
+            else:
+                visible[p.name] = rename[p.name]
+                pre += (VarDeclNode(p.ptype, rename[p.name], pos), AssignNode(rename[p.name], a, pos))
+        for s in stmts:
+            if isinstance(s, VarDeclNode):
+                visible[s.name] = rename[s.name]
+                pre.append(VarDeclNode(s.vtype, rename[s.name], s.pos))
+            elif isinstance(s, AssignNode):
+                pre.append(AssignNode(visible.get(s.name, s.name), self.copy(s.expr, visible), s.pos))
+            elif isinstance(s, FuncCallNode):
+                pre.append(self.copy(s, visible))
+        for s in pre:
+            if isinstance(s, VarDeclNode):
+                types[s.name] = s.vtype
+        if ret is None or statement and not _has_call(ret.expr):
+            return pre, None
+        value = self.copy(ret.expr, visible)
+        if statement and isinstance(value, FuncCallNode):
+            return pre + [value], None
+        if not statement and self.type_of(value, types) == callee.return_type:
+            value.pos = pos     # los errores sobre el valor se reportan en la llamada
+            return pre, value
+        tmp = rename['ret']
+        types[tmp] = callee.return_type
+        pre += (VarDeclNode(callee.return_type, tmp, pos), AssignNode(tmp, value, ret.pos))
+        return pre, IdentifierNode(tmp, pos)
+
+    def copy(self, expr, visible):
+        if isinstance(expr, NumberNode):
+            return NumberNode(expr.value, expr.pos)
+        if isinstance(expr, IdentifierNode):
+            new = visible.get(expr.name, expr.name)
+            return IdentifierNode(new, expr.pos) if isinstance(new, str) else self.copy(new, {})
+        if isinstance(expr, BinaryOpNode):
+            return BinaryOpNode(self.copy(expr.left, visible), expr.op, self.copy(expr.right, visible), expr.pos)
+        new = FuncCallNode(expr.name, [self.copy(a, visible) for a in expr.args], expr.pos)
+        new.target = expr.target
+        return new
+
+def inline(ast, max_callee=MAX_CALLEE, max_growth=MAX_GROWTH):
+    """Hace el inlining en el lugar; retorna el Inliner (con `inlined`)."""
+    inliner = Inliner(ast, max_callee, max_growth)
+    inliner.run()
+    return inliner
+
+# ------------------------------------------------
+# Impresión
+# ------------------------------------------------
+OPS = {'PLUS': '+', 'MINUS': '-', 'TIMES': '*', 'DIVIDE': '/', 'LT': '<', 'LE': '<=',
+       'GT': '>', 'GE': '>=', 'EQ': '==', 'NE': '!='}
+PRECEDENCE = {'EQ': 1, 'NE': 1, 'LT': 2, 'LE': 2, 'GT': 2, 'GE': 2,
+              'PLUS': 3, 'MINUS': 3, 'TIMES': 4, 'DIVIDE': 4}
+
+def _expr_source(n, parent=0):
+    """Expresión con los paréntesis justos (los operadores asocian a izquierda)."""
+    if isinstance(n, NumberNode):
+        if isinstance(n.value, float):
+            s = repr(n.value)
+            return s if 'e' not in s else f"{n.value:f}"
+        return str(n.value)
+    if isinstance(n, IdentifierNode):
+        return n.name
+    if isinstance(n, FuncCallNode):
+        return f"{n.name}({', '.join(_expr_source(a) for a in n.args)})"
+    p = PRECEDENCE[n.op]
+    s = f"{_expr_source(n.left, p)} {OPS[n.op]} {_expr_source(n.right, p + 1)}"
+    return f"({s})" if p < parent else s
+
+def _stmt_source(s):
+    if isinstance(s, VarDeclNode):
+        return f"{s.vtype} {s.name};"
+    if isinstance(s, AssignNode):
+        return f"{s.name} = {_expr_source(s.expr)};"
+    if isinstance(s, ReturnNode):
+        return f"return {_expr_source(s.expr)};"
+    if isinstance(s, ImportNode):
+        return f"import {s.module};"
+    return f"{_expr_source(s)};"
+
+def to_source(ast):
+    """Programa en la sintaxis de entrada (vuelve a parsear al mismo AST)."""
+    out = []
+    for d in ast.decls:
+        if isinstance(d, FuncDeclNode):
+            params = ', '.join(f"{p.ptype} {p.name}" for p in d.params)
+            out.append(f"{d.return_type} {d.name}({params}) {{")
+            out.extend(f"    {_stmt_source(s)}" for s in d.body)
+            out.append("}")
+        else:
+            out.append(_stmt_source(d))
+    return '\n'.join(out) + '\n'
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Inlining de funciones pequeñas no recursivas')
+    ap.add_argument('file')
+    ap.add_argument('--max-callee', type=int, default=MAX_CALLEE, help='nodos máximos de un llamado')
+    ap.add_argument('--max-growth', type=float, default=MAX_GROWTH, help='crecimiento máximo de un llamador')
+    ap.add_argument('--print', action='store_true', help='imprime el programa resultante')
+    args = ap.parse_args()
+    with open(args.file, encoding='utf-8') as f:
+        code = f.read()
+    try:
+        lexer = Lexer(code)
+        ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+    except (LexError, ParseError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    before = count_nodes(ast)
+    r = inline(ast, args.max_callee, args.max_growth)
+    print(f"{r.inlined} llamadas reemplazadas, nodos: {before} -> {count_nodes(ast)}")
+    if args.print:
+        print(to_source(ast), end='')
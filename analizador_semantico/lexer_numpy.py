@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Lexer vectorizado con NumPy para el lenguaje de lexer_parser.py.
+
+Todo el trabajo por carácter se hace con operaciones de arreglo:
+
+1. Los bytes del fuente pasan a clases de carácter con una sola `take`
+   sobre una tabla de 256 entradas.
+2. Los límites de las corridas alfanuméricas salen de `diff`/`flatnonzero`.
+   Cada corrida es un ID, o un NUMBER seguido opcionalmente de un ID
+   ('12abc' son dos tokens, como con la regex).
+3. Los NUMBER reales se arman uniendo `dígitos . dígitos` entre corridas
+   vecinas. Los operadores de dos caracteres (==, !=, <=, >=) se emparejan
+   en forma vectorial. En las cadenas ('1.2.3', '===') se alterna como lo
+   haría el match más largo de izquierda a derecha.
+4. Los tokens quedan en columnas: tipo (índice en BULK_KINDS), inicio y fin.
+
+Si el fuente no es ASCII o tiene un carácter inválido, se delega al lexer
+escalar, que lanza el LexError con la posición exacta. Sin NumPy,
+`tokenize()` usa `Lexer.tokenize_bulk()` directamente.
+"""
+from array import array
+
+from lexer_parser import Lexer, TokenBuffer, BULK_KINDS, BULK_NUMBER, _number
+
+try:
+    import numpy as np
+except ImportError:     # dependencia opcional
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# ------------------------------------------------
+# Tablas
+# ------------------------------------------------
+WS, ALPHA, DIGIT, DOT, OP, OTHER = range(6)
+K_ID, K_NUMBER = BULK_KINDS.index('ID'), BULK_NUMBER
+SINGLE = {'=': 'ASSIGN', '(': 'LPAREN', ')': 'RPAREN', '{': 'LBRACE', '}': 'RBRACE',
+          ';': 'SEMI', ',': 'COMMA', '+': 'PLUS', '-': 'MINUS', '*': 'TIMES',
+          '/': 'DIVIDE', '<': 'LT', '>': 'GT'}
+DOUBLE = {'=': 'EQ', '!': 'NE', '<': 'LE', '>': 'GE'}     # primer carácter de X=
+
+if HAVE_NUMPY:
+    CLASS = np.full(256, OTHER, np.uint8)
+    for c in b' \t\r\n': CLASS[c] = WS
+    for c in range(256):
+        if chr(c).isascii() and (chr(c).isalpha() or chr(c) == '_'): CLASS[c] = ALPHA
+        if chr(c).isascii() and chr(c).isdigit(): CLASS[c] = DIGIT
+    CLASS[ord('.')] = DOT
+    for c in set(SINGLE) | set(DOUBLE): CLASS[ord(c)] = OP
+
+    SINGLE_KIND = np.zeros(256, np.uint8)       # 0: '!' solo no es un token
+    for c, k in SINGLE.items(): SINGLE_KIND[ord(c)] = BULK_KINDS.index(k)
+    DOUBLE_KIND = np.zeros(256, np.uint8)
+    for c, k in DOUBLE.items(): DOUBLE_KIND[ord(c)] = BULK_KINDS.index(k)
+
+# ------------------------------------------------
+# Escaneo vectorial
+# ------------------------------------------------
+def _alternate(cand):
+    """
+    En cada tramo de True consecutivos de `cand`, deja solo las posiciones
+    pares del tramo: si i se une con i+1, i+1 ya no puede unirse con i+2.
+    """
+    idx = np.arange(cand.size)
+    seg_start = np.where(cand & ~np.concatenate(([False], cand[:-1])), idx, 0)
+    np.maximum.accumulate(seg_start, out=seg_start)
+    return cand & ((idx - seg_start) % 2 == 0)
+
+def scan(code):
+    """
+    (kinds, starts, ends) como arreglos de NumPy, sin el EOF; None si hay
+    que delegar al lexer escalar (fuente no ASCII o carácter inválido).
+    """
+    try:
+        data = code.encode('ascii')
+    except UnicodeEncodeError:
+        return None
+    b = np.frombuffer(data, np.uint8)
+    n = b.size
+    cls = CLASS.take(b)
+    if (cls == OTHER).any():
+        return None
+
+    # --- corridas alfanuméricas: ID, o NUMBER + ID opcional ---
+    alnum = (cls == ALPHA) | (cls == DIGIT)
+    edges = np.diff(alnum.view(np.int8), prepend=0, append=0)
+    rs = np.flatnonzero(edges == 1)         # inicio de cada corrida
+    re_ = np.flatnonzero(edges == -1)       # fin (exclusivo)
+    is_num = cls[rs] == DIGIT
+    ra = rs.copy()                          # fin del prefijo de dígitos
+    if is_num.any():
+        non_digit = np.append(np.flatnonzero(cls != DIGIT), n)
+        num_rs = rs[is_num]
+        ra[is_num] = non_digit[np.searchsorted(non_digit, num_rs)]
+
+    # --- reales: corrida de solo dígitos, '.', corrida que empieza con dígito ---
+    nxt = np.minimum(re_, n - 1)
+    cand = (ra == re_) & (re_ < n) & (b[nxt] == ord('.'))
+    cand[:-1] &= (rs[1:] == re_[:-1] + 1) & is_num[1:]
+    cand[-1:] = False
+    merge = _alternate(cand)
+    num_end = ra.copy()
+    num_end[:-1] = np.where(merge[:-1], ra[1:], ra[:-1])
+    absorbed = np.zeros_like(merge)
+    absorbed[1:] = merge[:-1]               # su parte numérica ya es la fracción
+    dots_used = re_[merge]
+
+    # --- operadores ---
+    ops = np.flatnonzero(cls == OP)
+    ob = b[ops]
+    after = np.append(b, 0)[ops + 1]
+    pair = _alternate((DOUBLE_KIND.take(ob) > 0) & (after == ord('=')))
+    second = np.zeros(ops.size, bool)
+    second[1:] = pair[:-1] & (ops[1:] == ops[:-1] + 1)
+    keep = ~second
+    op_kind = np.where(pair, DOUBLE_KIND.take(ob), SINGLE_KIND.take(ob))[keep]
+    if (op_kind == 0).any():
+        return None                          # '!' sin '='
+    if np.count_nonzero(cls == DOT) != dots_used.size:
+        return None                          # '.' fuera de un real
+
+    # --- columnas, en orden de aparición ---
+    kind_at = np.zeros(n, np.uint8)
+    end_at = np.zeros(n, np.int32 if n < 2**31 else np.int64)
+    id_start = np.where(is_num, ra, rs)
+    has_id = id_start < re_
+    kind_at[id_start[has_id]] = K_ID
+    end_at[id_start[has_id]] = re_[has_id]
+    num = is_num & ~absorbed
+    kind_at[rs[num]] = K_NUMBER
+    end_at[rs[num]] = num_end[num]
+    op_starts = ops[keep]
+    kind_at[op_starts] = op_kind
+    end_at[op_starts] = op_starts + np.where(pair[keep], 2, 1)
+    starts = np.flatnonzero(kind_at)
+    return kind_at[starts], starts, end_at[starts]
+
+def tokenize(code):
+    """Mismo TokenBuffer que `Lexer(code).tokenize_bulk()`."""
+    cols = scan(code) if HAVE_NUMPY else None
+    if cols is None:
+        return Lexer(code).tokenize_bulk()
+    kinds, starts, ends = cols
+    values = list(map(code.__getitem__, map(slice, starts.tolist(), ends.tolist())))
+    nums = np.flatnonzero(kinds == K_NUMBER).tolist()
+    for i, val in zip(nums, map(_number, map(values.__getitem__, nums))):
+        values[i] = val
+    kinds_a = array('B', kinds.tobytes()); kinds_a.append(0)
+    starts_a = array('l', starts.astype(np.dtype('l')).tobytes()); starts_a.append(len(code))
+    values.append(None)
+    return TokenBuffer(kinds_a, starts_a, values)
@@ -1,13 +1,105 @@
 #!/usr/bin/env python3
-import re, sys
+import re, sys, json, time, tracemalloc
+from array import array
+from contextlib import contextmanager, nullcontext
+from bisect import bisect_right
+from itertools import compress
 
 # ----------------------------
 # Semantic Analyzer Classes
 # ----------------------------
+class LineIndex:
+    """Inicios de línea del fuente; offset -> (línea, columna) bajo demanda."""
+    def __init__(self, text):
+        self.text = text
+        self.starts = None
+
+    def position(self, offset):
+        if self.starts is None:
+            # Se construye una sola vez, al primer diagnóstico que la necesite
+            self.starts = [0]
+            self.starts.extend(mo.end() for mo in re.finditer('\n', self.text))
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+# Mensajes por código: se formatean recién al mostrarlos
+MESSAGES = {
+    'message':          "{0}",
+    'var_redefined':    "Error: redefinición de variable '{0}' en ámbito '{1}'.",
+    'func_redefined':   "Error: redefinición de función '{0}'.",
+    'var_undeclared':   "Error: variable '{0}' no declarada.",
+    'assign_mismatch':  "Error: asignación de '{0}' a '{1}' en '{2}'.",
+    'return_mismatch':  "Error: return '{0}' no coincide con '{1}' en función '{2}'.",
+    'type_mix':         "Error: mezcla de tipos '{0}' y '{1}' en operación '{2}'.",
+    'func_undeclared':  "Error: función '{0}' no declarada.",
+    'arg_count':        "Error: '{0}' espera {1} args, recibió {2}.",
+    'arg_type':         "Error: paso '{0}' donde se espera '{1}' en '{2}'.",
+    'id_undeclared':    "Error: identificador '{0}' no declarado.",
+    'module_not_found': "Error: módulo '{0}' no encontrado.",
+    'too_many_errors':  "Error: demasiados errores ({0}); se detiene el análisis.",
+}
+
+# Un nombre sin declarar se reporta una sola vez por función
+ONCE_PER_SCOPE = {'var_undeclared', 'func_undeclared', 'id_undeclared'}
+
+MAX_ERRORS = 1000
+
+class Diagnostic:
+    """Error semántico sin formatear: código, offset y argumentos del mensaje."""
+    __slots__ = ('code', 'pos', 'args')
+
+    def __init__(self, code, pos, args):
+        self.code, self.pos, self.args = code, pos, args
+
+    def message(self, lines=None):
+        msg = MESSAGES[self.code].format(*self.args)
+        if self.pos is not None and lines is not None:
+            line, col = lines.position(self.pos)
+            msg = f"{line}:{col}: {msg}"
+        return msg
+
+    def to_dict(self, lines=None):
+        d = {'code': self.code, 'offset': self.pos, 'args': list(self.args),
+             'message': MESSAGES[self.code].format(*self.args)}
+        if self.pos is not None and lines is not None:
+            d['line'], d['column'] = lines.position(self.pos)
+        return d
+
+class TooManyErrors(Exception):
+    """Se alcanzó `max_errors`; ProgramNode.validate_types la atrapa y termina."""
+
 class SymbolTable:
-    def __init__(self):
+    def __init__(self, lines=None, max_errors=MAX_ERRORS):
         self.scopes = [{}]    # stack of dict: name -> (kind, type, param_types)
-        self.errors = []
+        self.diagnostics = []
+        self.lines = lines
+        self.max_errors = max_errors    # None: sin límite
+        self.suppressed = 0             # repetidos que no se guardaron
+        self._seen = set()
+
+    def report(self, code, pos, *args):
+        key = (code, args, Node.ambito) if code in ONCE_PER_SCOPE else (code, args, pos)
+        if key in self._seen:
+            self.suppressed += 1
+            return
+        self._seen.add(key)
+        self.diagnostics.append(Diagnostic(code, pos, args))
+        if self.max_errors is not None and len(self.diagnostics) >= self.max_errors:
+            self.diagnostics.append(Diagnostic('too_many_errors', None, (self.max_errors,)))
+            raise TooManyErrors
+
+    def error(self, msg, pos=None):
+        """Mensaje ya armado (sin código propio)."""
+        self.report('message', pos, msg)
+
+    @property
+    def errors(self):
+        """Mensajes formateados, con prefijo `línea:columna` si hay `lines`."""
+        return [d.message(self.lines) for d in self.diagnostics]
+
+    def to_json(self):
+        return json.dumps({'diagnostics': [d.to_dict(self.lines) for d in self.diagnostics],
+                           'suppressed': self.suppressed}, ensure_ascii=False, indent=2)
 
     def enter_scope(self, name):
         self.scopes.append({})
@@ -19,20 +111,16 @@ class SymbolTable:
     def current_scope(self):
         return self.scopes[-1]
 
-    def declare_var(self, name, vtype):
+    def declare_var(self, name, vtype, pos=None):
         if name in self.current_scope:
-            self.errors.append(
-                f"Error: redefinición de variable '{name}' en ámbito '{Node.ambito}'."
-            )
+            self.report('var_redefined', pos, name, Node.ambito)
         else:
             self.current_scope[name] = ("var", vtype)
 
-    def declare_func(self, name, return_type, param_types):
+    def declare_func(self, name, return_type, param_types, pos=None):
         global_scope = self.scopes[0]
         if name in global_scope:
-            self.errors.append(
-                f"Error: redefinición de función '{name}'."
-            )
+            self.report('func_redefined', pos, name)
         else:
             global_scope[name] = ("func", return_type, param_types)
 
@@ -45,44 +133,63 @@ class SymbolTable:
 class Node:
     tabla_simbolos = None
     ambito = ''
+    interfaces = {}   # módulo -> interfaz (ver modules.py), para `import`
+    pos = None    # offset del token inicial en el fuente
+    slot = None   # (profundidad, índice) de una variable; lo asigna resolver.py
 
     def validate_types(self):
         raise NotImplementedError
 
 class ProgramNode(Node):
+    frame_size = None   # globales (resolver.py)
+
     def __init__(self, decls):
         self.decls = decls
 
     def validate_types(self):
-        for d in self.decls:
-            d.validate_types()
+        try:
+            for d in self.decls:
+                d.validate_types()
+        except TooManyErrors:
+            pass    # el último diagnóstico ya avisa del corte
 
 class VarDeclNode(Node):
-    def __init__(self, vtype, name):
+    def __init__(self, vtype, name, pos=None):
+        self.pos = pos
         self.vtype = vtype
         self.name = name
 
     def validate_types(self):
-        Node.tabla_simbolos.declare_var(self.name, self.vtype)
+        Node.tabla_simbolos.declare_var(self.name, self.vtype, self.pos)
 
 class ParamNode(Node):
-    def __init__(self, name, ptype):
+    def __init__(self, name, ptype, pos=None):
+        self.pos = pos
         self.name = name
         self.ptype = ptype
 
     def validate_types(self):
-        Node.tabla_simbolos.declare_var(self.name, self.ptype)
+        Node.tabla_simbolos.declare_var(self.name, self.ptype, self.pos)
 
 class FuncDeclNode(Node):
-    def __init__(self, rtype, name, params, body):
+    frame_size = None   # parámetros + locales (resolver.py)
+
+    def __init__(self, rtype, name, params, body, pos=None):
+        self.pos = pos
         self.return_type = rtype
         self.name = name
         self.params = params
-        self.body = body
+        self._body = body   # lista de sentencias, o BodySpan (SkimParser)
+
+    @property
+    def body(self):
+        if isinstance(self._body, BodySpan):
+            self._body = self._body.parse()
+        return self._body
 
     def validate_types(self):
         param_types = [p.ptype for p in self.params]
-        Node.tabla_simbolos.declare_func(self.name, self.return_type, param_types)
+        Node.tabla_simbolos.declare_func(self.name, self.return_type, param_types, self.pos)
         Node.tabla_simbolos.enter_scope(self.name)
         prev = Node.ambito
         Node.ambito = self.name
@@ -94,16 +201,15 @@ class FuncDeclNode(Node):
         Node.ambito = prev
 
 class AssignNode(Node):
-    def __init__(self, name, expr):
+    def __init__(self, name, expr, pos=None):
+        self.pos = pos
         self.name = name
         self.expr = expr
 
     def validate_types(self):
         info = Node.tabla_simbolos.lookup(self.name)
         if not info or info[0] != 'var':
-            Node.tabla_simbolos.errors.append(
-                f"Error: variable '{self.name}' no declarada."
-            )
+            Node.tabla_simbolos.report('var_undeclared', self.pos, self.name)
             return
         var_type = info[1]
         expr_type = self.expr.validate_types()
@@ -115,13 +221,12 @@ class AssignNode(Node):
 
         # En los demás casos, si no coinciden, error:
         if expr_type and expr_type != var_type:
-            Node.tabla_simbolos.errors.append(
-                f"Error: asignación de '{expr_type}' a '{var_type}' en '{self.name}'."
-            )
+            Node.tabla_simbolos.report('assign_mismatch', self.pos, expr_type, var_type, self.name)
 
 
 class ReturnNode(Node):
-    def __init__(self, expr):
+    def __init__(self, expr, pos=None):
+        self.pos = pos
         self.expr = expr
 
     def validate_types(self):
@@ -130,13 +235,12 @@ class ReturnNode(Node):
         if func_info and func_info[0] == 'func':
             rtype = func_info[1]
             if expr_type and expr_type != rtype:
-                Node.tabla_simbolos.errors.append(
-                    f"Error: return '{expr_type}' no coincide con '{rtype}' en función '{Node.ambito}'."
-                )
+                Node.tabla_simbolos.report('return_mismatch', self.pos, expr_type, rtype, Node.ambito)
         return expr_type
 
 class BinaryOpNode(Node):
-    def __init__(self, left, op, right):
+    def __init__(self, left, op, right, pos=None):
+        self.pos = pos
         self.left = left
         self.op = op
         self.right = right
@@ -154,13 +258,14 @@ class BinaryOpNode(Node):
             return lt
         # En cualquier otro caso, es un error:
         if lt is not None and rt is not None:
-            Node.tabla_simbolos.errors.append(
-                f"Error: mezcla de tipos '{lt}' y '{rt}' en operación '{self.op}'."
-            )
+            Node.tabla_simbolos.report('type_mix', self.pos, lt, rt, self.op)
         return None
 
 class FuncCallNode(Node):
-    def __init__(self, name, args):
+    target = None   # FuncDeclNode llamado (resolver.py)
+
+    def __init__(self, name, args, pos=None):
+        self.pos = pos
         self.name = name
         self.args = args
 
@@ -168,26 +273,21 @@ class FuncCallNode(Node):
         info = Node.tabla_simbolos.lookup(self.name)
         # Si la función no está declarada, ahora sí reportamos error
         if not info or info[0] != 'func':
-            Node.tabla_simbolos.errors.append(
-                f"Error: función '{self.name}' no declarada."
-            )
+            Node.tabla_simbolos.report('func_undeclared', self.pos, self.name)
             return None
         # Si existe, comprobamos parámetros
         _, rtype, ptypes = info
         if len(ptypes) != len(self.args):
-            Node.tabla_simbolos.errors.append(
-                f"Error: '{self.name}' espera {len(ptypes)} args, recibió {len(self.args)}."
-            )
+            Node.tabla_simbolos.report('arg_count', self.pos, self.name, len(ptypes), len(self.args))
         for expected, arg in zip(ptypes, self.args):
             at = arg.validate_types()
             if at and at != expected:
-                Node.tabla_simbolos.errors.append(
-                    f"Error: paso '{at}' donde se espera '{expected}' en '{self.name}'."
-                )
+                Node.tabla_simbolos.report('arg_type', arg.pos, at, expected, self.name)
         return rtype
 
 class NumberNode(Node):
-    def __init__(self, value):
+    def __init__(self, value, pos=None):
+        self.pos = pos
         self.value = value
         self.ntype = 'float' if isinstance(value, float) else 'int'
 
@@ -195,23 +295,120 @@ class NumberNode(Node):
         return self.ntype
 
 class IdentifierNode(Node):
-    def __init__(self, name):
+    def __init__(self, name, pos=None):
+        self.pos = pos
         self.name = name
 
     def validate_types(self):
         info = Node.tabla_simbolos.lookup(self.name)
         if not info:
-            Node.tabla_simbolos.errors.append(
-                f"Error: identificador '{self.name}' no declarado."
-            )
+            Node.tabla_simbolos.report('id_undeclared', self.pos, self.name)
             return None
         if info[0] == 'var':
             return info[1]
         return None
 
+class ImportNode(Node):
+    """`import modulo;`: declara las funciones y globales que exporta otro archivo."""
+    def __init__(self, module, pos=None):
+        self.pos = pos
+        self.module = module
+
+    def validate_types(self):
+        iface = Node.interfaces.get(self.module)
+        if iface is None:
+            Node.tabla_simbolos.report('module_not_found', self.pos, self.module)
+            return
+        for name, (rtype, ptypes) in iface['functions'].items():
+            Node.tabla_simbolos.declare_func(name, rtype, ptypes, self.pos)
+        for name, vtype in iface['globals'].items():
+            Node.tabla_simbolos.declare_var(name, vtype, self.pos)
+
 # ----------------------------
 # Lexer
 # ----------------------------
+class TokenSpecError(Exception): pass
+
+# Un literal es una regex sin metacaracteres (solo escapes de símbolos: r"\+")
+_literal_regex = re.compile(r"(?:\\[^A-Za-z0-9]|[^\\.^$*+?{}\[\]|()])+")
+_probe_chars = [chr(c) for c in range(33, 127)]
+# Cadenas de prueba para reglas que no son literales: uno y dos caracteres
+_probe_strings = _probe_chars + [' ', '\t', '\n'] + [a + b for a in _probe_chars for b in _probe_chars]
+
+def _literal(regex):
+    """Texto exacto que reconoce `regex`, o None si no es un literal."""
+    if not _literal_regex.fullmatch(regex):
+        return None
+    return re.sub(r"\\(.)", r"\1", regex)
+
+def compile_token_spec(spec):
+    """
+    Ordena `spec` para que la alternación de `re` respete el match más largo
+    y verifica, al construir el lexer, que ninguna regla quede oculta.
+
+    Los literales (operadores y delimitadores) se agrupan en la posición del
+    primero de ellos, de mayor a menor longitud: '==' antes que '=', '<='
+    antes que '<', sin importar el orden en que se escribieron. Se lanza
+    TokenSpecError si hay nombres repetidos, reglas que aceptan la cadena
+    vacía o tienen grupos de captura, literales que otra regla tapa, reglas
+    detrás de un comodín, o reglas con regex que otra anterior tapa.
+
+    Para una regla con regex no se puede comparar el lenguaje completo:
+    se prueba con todas las cadenas de uno y dos caracteres ASCII visibles
+    (más espacio, tab y salto de línea). Si la regla reconoce alguna y
+    nunca gana en ninguna, está oculta. Una regla que solo reconoce
+    cadenas más largas, o que pierde únicamente en ellas, no se detecta.
+    """
+    names = [n for n,_ in spec]
+    dup = sorted({n for n in names if names.count(n) > 1})
+    if dup:
+        raise TokenSpecError(f"Reglas duplicadas: {', '.join(dup)}")
+    for n,r in spec:
+        rx = re.compile(r)
+        if rx.match(''):
+            raise TokenSpecError(f"La regla {n} acepta la cadena vacía")
+        if rx.groups:
+            # El modo bulk identifica la regla por `lastindex`
+            raise TokenSpecError(f"La regla {n} tiene grupos de captura; usa (?:...)")
+
+    literals = sorted((nr for nr in spec if _literal(nr[1]) is not None),
+                      key=lambda nr: -len(_literal(nr[1])))
+    ordered = []
+    for n,r in spec:
+        if _literal(r) is None:
+            ordered.append((n,r))
+        elif literals:
+            ordered.extend(literals); literals = []
+
+    wildcards = [n for n,r in ordered if all(re.fullmatch(r, c) for c in _probe_chars)]
+    if wildcards and wildcards[0] != ordered[-1][0]:
+        order = [n2 for n2,_ in ordered]
+        rest = order[order.index(wildcards[0])+1:]
+        raise TokenSpecError(f"Reglas inalcanzables después del comodín {wildcards[0]}: {', '.join(rest)}")
+
+    regex = re.compile("|".join(f"(?P<{n}>{r})" for n,r in ordered))
+    for n,r in ordered:
+        lit = _literal(r)
+        if lit is None:
+            rx = re.compile(r)
+            probes = [p for p in _probe_strings if rx.fullmatch(p)]
+            winners = {(mo.lastgroup, mo.end() == len(p)) for p in probes for mo in [regex.match(p)]}
+            if probes and (n, True) not in winners:
+                other = sorted(w for w,_ in winners if w != n)
+                raise TokenSpecError(f"La regla {n} queda oculta por {', '.join(other)}")
+            continue
+        mo = regex.match(lit)
+        if mo.lastgroup != n or mo.end() != len(lit):
+            raise TokenSpecError(f"La regla {n} ({lit!r}) queda oculta por {mo.lastgroup}")
+        # Un literal que también es un lexema válido de otra regla (p. ej. una
+        # palabra reservada frente a ID) partiría 'iffy' en 'if' + 'fy'.
+        for n2,r2 in ordered:
+            if _literal(r2) is None and n2 not in wildcards and re.fullmatch(r2, lit):
+                raise TokenSpecError(
+                    f"El literal {lit!r} de {n} también es un {n2}; clasifícalo después del match"
+                )
+    return ordered
+
 token_spec = [
     ('NUMBER',  r"\d+\.\d+|\d+"),
     ('ID',      r"[A-Za-z_][A-Za-z0-9_]*"),
@@ -230,94 +427,160 @@ token_spec = [
     ('SKIP',    r"[ \t\r\n]+"),
     ('MISMATCH',r"."),
 ]
+token_spec = compile_token_spec(token_spec)
 tok_regex = re.compile("|".join(f"(?P<{n}>{r})" for n,r in token_spec))
 
-class LexError(Exception): pass
+# Modo bulk: el espacio en blanco se consume dentro de la misma regex (detrás
+# de cada token) y el tipo se obtiene de `lastindex`, sin grupos con nombre.
+bulk_spec  = [(n,r) for n,r in token_spec if n != 'SKIP']
+bulk_regex = re.compile("(?:" + "|".join(f"({r})" for _,r in bulk_spec) + ")[ \t\r\n]*")
+lead_regex = re.compile(r"[ \t\r\n]*")
+BULK_KINDS = ['EOF'] + [n for n,_ in bulk_spec]     # índice == lastindex
+BULK_NUMBER   = BULK_KINDS.index('NUMBER')
+BULK_MISMATCH = BULK_KINDS.index('MISMATCH')
+
+class LexError(Exception):
+    def __init__(self, msg, offset=None):
+        super().__init__(msg)
+        self.offset = offset    # offset del carácter inesperado
+
+def _number(val):
+    return float(val) if '.' in val else int(val)
+
+class TokenBuffer:
+    """Tokens en columnas: tipo (índice en BULK_KINDS), offset y valor."""
+    def __init__(self, kinds, starts, values):
+        self.kinds = kinds      # array('B')
+        self.starts = starts    # array('l')
+        self.values = values    # list
+    def __len__(self):
+        return len(self.kinds)
+    def to_tuples(self):
+        # Mismo formato que Lexer.tokenize: (kind, val, offset)
+        return list(zip(map(BULK_KINDS.__getitem__, self.kinds), self.values, self.starts))
 
 class Lexer:
     def __init__(self, code):
         self.code = code
+        self.lines = LineIndex(code)
     def tokenize(self):
         tokens = []
         for mo in tok_regex.finditer(self.code):
-            kind, val = mo.lastgroup, mo.group()
+            kind = mo.lastgroup
             if kind == 'SKIP': continue
-            if kind == 'MISMATCH': raise LexError(f"Unexpected '{val}'")
+            val = mo.group()
+            if kind == 'MISMATCH':
+                line, col = self.lines.position(mo.start())
+                raise LexError(f"Unexpected '{val}' en {line}:{col}", mo.start())
             if kind == 'NUMBER':
                 val = float(val) if '.' in val else int(val)
-            tokens.append((kind,val))
-        tokens.append(('EOF',None))
+            tokens.append((kind,val,mo.start()))
+        tokens.append(('EOF',None,len(self.code)))
         return tokens
+    def tokenize_bulk(self, start=0, end=None):
+        # [start, end) permite tokenizar un fragmento con offsets absolutos
+        code = self.code
+        end = len(code) if end is None else end
+        kinds, starts, values = array('B'), array('l'), []
+        add_kind, add_start, add_value = kinds.append, starts.append, values.append
+        for mo in bulk_regex.finditer(code, lead_regex.match(code, start).end(), end):
+            k = mo.lastindex
+            add_kind(k); add_start(mo.start()); add_value(mo.group(k))
+        if BULK_MISMATCH in kinds:
+            i = kinds.index(BULK_MISMATCH)
+            line, col = self.lines.position(starts[i])
+            raise LexError(f"Unexpected '{values[i]}' en {line}:{col}", starts[i])
+        # Conversión de todos los NUMBER en un solo lote
+        nums = list(compress(range(len(kinds)), map(BULK_NUMBER.__eq__, kinds)))
+        for i, val in zip(nums, map(_number, map(values.__getitem__, nums))):
+            values[i] = val
+        add_kind(0); add_start(end); add_value(None)
+        return TokenBuffer(kinds, starts, values)
 
 # ----------------------------
 # Parser (recursive descent)
 # ----------------------------
-class ParseError(Exception): pass
+class ParseError(Exception):
+    def __init__(self, msg, offset=None):
+        super().__init__(msg)
+        self.offset = offset    # offset del token donde falló
 
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, lines=None):
         self.tokens = tokens; self.pos=0; self.cur=tokens[0]
+        self.lines = lines
+    def where(self):
+        if self.lines is None: return f"offset {self.cur[2]}"
+        line, col = self.lines.position(self.cur[2])
+        return f"{line}:{col}"
     def eat(self,kind):
         if self.cur[0]==kind:
             self.pos+=1; self.cur=self.tokens[self.pos]
         else:
-            raise ParseError(f"Esperaba {kind}, hallado {self.cur[0]}")
+            raise ParseError(f"Esperaba {kind}, hallado {self.cur[0]} en {self.where()}", self.cur[2])
     def parse(self):
         decls=[] 
         while self.cur[0]!='EOF':
             if self.cur[0]=='ID' and self.cur[1] in ('int','float'):
                 rtype=self.cur[1]; self.eat('ID')
-                name=self.cur[1]; self.eat('ID')
+                name=self.cur[1]; npos=self.cur[2]; self.eat('ID')
                 if self.cur[0]=='LPAREN':
                     self.eat('LPAREN'); params=[]
                     while self.cur[0]!='RPAREN':
                         ptype=self.cur[1]; self.eat('ID')
-                        pname=self.cur[1]; self.eat('ID')
-                        params.append(ParamNode(pname,ptype))
+                        pname=self.cur[1]; ppos=self.cur[2]; self.eat('ID')
+                        params.append(ParamNode(pname,ptype,ppos))
                         if self.cur[0]=='COMMA': self.eat('COMMA')
-                    self.eat('RPAREN'); self.eat('LBRACE')
-                    body=[]
-                    while self.cur[0]!='RBRACE':
-                        body.append(self.statement())
-                    self.eat('RBRACE')
-                    decls.append(FuncDeclNode(rtype,name,params,body))
+                    self.eat('RPAREN')
+                    decls.append(FuncDeclNode(rtype,name,params,self.func_body(),npos))
                 else:
                     self.eat('SEMI')
-                    decls.append(VarDeclNode(rtype,name))
+                    decls.append(VarDeclNode(rtype,name,npos))
+            elif self.cur[0]=='ID' and self.cur[1]=='import':
+                self.eat('ID')
+                name=self.cur[1]; npos=self.cur[2]; self.eat('ID')
+                self.eat('SEMI')
+                decls.append(ImportNode(name,npos))
             else:
                 decls.append(self.statement())
         return ProgramNode(decls)
 
+    def func_body(self):
+        self.eat('LBRACE'); body=[]
+        while self.cur[0]!='RBRACE':
+            body.append(self.statement())
+        self.eat('RBRACE'); return body
+
     def statement(self):
         # --- Declaración de variable (local o global) ---
         if self.cur[0]=='ID' and self.cur[1] in ('int','float'):
             # tipo y nombre
             vtype = self.cur[1]; self.eat('ID')
-            name  = self.cur[1]; self.eat('ID')
+            name  = self.cur[1]; npos = self.cur[2]; self.eat('ID')
             self.eat('SEMI')
-            return VarDeclNode(vtype, name)
+            return VarDeclNode(vtype, name, npos)
 
         # --- Return ---
         if self.cur[0]=='ID' and self.cur[1]=='return':
-            self.eat('ID')
+            rpos = self.cur[2]; self.eat('ID')
             expr = self.expr()
             self.eat('SEMI')
-            return ReturnNode(expr)
+            return ReturnNode(expr, rpos)
 
         # --- Asignación ---
         if self.cur[0]=='ID':
-            name = self.cur[1]; self.eat('ID')
+            name = self.cur[1]; npos = self.cur[2]; self.eat('ID')
             if self.cur[0]=='ASSIGN':
                 self.eat('ASSIGN')
                 expr = self.expr()
                 self.eat('SEMI')
-                return AssignNode(name, expr)
+                return AssignNode(name, expr, npos)
             if self.cur[0]=='LPAREN':
-                node = FuncCallNode(name, self.call_args())
+                node = FuncCallNode(name, self.call_args(), npos)
                 self.eat('SEMI')
                 return node
 
-        raise ParseError(f"Sent inválida {self.cur}")
+        raise ParseError(f"Sent inválida {self.cur[:2]} en {self.where()}", self.cur[2])
 
 
     def call_args(self):
@@ -331,40 +594,184 @@ class Parser:
     def equality(self):
         node=self.comparison()
         while self.cur[0] in ('EQ','NE'):
-            op=self.cur[0]; self.eat(op)
-            node=BinaryOpNode(node,op,self.comparison())
+            op=self.cur[0]; opos=self.cur[2]; self.eat(op)
+            node=BinaryOpNode(node,op,self.comparison(),opos)
         return node
     def comparison(self):
         node=self.term()
         while self.cur[0] in ('LT','LE','GT','GE'):
-            op=self.cur[0]; self.eat(op)
-            node=BinaryOpNode(node,op,self.term())
+            op=self.cur[0]; opos=self.cur[2]; self.eat(op)
+            node=BinaryOpNode(node,op,self.term(),opos)
         return node
     def term(self):
         node=self.factor()
         while self.cur[0] in ('PLUS','MINUS'):
-            op=self.cur[0]; self.eat(op)
-            node=BinaryOpNode(node,op,self.factor())
+            op=self.cur[0]; opos=self.cur[2]; self.eat(op)
+            node=BinaryOpNode(node,op,self.factor(),opos)
         return node
     def factor(self):
         node=self.primary()
         while self.cur[0] in ('TIMES','DIVIDE'):
-            op=self.cur[0]; self.eat(op)
-            node=BinaryOpNode(node,op,self.primary())
+            op=self.cur[0]; opos=self.cur[2]; self.eat(op)
+            node=BinaryOpNode(node,op,self.primary(),opos)
         return node
     def primary(self):
         if self.cur[0]=='NUMBER':
-            val=self.cur[1]; self.eat('NUMBER')
-            return NumberNode(val)
+            val=self.cur[1]; vpos=self.cur[2]; self.eat('NUMBER')
+            return NumberNode(val,vpos)
         if self.cur[0]=='ID':
-            name=self.cur[1]; self.eat('ID')
+            name=self.cur[1]; npos=self.cur[2]; self.eat('ID')
             if self.cur[0]=='LPAREN':
-                return FuncCallNode(name,self.call_args())
-            return IdentifierNode(name)
+                return FuncCallNode(name,self.call_args(),npos)
+            return IdentifierNode(name,npos)
         if self.cur[0]=='LPAREN':
             self.eat('LPAREN'); node=self.expr(); self.eat('RPAREN')
             return node
-        raise ParseError(f"Primario inválido {self.cur}")
+        raise ParseError(f"Primario inválido {self.cur[:2]} en {self.where()}", self.cur[2])
+
+# ----------------------------
+# Skim: solo declaraciones
+# ----------------------------
+def matching_brace(code, start):
+    """Offset de la '}' que cierra la '{' en `start` (búsqueda en C con find/count); -1 si no cierra."""
+    depth, pos = 1, start + 1
+    while True:
+        close = code.find('}', pos)
+        if close < 0:
+            return -1
+        depth += code.count('{', pos, close) - 1
+        if depth == 0:
+            return close
+        pos = close + 1
+
+class BodySpan:
+    """Cuerpo de función sin parsear: el texto entre las llaves."""
+    def __init__(self, code, start, end, lines=None):
+        self.code, self.start, self.end, self.lines = code, start, end, lines
+
+    def parse(self):
+        lexer = Lexer(self.code)
+        if self.lines is not None:
+            lexer.lines = self.lines
+        p = Parser(lexer.tokenize_bulk(self.start, self.end).to_tuples(), lexer.lines)
+        body = []
+        while p.cur[0] != 'EOF':
+            body.append(p.statement())
+        return body
+
+class SkimParser(Parser):
+    """
+    Parser de declaraciones: lexea el texto token a token y salta cada
+    cuerpo de función hasta su llave de cierre sin tokenizarlo. El cuerpo
+    queda como BodySpan y se parsea al leer `FuncDeclNode.body`, así que sus
+    errores léxicos o sintácticos aparecen en ese momento.
+    """
+    def __init__(self, code, lines=None):
+        self.code = code
+        self.lines = lines if lines is not None else LineIndex(code)
+        self.offset = lead_regex.match(code).end()
+        self.cur = self.next_token()
+
+    def next_token(self):
+        mo = bulk_regex.match(self.code, self.offset)
+        if mo is None:
+            return ('EOF', None, len(self.code))
+        k = mo.lastindex
+        if k == BULK_MISMATCH:
+            line, col = self.lines.position(mo.start())
+            raise LexError(f"Unexpected '{mo.group(k)}' en {line}:{col}", mo.start())
+        self.offset = mo.end()
+        val = mo.group(k)
+        return (BULK_KINDS[k], _number(val) if k == BULK_NUMBER else val, mo.start())
+
+    def eat(self, kind):
+        if self.cur[0]==kind:
+            self.cur = self.next_token()
+        else:
+            raise ParseError(f"Esperaba {kind}, hallado {self.cur[0]} en {self.where()}", self.cur[2])
+
+    def func_body(self):
+        if self.cur[0]!='LBRACE':
+            self.eat('LBRACE')
+        start = self.cur[2]
+        end = matching_brace(self.code, start)
+        if end < 0:
+            raise ParseError(f"Llave sin cerrar en {self.where()}", start)
+        self.offset = lead_regex.match(self.code, end + 1).end()
+        self.cur = self.next_token()
+        return BodySpan(self.code, start + 1, end, self.lines)
+
+# ------------------------------------------------
+# Instrumentación (--profile)
+# ------------------------------------------------
+class CountingSymbolTable(SymbolTable):
+    """SymbolTable que cuenta las búsquedas; solo se usa con --profile."""
+    def __init__(self, lines=None, max_errors=MAX_ERRORS):
+        super().__init__(lines, max_errors)
+        self.lookups = 0
+
+    def lookup(self, name):
+        self.lookups += 1
+        return super().lookup(name)
+
+def count_nodes(node):
+    """Número de nodos del AST (recorrido iterativo)."""
+    total, pending = 0, [node]
+    while pending:
+        n = pending.pop()
+        if isinstance(n, list):
+            pending.extend(n)
+        elif isinstance(n, Node):
+            total += 1
+            # `target` (resolver.py) apunta a otra declaración, no a un hijo
+            pending.extend(v for k, v in vars(n).items()
+                           if k != 'target' and isinstance(v, (Node, list)))
+    return total
+
+class Profiler:
+    """
+    Tiempos por fase, contadores y memoria pico (tracemalloc) en JSON.
+
+    Deshabilitado, `phase()` devuelve un contexto vacío compartido y no se
+    activa tracemalloc, así que el costo es prácticamente nulo.
+    """
+    _null = nullcontext()
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.phases = {}
+        self.counters = {}
+        if enabled:
+            tracemalloc.start()
+
+    def phase(self, name):
+        if not self.enabled:
+            return self._null
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - t0
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self):
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+        return {
+            'phases': {k: round(v, 6) for k, v in self.phases.items()},
+            'counters': self.counters,
+            'peak_memory_bytes': peak,
+        }
+
+    def emit(self, out=sys.stderr):
+        if self.enabled:
+            print(json.dumps(self.report(), indent=2), file=out)
 
 # ------------------------------------------------
 # Main: léxico → sintaxis → semántica (archivo fijo)
@@ -374,34 +781,67 @@ class Parser:
 SOURCE_FILE = "ejemplo2.src"   # Cámbialo por el que quieras
 
 if __name__ == '__main__':
+    # --profile: tiempos por fase, contadores y memoria pico en JSON (stderr)
+    # --json: diagnósticos en JSON (stdout)
+    # --max-errors=N: corta el análisis al llegar a N errores (0: sin límite)
+    prof = Profiler('--profile' in sys.argv[1:])
+    as_json = '--json' in sys.argv[1:]
+    max_errors = MAX_ERRORS
+    for arg in sys.argv[1:]:
+        if arg.startswith('--max-errors='):
+            max_errors = int(arg.split('=', 1)[1]) or None
+    status = 0
+
     # 1) Leer directamente el fichero configurado arriba
     try:
-        with open(SOURCE_FILE, 'r') as f:
-            code = f.read()
+        with prof.phase('read'):
+            with open(SOURCE_FILE, 'r') as f:
+                code = f.read()
     except FileNotFoundError:
         print(f"Error: no existe el archivo '{SOURCE_FILE}'")
         sys.exit(1)
 
     try:
         # 2) Léxico
-        tokens = Lexer(code).tokenize()
+        with prof.phase('lex'):
+            lexer  = Lexer(code)
+            tokens = lexer.tokenize_bulk().to_tuples()
+        prof.count('tokens', len(tokens) - 1)
         # 3) Sintaxis (AST)
-        ast = Parser(tokens).parse()
+        with prof.phase('parse'):
+            ast = Parser(tokens, lexer.lines).parse()
+        if prof.enabled:
+            prof.count('nodes', count_nodes(ast))
 
         # 4) Análisis semántico
-        Node.tabla_simbolos = SymbolTable()
-        Node.ambito        = ''
-        ast.validate_types()
-
-        # 5) Reporte de errores
-        if Node.tabla_simbolos.errors:
-            for e in Node.tabla_simbolos.errors:
+        with prof.phase('semantic'):
+            Node.tabla_simbolos = (CountingSymbolTable if prof.enabled else SymbolTable)(lexer.lines, max_errors)
+            Node.ambito        = ''
+            ast.validate_types()
+        if prof.enabled:
+            prof.count('symbol_lookups', Node.tabla_simbolos.lookups)
+
+        # 5) Reporte de errores (se formatean recién aquí)
+        table = Node.tabla_simbolos
+        status = 1 if table.diagnostics else 0
+        if as_json:
+            print(table.to_json())
+        elif table.diagnostics:
+            for e in table.errors:
                 print(e)
-            sys.exit(1)
+            if table.suppressed:
+                print(f"({table.suppressed} errores repetidos omitidos)")
         else:
             print("¡Análisis semántico sin errores!")
-            sys.exit(0)
 
     except (LexError, ParseError) as e:
-        print(f"Error: {e}")
-        sys.exit(1)
+        if as_json:
+            code = 'lex_error' if isinstance(e, LexError) else 'parse_error'
+            print(json.dumps({'diagnostics': [{'code': code, 'offset': e.offset, 'message': f"Error: {e}"}],
+                              'suppressed': 0}, ensure_ascii=False, indent=2))
+        else:
+            print(f"Error: {e}")
+        status = 1
+
+    prof.emit()
+    sys.exit(status)
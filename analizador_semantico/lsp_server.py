@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Servidor LSP (Language Server Protocol) por stdio para el lenguaje de
+lexer_parser.py.
+
+- Mantiene los documentos en memoria y aplica los cambios incrementales de
+  `textDocument/didChange`.
+- Analiza (léxico → sintaxis → semántica) `--debounce` segundos después del
+  último cambio. Un cambio nuevo cancela el análisis pendiente. Si el
+  análisis ya está corriendo, se abandona entre fases y no se publica.
+- Publica `textDocument/publishDiagnostics` con rangos y con la versión del
+  documento analizada.
+- Responde `textDocument/definition` desde el índice de referencias del
+  último análisis.
+
+Las columnas se cuentan en caracteres. En LSP son unidades UTF-16, y las
+dos cuentas solo difieren fuera del plano básico.
+
+Uso (lo lanza el editor):
+    python lsp_server.py [--debounce 0.15]
+"""
+import sys, json, asyncio, argparse, threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+from lexer_parser import (Lexer, Parser, LexError, ParseError, SymbolTable, Node,
+                          ProgramNode, VarDeclNode, ParamNode, FuncDeclNode, AssignNode,
+                          ReturnNode, BinaryOpNode, FuncCallNode, IdentifierNode, tok_regex)
+
+SEVERITY_ERROR = 1
+SYNC_INCREMENTAL = 2
+
+# ------------------------------------------------
+# Documentos en memoria
+# ------------------------------------------------
+def line_starts(text):
+    starts = [0]
+    i = text.find('\n')
+    while i >= 0:
+        starts.append(i + 1)
+        i = text.find('\n', i + 1)
+    return starts
+
+def to_offset(text, starts, position):
+    """{'line', 'character'} (desde 0) -> offset en el texto."""
+    line = min(position['line'], len(starts) - 1)
+    return min(starts[line] + position['character'], len(text))
+
+def to_position(starts, offset):
+    line = bisect_right(starts, offset) - 1
+    return {'line': line, 'character': offset - starts[line]}
+
+class Document:
+    def __init__(self, uri, text, version):
+        self.uri = uri
+        self.text = text
+        self.version = version
+        self.analysis = None    # último Analysis publicado
+        self.task = None        # análisis programado (asyncio.Task)
+
+    def apply(self, change):
+        if 'range' not in change:
+            self.text = change['text']
+            return
+        starts = line_starts(self.text)
+        start = to_offset(self.text, starts, change['range']['start'])
+        end = to_offset(self.text, starts, change['range']['end'])
+        self.text = self.text[:start] + change['text'] + self.text[end:]
+
+# ------------------------------------------------
+# Análisis
+# ------------------------------------------------
+class Analysis:
+    def __init__(self, text, version, diagnostics, tokens=(), ast=None):
+        self.text = text
+        self.version = version
+        self.diagnostics = diagnostics      # [(offset o None, mensaje)]
+        self.tokens = tokens                # (kind, val, offset)
+        self.ast = ast
+        self._offsets = self._references = None
+
+    # El índice para ir a la definición se arma en la primera consulta, así
+    # no retrasa la publicación de los diagnósticos
+    @property
+    def offsets(self):
+        if self._offsets is None:
+            self._offsets = [t[2] for t in self.tokens]
+        return self._offsets
+
+    @property
+    def references(self):
+        """offset de uso -> offset de la declaración."""
+        if self._references is None:
+            self._references = find_references(self.ast) if self.ast else {}
+        return self._references
+
+class Cancelled(Exception): pass
+
+def find_references(ast):
+    """
+    Offset de cada uso de un nombre -> offset de su declaración, con las
+    mismas reglas de ámbito que validate_types (gana la primera declaración).
+    """
+    refs = {}
+    pending = [(ast, [{}])]
+    while pending:
+        n, scopes = pending.pop()
+        if isinstance(n, list):
+            pending.extend((x, scopes) for x in reversed(n))
+        elif isinstance(n, ProgramNode):
+            pending.append((n.decls, scopes))
+        elif isinstance(n, (VarDeclNode, ParamNode)):
+            refs[n.pos] = scopes[-1].setdefault(n.name, n.pos)
+        elif isinstance(n, FuncDeclNode):
+            refs[n.pos] = scopes[0].setdefault(n.name, n.pos)
+            pending.append((n.params + n.body, scopes + [{}]))
+        elif isinstance(n, (AssignNode, FuncCallNode, IdentifierNode)):
+            for scope in reversed(scopes):
+                if n.name in scope:
+                    refs[n.pos] = scope[n.name]
+                    break
+            if isinstance(n, AssignNode):
+                pending.append((n.expr, scopes))
+            elif isinstance(n, FuncCallNode):
+                pending.append((n.args, scopes))
+        elif isinstance(n, ReturnNode):
+            pending.append((n.expr, scopes))
+        elif isinstance(n, BinaryOpNode):
+            pending.append((n.right, scopes))
+            pending.append((n.left, scopes))
+    return refs
+
+def analyze(text, version, current=lambda: True):
+    """Léxico, sintaxis y semántica; entre fases se abandona si `current()` es falso."""
+    lexer = Lexer(text)
+    try:
+        tokens = lexer.tokenize_bulk().to_tuples()
+        if not current(): raise Cancelled
+        ast = Parser(tokens, lexer.lines).parse()
+    except (LexError, ParseError) as e:
+        return Analysis(text, version, [(e.offset, f"Error: {e}")])
+    if not current(): raise Cancelled
+    Node.tabla_simbolos = SymbolTable()
+    Node.ambito = ''
+    ast.validate_types()
+    if not current(): raise Cancelled
+    # Sin `lines`: el rango LSP sale del offset, el mensaje va sin prefijo
+    diagnostics = [(d.pos, d.message()) for d in Node.tabla_simbolos.diagnostics]
+    return Analysis(text, version, diagnostics, tokens, ast)
+
+def token_range(text, starts, offset):
+    """Rango LSP del token que empieza en `offset` (inicio del texto si no hay offset)."""
+    if offset is None:
+        offset = end = 0
+    else:
+        mo = tok_regex.match(text, offset)
+        end = mo.end() if mo and mo.end() > offset else offset + 1
+    return {'start': to_position(starts, offset), 'end': to_position(starts, end)}
+
+def lsp_diagnostics(analysis):
+    starts = line_starts(analysis.text)
+    return [{'range': token_range(analysis.text, starts, off), 'severity': SEVERITY_ERROR,
+             'source': 'analizador_semantico', 'message': msg}
+            for off, msg in analysis.diagnostics]
+
+# ------------------------------------------------
+# Servidor (JSON-RPC sobre stdio)
+# ------------------------------------------------
+class LanguageServer:
+    def __init__(self, stdin, stdout, debounce=0.15):
+        self.stdin = stdin      # binarios
+        self.stdout = stdout
+        self.debounce = debounce
+        self.documents = {}
+        # Node.tabla_simbolos es global: un solo análisis a la vez
+        self.executor = ThreadPoolExecutor(1)
+        self.shutting_down = False
+
+    # --- transporte ---
+    def read_message(self):
+        """Bloqueante (hilo lector). None al cerrarse la entrada."""
+        length = None
+        while True:
+            line = self.stdin.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii').partition(':')
+            if name.lower() == 'content-length':
+                length = int(value)
+        if length is None:
+            return None
+        return json.loads(self.stdin.read(length))
+
+    def send(self, message):
+        data = json.dumps(message, ensure_ascii=False).encode('utf-8')
+        self.stdout.write(b'Content-Length: %d\r\n\r\n' % len(data) + data)
+        self.stdout.flush()
+
+    def reply(self, id_, result=None, error=None):
+        message = {'jsonrpc': '2.0', 'id': id_}
+        if error:
+            message['error'] = error
+        else:
+            message['result'] = result
+        self.send(message)
+
+    def notify(self, method, params):
+        self.send({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    # --- bucle principal ---
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+
+        def reader():
+            while True:
+                message = self.read_message()
+                loop.call_soon_threadsafe(queue.put_nowait, message)
+                if message is None or message.get('method') == 'exit':
+                    return
+
+        threading.Thread(target=reader, daemon=True).start()
+        while True:
+            message = await queue.get()
+            if message is None or message.get('method') == 'exit':
+                return 0 if self.shutting_down else 1
+            try:
+                self.dispatch(message.get('method'), message.get('id'), message.get('params') or {})
+            except Exception as e:
+                if 'id' in message:
+                    self.reply(message['id'], error={'code': -32603, 'message': str(e)})
+
+    def dispatch(self, method, id_, params):
+        if method == 'initialize':
+            self.reply(id_, {'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': SYNC_INCREMENTAL},
+                'definitionProvider': True,
+            }, 'serverInfo': {'name': 'analizador_semantico'}})
+        elif method == 'shutdown':
+            self.shutting_down = True
+            self.reply(id_, None)
+        elif method == 'textDocument/didOpen':
+            td = params['textDocument']
+            doc = self.documents[td['uri']] = Document(td['uri'], td['text'], td.get('version'))
+            self.schedule(doc, 0)
+        elif method == 'textDocument/didChange':
+            doc = self.documents.get(params['textDocument']['uri'])
+            if doc is None:
+                return
+            for change in params['contentChanges']:
+                doc.apply(change)
+            doc.version = params['textDocument'].get('version')
+            self.schedule(doc, self.debounce)
+        elif method == 'textDocument/didClose':
+            doc = self.documents.pop(params['textDocument']['uri'], None)
+            if doc and doc.task:
+                doc.task.cancel()
+            self.notify('textDocument/publishDiagnostics',
+                        {'uri': params['textDocument']['uri'], 'diagnostics': []})
+        elif method == 'textDocument/definition':
+            self.reply(id_, self.definition(params))
+        elif id_ is not None:
+            self.reply(id_, error={'code': -32601, 'message': f"método no soportado: {method}"})
+
+    # --- análisis con debounce ---
+    def schedule(self, doc, delay):
+        if doc.task:
+            doc.task.cancel()
+        doc.task = asyncio.get_running_loop().create_task(self._analyze(doc, delay))
+
+    async def _analyze(self, doc, delay):
+        if delay:
+            await asyncio.sleep(delay)
+        version, text = doc.version, doc.text
+        current = lambda: doc.version == version and self.documents.get(doc.uri) is doc
+        loop = asyncio.get_running_loop()
+        try:
+            analysis = await loop.run_in_executor(self.executor, analyze, text, version, current)
+        except Cancelled:
+            return
+        if not current():
+            return
+        doc.analysis = analysis
+        self.notify('textDocument/publishDiagnostics', {
+            'uri': doc.uri, 'version': version, 'diagnostics': lsp_diagnostics(analysis)})
+
+    # --- ir a la definición ---
+    def definition(self, params):
+        doc = self.documents.get(params['textDocument']['uri'])
+        if doc is None or doc.analysis is None or not doc.analysis.tokens:
+            return None
+        # La posición se interpreta sobre el texto del último análisis
+        analysis = doc.analysis
+        starts = line_starts(analysis.text)
+        offset = to_offset(analysis.text, starts, params['position'])
+        k = bisect_right(analysis.offsets, offset) - 1
+        if k < 0:
+            return None
+        kind, val, start = analysis.tokens[k]
+        if kind != 'ID' or offset > start + len(val):
+            return None
+        target = analysis.references.get(start)
+        if target is None:
+            return None
+        return {'uri': doc.uri, 'range': token_range(analysis.text, starts, target)}
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Servidor LSP por stdio para lexer_parser.py')
+    ap.add_argument('--debounce', type=float, default=0.15, help='segundos sin cambios antes de analizar')
+    args = ap.parse_args()
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer, args.debounce)
+    sys.exit(asyncio.run(server.run()))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Compilación por módulos para el lenguaje de lexer_parser.py.
+
+Un proyecto es un directorio de archivos `.src`. Cada archivo es un módulo
+cuyo nombre es el del archivo sin extensión. `import m;` (solo en el nivel
+superior) declara en el ámbito global las funciones y globales de `m`.
+
+- La interfaz de un módulo (firmas de sus funciones y tipos de sus globales)
+  sale del AST, sin análisis semántico (o de SkimParser, si un cuerpo no
+  parsea). Por eso un módulo se puede verificar en cuanto se conocen las
+  interfaces que importa, y los ciclos de imports no son un problema.
+- Cada módulo tiene en el directorio de caché un JSON con mtime, tamaño,
+  hash del fuente, imports, interfaz, hash de la interfaz, hashes de las
+  interfaces importadas en la última verificación y errores.
+- Se vuelve a leer un archivo solo si cambió su mtime o su tamaño, y se
+  vuelve a parsear solo si cambió su hash.
+- Un módulo se vuelve a verificar solo si cambió su fuente o la interfaz de
+  algo que importa. Si se edita el cuerpo de una función sin tocar su firma,
+  sus importadores no se verifican.
+- La verificación sigue el orden de dependencias (primero lo importado) y
+  los errores llevan el prefijo `archivo.src:`.
+
+Uso:
+    python modules.py PROYECTO [--cache DIR] [--stats]
+"""
+import os, sys, json, time, hashlib, argparse
+
+from lexer_parser import (Lexer, Parser, SkimParser, LexError, ParseError, SymbolTable, Node,
+                          ImportNode, VarDeclNode, FuncDeclNode)
+
+EXT = '.src'
+CACHE_DIR = '.modcache'
+
+# ------------------------------------------------
+# Interfaces
+# ------------------------------------------------
+def parse_source(text):
+    """Fuente -> (ast, lines); lanza LexError o ParseError."""
+    lexer = Lexer(text)
+    return Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse(), lexer.lines
+
+def summarize(ast):
+    """(imports, interfaz) de un módulo. En las redefiniciones gana la primera, como en SymbolTable."""
+    imports, functions, globals_ = [], {}, {}
+    for d in ast.decls:
+        if isinstance(d, ImportNode):
+            if d.module not in imports:
+                imports.append(d.module)
+        elif isinstance(d, FuncDeclNode):
+            functions.setdefault(d.name, [d.return_type, [p.ptype for p in d.params]])
+        elif isinstance(d, VarDeclNode):
+            globals_.setdefault(d.name, d.vtype)
+    return imports, {'functions': functions, 'globals': globals_}
+
+def skim(text):
+    """
+    (imports, interfaz) sin parsear los cuerpos (SkimParser). Si el nivel
+    superior tiene errores la interfaz queda vacía; la verificación completa
+    los reporta.
+    """
+    try:
+        return summarize(SkimParser(text).parse())
+    except (LexError, ParseError):
+        return [], {'functions': {}, 'globals': {}}
+
+def interface_hash(interface):
+    return hashlib.sha1(json.dumps(interface, sort_keys=True).encode()).hexdigest()
+
+def dependency_order(imports):
+    """
+    Nombres de módulo con cada uno después de los que importa (Kahn). Los
+    que quedan en un ciclo van al final, por nombre.
+    """
+    pending = {m: sum(1 for d in deps if d in imports and d != m) for m, deps in imports.items()}
+    users = {m: [] for m in imports}
+    for m, deps in imports.items():
+        for d in deps:
+            if d in users and d != m:
+                users[d].append(m)
+    ready = sorted(m for m, n in pending.items() if n == 0)
+    order = []
+    while ready:
+        m = ready.pop()
+        order.append(m)
+        for u in users[m]:
+            pending[u] -= 1
+            if pending[u] == 0:
+                ready.append(u)
+    if len(order) < len(imports):
+        done = set(order)
+        order.extend(sorted(m for m in imports if m not in done))
+    return order
+
+# ------------------------------------------------
+# Caché en disco
+# ------------------------------------------------
+def load_entry(cache, name):
+    try:
+        with open(os.path.join(cache, name + '.json'), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_entry(cache, name, entry):
+    # Escritura atómica: una compilación interrumpida no deja JSON a medias
+    path = os.path.join(cache, name + '.json')
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(entry, f, ensure_ascii=False)
+    os.replace(path + '.tmp', path)
+
+# ------------------------------------------------
+# Compilación incremental
+# ------------------------------------------------
+def check_module(ast, lines, deps):
+    """Análisis semántico de un módulo con las interfaces `deps` {módulo: interfaz}."""
+    Node.tabla_simbolos = SymbolTable(lines)
+    Node.ambito = ''
+    Node.interfaces = deps
+    try:
+        ast.validate_types()
+    finally:
+        Node.interfaces = {}
+    return Node.tabla_simbolos.errors
+
+def build(project, cache=None):
+    """
+    Verifica el proyecto reutilizando la caché. Retorna ({módulo: errores} en
+    orden de dependencias, estadísticas).
+    """
+    cache = cache or os.path.join(project, CACHE_DIR)
+    os.makedirs(cache, exist_ok=True)
+    stats = {'modules': 0, 'read': 0, 'parsed': 0, 'checked': 0}
+
+    # 1) Fuentes: stat de todos, lectura y parseo solo de los que cambiaron
+    entries, parsed, changed = {}, {}, set()
+    for de in os.scandir(project):
+        if not (de.name.endswith(EXT) and de.is_file()):
+            continue
+        name = de.name[:-len(EXT)]
+        st = de.stat()
+        entry = load_entry(cache, name)
+        entries[name] = entry
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            continue
+        stats['read'] += 1
+        with open(de.path, encoding='utf-8') as f:
+            text = f.read()
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        if entry and entry['hash'] == digest:
+            entry['mtime_ns'], entry['size'] = st.st_mtime_ns, st.st_size
+            save_entry(cache, name, entry)
+            continue
+        stats['parsed'] += 1
+        entry = entries[name] = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'hash': digest,
+                                 'imports': [], 'interface': {'functions': {}, 'globals': {}},
+                                 'deps': {}, 'errors': []}
+        try:
+            ast, lines = parsed[name] = parse_source(text)
+            entry['imports'], entry['interface'] = summarize(ast)
+        except (LexError, ParseError) as e:
+            parsed[name] = None
+            entry['errors'] = [f"{name}{EXT}: Error: {e}"]
+            # Un error dentro de un cuerpo no cambia las firmas: la interfaz
+            # sale de SkimParser, como en scheduler.py, y los importadores no
+            # ven funciones "no declaradas"
+            entry['imports'], entry['interface'] = skim(text)
+        entry['iface_hash'] = interface_hash(entry['interface'])
+        changed.add(name)
+    stats['modules'] = len(entries)
+
+    # Módulos borrados: sus importadores verán el hash None y se verificarán
+    for fname in os.listdir(cache):
+        if fname.endswith('.json') and fname[:-5] not in entries:
+            os.remove(os.path.join(cache, fname))
+
+    # 2) Verificación en orden de dependencias
+    hashes = {m: e['iface_hash'] for m, e in entries.items()}
+    results = {}
+    for name in dependency_order({m: e['imports'] for m, e in entries.items()}):
+        entry = entries[name]
+        deps = {d: hashes.get(d) for d in entry['imports']}
+        if name in changed or deps != entry['deps']:
+            if name not in parsed:
+                # Fuente sin cambios pero cambió una interfaz importada
+                with open(os.path.join(project, name + EXT), encoding='utf-8') as f:
+                    text = f.read()
+                try:
+                    parsed[name] = parse_source(text)
+                except (LexError, ParseError):
+                    parsed[name] = None     # su error ya está en entry['errors']
+            if parsed[name] is not None:
+                ast, lines = parsed[name]
+                errors = check_module(ast, lines, {d: entries[d]['interface'] for d in deps if d in entries})
+                entry['errors'] = [f"{name}{EXT}:{e}" for e in errors]
+                stats['checked'] += 1
+            entry['deps'] = deps
+            save_entry(cache, name, entry)
+        results[name] = entry['errors']
+    return results, stats
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Verificación incremental de un proyecto de módulos .src')
+    ap.add_argument('project', help='directorio con los archivos .src')
+    ap.add_argument('--cache', help=f'directorio de caché (por defecto PROYECTO/{CACHE_DIR})')
+    ap.add_argument('--stats', action='store_true', help='imprime en stderr cuántos módulos se leyeron, parsearon y verificaron')
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    results, stats = build(args.project, args.cache)
+    status = 0
+    for name, errors in results.items():
+        for e in errors:
+            print(e)
+            status = 1
+    if status == 0:
+        print(f"¡{stats['modules']} módulos sin errores!")
+    if args.stats:
+        stats['seconds'] = round(time.perf_counter() - t0, 4)
+        print(json.dumps(stats), file=sys.stderr)
+    sys.exit(status)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Lexer en paralelo para fuentes muy grandes.
+
+El fuente se parte justo después de un salto de línea. Ese punto es seguro
+porque ningún token de `token_spec` contiene '\\n' (no hay cadenas ni
+comentarios); `newline_is_separator()` lo verifica sobre la especificación y,
+si deja de ser cierto, se lexea en serie.
+
+- Los bytes del fuente van una sola vez a un bloque de `shared_memory` que
+  todos los workers leen.
+- Cada worker lexea sus trozos y devuelve, en otro bloque compartido, las
+  columnas tipo (B), inicio y fin (l) con offsets absolutos, más los inicios
+  de línea del trozo.
+- El proceso principal concatena las columnas, arma los lexemas cortando su
+  propio `str` y convierte los NUMBER, igual que `tokenize_bulk`. También
+  deja lista la tabla de `LineIndex`.
+
+El resultado es el mismo TokenBuffer que `Lexer.tokenize_bulk()` (y
+`tokenize()` las mismas tuplas que `Lexer.tokenize()`), y los LexError
+tienen el mismo mensaje y offset. Un fuente no ASCII siempre tiene un
+carácter inválido, así que se lexea en serie para reportarlo.
+
+Uso:
+    python parallel_lexer.py ARCHIVO [-j N]
+"""
+import os, re, sys, time, argparse
+from array import array
+from itertools import compress
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, wait
+
+from lexer_parser import (Lexer, LexError, TokenBuffer, token_spec, bulk_regex, lead_regex,
+                          BULK_NUMBER, BULK_MISMATCH, _number)
+
+MIN_PARALLEL = 1 << 20      # por debajo de 1 MB no compensa arrancar el pool
+CHUNKS_PER_JOB = 4          # trozos por worker, para repartir mejor la carga
+
+_PRINTABLE = [chr(c) for c in range(33, 127)]
+_WORD = array('l').itemsize     # 4 u 8 bytes según la plataforma
+
+def newline_is_separator():
+    """
+    True si ninguna regla, salvo SKIP, reconoce un lexema con '\\n'. Se prueba
+    sobre un texto con '\\n' entre cada par de caracteres imprimibles, que
+    delata cadenas ('"\\n"') y comentarios de bloque.
+    """
+    probe = ''.join(a + '\n' + b for a in _PRINTABLE for b in _PRINTABLE)
+    for n, r in token_spec:
+        if n != 'SKIP' and any('\n' in mo.group() for mo in re.finditer(r, probe)):
+            return False
+    return True
+
+SPLIT_SAFE = newline_is_separator()
+
+def split_points(code, parts):
+    """Límites [0, ..., len(code)] justo después de un '\\n', sin trozos vacíos."""
+    bounds = [0]
+    size = max(1, len(code) // parts)
+    while True:
+        nl = code.find('\n', bounds[-1] + size)
+        if nl < 0 or nl + 1 >= len(code):
+            break
+        bounds.append(nl + 1)
+    bounds.append(len(code))
+    return bounds
+
+# ------------------------------------------------
+# Worker
+# ------------------------------------------------
+def _layout(n, m):
+    """Fin de cada columna del bloque de salida: tipos, inicios, fines y líneas."""
+    return n, n + _WORD * n, n + 2 * _WORD * n, n + 2 * _WORD * n + _WORD * m
+
+def _lex_chunk(source_name, start, end):
+    """
+    Lexea data[start:end]. Retorna (nombre del bloque, tokens, líneas) o
+    ('error', offset absoluto del primer carácter inválido).
+    """
+    shm = shared_memory.SharedMemory(source_name)
+    try:
+        text = bytes(shm.buf[start:end]).decode('ascii')
+    finally:
+        shm.close()
+    kinds, starts, ends = array('B'), array('l'), array('l')
+    add_kind, add_start, add_end = kinds.append, starts.append, ends.append
+    for mo in bulk_regex.finditer(text, lead_regex.match(text).end()):
+        k = mo.lastindex
+        add_kind(k)
+        s, e = mo.span(k)
+        add_start(start + s); add_end(start + e)
+    if BULK_MISMATCH in kinds:
+        return ('error', starts[kinds.index(BULK_MISMATCH)])
+    lines = array('l', (start + mo.end() for mo in re.finditer('\n', text)))
+    n, m = len(kinds), len(lines)
+    a, b, c, d = _layout(n, m)
+    out = shared_memory.SharedMemory(create=True, size=max(1, d))
+    try:
+        buf = out.buf
+        buf[:a] = kinds.tobytes()
+        buf[a:b] = starts.tobytes()
+        buf[b:c] = ends.tobytes()
+        buf[c:d] = lines.tobytes()
+        del buf
+    except BaseException:
+        out.close()
+        out.unlink()
+        raise
+    out.close()
+    return (out.name, n, m)
+
+def _discard(futures):
+    """
+    Espera a los workers y borra los bloques de salida que sigan existiendo:
+    los de trozos que no llegó a leer `_stitch` porque otro worker falló.
+    """
+    wait(futures)
+    for f in futures:
+        if f.cancelled() or f.exception() is not None or f.result()[0] == 'error':
+            continue
+        try:
+            shm = shared_memory.SharedMemory(f.result()[0])
+        except FileNotFoundError:
+            continue        # ya consumido y borrado
+        shm.close()
+        shm.unlink()
+
+# ------------------------------------------------
+# Lexer
+# ------------------------------------------------
+class ParallelLexer(Lexer):
+    def __init__(self, code, jobs=None, executor=None):
+        super().__init__(code)
+        self.jobs = jobs
+        self.executor = executor    # pool compartido entre llamadas (opcional)
+
+    def tokenize(self):
+        return self.tokenize_bulk().to_tuples()
+
+    def tokenize_bulk(self, start=0, end=None):
+        code = self.code
+        if start or end is not None or not code or len(code) < MIN_PARALLEL or not SPLIT_SAFE:
+            return super().tokenize_bulk(start, end)
+        try:
+            data = code.encode('ascii')
+        except UnicodeEncodeError:
+            return super().tokenize_bulk()
+        source = shared_memory.SharedMemory(create=True, size=len(data))
+        futures = []
+        try:
+            source.buf[:len(data)] = data
+            del data
+            pool = self.executor or ProcessPoolExecutor(self.jobs)
+            try:
+                bounds = split_points(code, (self.jobs or os.cpu_count() or 1) * CHUNKS_PER_JOB)
+                futures = [pool.submit(_lex_chunk, source.name, a, b)
+                           for a, b in zip(bounds, bounds[1:])]
+                results = [f.result() for f in futures]
+            finally:
+                if self.executor is None:
+                    pool.shutdown()
+            return self._stitch(results)
+        finally:
+            source.close()
+            source.unlink()
+            _discard(futures)
+
+    def _stitch(self, results):
+        kinds, starts, ends, line_starts = array('B'), array('l'), array('l'), array('l', [0])
+        error = None
+        for r in results:
+            if r[0] == 'error':
+                error = r[1] if error is None else error
+                continue
+            name, n, m = r
+            a, b, c, d = _layout(n, m)
+            shm = shared_memory.SharedMemory(name)
+            try:
+                buf = shm.buf
+                kinds.frombytes(buf[:a])
+                starts.frombytes(buf[a:b])
+                ends.frombytes(buf[b:c])
+                line_starts.frombytes(buf[c:d])
+                del buf
+            finally:
+                shm.close()
+                shm.unlink()
+        if error is not None:
+            # El primer trozo con error tiene el primer carácter inválido
+            line, col = self.lines.position(error)
+            raise LexError(f"Unexpected '{self.code[error]}' en {line}:{col}", error)
+        self.lines.starts = list(line_starts)
+
+        code = self.code
+        values = list(map(code.__getitem__, map(slice, starts, ends)))
+        nums = list(compress(range(len(kinds)), map(BULK_NUMBER.__eq__, kinds)))
+        for i, val in zip(nums, map(_number, map(values.__getitem__, nums))):
+            values[i] = val
+        kinds.append(0); starts.append(len(code)); values.append(None)
+        return TokenBuffer(kinds, starts, values)
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Lexea un archivo grande en paralelo')
+    ap.add_argument('file')
+    ap.add_argument('-j', '--jobs', type=int, default=None, help='procesos (por defecto, uno por CPU)')
+    args = ap.parse_args()
+    with open(args.file, encoding='utf-8') as f:
+        code = f.read()
+    t0 = time.perf_counter()
+    try:
+        buf = ParallelLexer(code, args.jobs).tokenize_bulk()
+    except LexError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    t = time.perf_counter() - t0
+    print(f"{len(buf) - 1} tokens en {t:.3f} s ({(len(buf) - 1) / t:,.0f} tokens/s)")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Léxico y sintaxis en tubería: el lexer corre en otro proceso y el Parser
+consume los tokens a medida que llegan, así que el tiempo total tiende a
+max(léxico, sintaxis) en vez de la suma.
+
+- El anillo es un bloque de `shared_memory` con `slots` ranuras. Cada
+  ranura lleva hasta `batch` tokens en columnas: cantidad (i4), inicios
+  (i4), fines (i4) y tipos (B, índice en BULK_KINDS).
+- Dos semáforos cuentan las ranuras libres y las llenas. Si el Parser se
+  atrasa, el lexer se bloquea al no haber ranuras libres (contrapresión).
+- Una ranura con menos de `batch` tokens cierra el flujo. Una ranura con
+  cantidad -1 lleva en su primer inicio el offset de un carácter inválido.
+- `TokenStream` se indexa como la lista de tokens de `Lexer.tokenize()`, en
+  orden creciente, que es como la recorre `Parser`. Los lexemas salen de
+  cortar el `str` del proceso principal, así que solo viajan enteros.
+
+Uso:
+    python pipeline.py ARCHIVO [--slots 64] [--batch 4096]
+"""
+import sys, time, argparse, multiprocessing
+from array import array
+from itertools import islice, compress
+from multiprocessing import shared_memory
+
+from lexer_parser import (Parser, LexError, ParseError, LineIndex, bulk_regex, lead_regex,
+                          BULK_KINDS, BULK_NUMBER, BULK_MISMATCH, _number)
+
+_ESPERA = 0.1     # segundos entre revisiones del proceso del lexer
+
+def _slot_size(batch):
+    return 4 + 8 * batch + batch
+
+def _ints(view):
+    a = array('i')
+    a.frombytes(view)
+    return a
+
+# ------------------------------------------------
+# Productor (proceso del lexer)
+# ------------------------------------------------
+def _produce(code, shm_name, slots, batch, free, filled):
+    shm = shared_memory.SharedMemory(shm_name)
+    buf, size = shm.buf, _slot_size(batch)
+    tokens = bulk_regex.finditer(code, lead_regex.match(code).end())
+    i = 0
+    try:
+        while True:
+            kinds, starts, ends = array('B'), array('i'), array('i')
+            add_kind, add_start, add_end = kinds.append, starts.append, ends.append
+            for mo in islice(tokens, batch):
+                k = mo.lastindex
+                s, e = mo.span(k)
+                add_kind(k); add_start(s); add_end(e)
+            n = len(kinds)
+            if BULK_MISMATCH in kinds:
+                n, starts = -1, array('i', [starts[kinds.index(BULK_MISMATCH)]])
+            free.acquire()
+            off = (i % slots) * size
+            buf[off:off + 4] = array('i', [n]).tobytes()
+            if n >= 0:
+                buf[off + 4:off + 4 + 4 * n] = starts.tobytes()
+                buf[off + 4 + 4 * batch:off + 4 + 4 * batch + 4 * n] = ends.tobytes()
+                buf[off + 4 + 8 * batch:off + 4 + 8 * batch + n] = kinds.tobytes()
+            else:
+                buf[off + 4:off + 8] = starts.tobytes()
+            filled.release()
+            i += 1
+            if n < batch:
+                return
+    finally:
+        del buf
+        shm.close()
+
+# ------------------------------------------------
+# Consumidor
+# ------------------------------------------------
+class TokenStream:
+    """Tokens (kind, val, offset) que llegan por el anillo; acceso hacia adelante."""
+    def __init__(self, code, shm, slots, batch, free, filled, lines, proc):
+        self.code, self.shm, self.slots, self.batch_size = code, shm, slots, batch
+        self.free, self.filled, self.lines, self.proc = free, filled, lines, proc
+        self.base, self.batch, self.slot = 0, [], 0
+        self.done = False
+
+    def __getitem__(self, i):
+        while i >= self.base + len(self.batch):
+            self._next_batch()
+        return self.batch[i - self.base]
+
+    def _wait(self):
+        # Si el lexer muere, nadie libera `filled`: se espera por tramos y
+        # se revisa el proceso. Una ranura publicada justo antes de salir
+        # sigue disponible, por eso se intenta una vez más sin bloquear.
+        while not self.filled.acquire(timeout=_ESPERA):
+            if self.proc.exitcode is not None and not self.filled.acquire(block=False):
+                raise RuntimeError(f"el proceso del lexer terminó con código {self.proc.exitcode}")
+
+    def _next_batch(self):
+        if self.done:
+            raise IndexError(self.base + len(self.batch))
+        self._wait()
+        buf, batch = self.shm.buf, self.batch_size
+        off = self.slot * _slot_size(batch)
+        n = _ints(buf[off:off + 4])[0]
+        if n < 0:
+            pos = _ints(buf[off + 4:off + 8])[0]
+            del buf
+            self.free.release()
+            line, col = self.lines.position(pos)
+            raise LexError(f"Unexpected '{self.code[pos]}' en {line}:{col}", pos)
+        starts = _ints(buf[off + 4:off + 4 + 4 * n])
+        ends = _ints(buf[off + 4 + 4 * batch:off + 4 + 4 * batch + 4 * n])
+        kinds = bytes(buf[off + 4 + 8 * batch:off + 4 + 8 * batch + n])
+        del buf
+        self.free.release()
+        self.slot = (self.slot + 1) % self.slots
+
+        code = self.code
+        values = list(map(code.__getitem__, map(slice, starts, ends)))
+        nums = list(compress(range(n), map(BULK_NUMBER.__eq__, kinds)))
+        for j, val in zip(nums, map(_number, map(values.__getitem__, nums))):
+            values[j] = val
+        self.base += len(self.batch)
+        self.batch = list(zip(map(BULK_KINDS.__getitem__, kinds), values, starts))
+        if n < batch:
+            self.batch.append(('EOF', None, len(code)))
+            self.done = True
+
+def pipelined_parse(code, slots=64, batch=4096):
+    """(ast, lines) como `Parser(Lexer(code).tokenize(), lines).parse()`, en tubería."""
+    if len(code) >= 2**31:
+        raise ValueError("los offsets del anillo son de 32 bits")
+    ctx = multiprocessing.get_context('fork')   # el hijo hereda `code` sin copiarlo
+    free, filled = ctx.Semaphore(slots), ctx.Semaphore(0)
+    shm = shared_memory.SharedMemory(create=True, size=slots * _slot_size(batch))
+    proc = ctx.Process(target=_produce, args=(code, shm.name, slots, batch, free, filled), daemon=True)
+    proc.start()
+    try:
+        lines = LineIndex(code)
+        stream = TokenStream(code, shm, slots, batch, free, filled, lines, proc)
+        try:
+            ast = Parser(stream, lines).parse()
+        except ParseError:
+            # En serie un LexError se reporta antes que cualquier ParseError:
+            # se termina de leer el flujo por si trae uno más adelante
+            while not stream.done:
+                stream._next_batch()
+            raise
+        return ast, lines
+    finally:
+        # Si el Parser falló, el lexer puede estar esperando una ranura libre
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+        shm.close()
+        shm.unlink()
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Léxico y sintaxis en tubería (dos procesos)')
+    ap.add_argument('file')
+    ap.add_argument('--slots', type=int, default=64, help='ranuras del anillo')
+    ap.add_argument('--batch', type=int, default=4096, help='tokens por ranura')
+    args = ap.parse_args()
+    with open(args.file, encoding='utf-8') as f:
+        code = f.read()
+    t0 = time.perf_counter()
+    try:
+        ast, lines = pipelined_parse(code, args.slots, args.batch)
+    except (LexError, ParseError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"{len(ast.decls)} declaraciones en {time.perf_counter() - t0:.3f} s")
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Resolución estática de nombres para el AST de lexer_parser.py.
+
+Se recorre el AST una sola vez después del parseo, con las mismas reglas
+de visibilidad que `validate_types`: un nombre se ve desde su declaración
+en adelante, primero en la función actual y después en el ámbito global, y
+una redefinición conserva la primera declaración. Cada uso queda anotado
+con una dirección fija, así que una pasada posterior o un evaluador ya no
+necesitan buscar nombres en diccionarios:
+
+- `ParamNode`, `VarDeclNode`, `AssignNode` e `IdentifierNode` reciben
+  `slot = (profundidad, índice)`: profundidad GLOBAL (0) o LOCAL (1) y el
+  índice dentro de ese marco. Los parámetros ocupan los primeros índices
+  del marco de su función. Si el nombre no es una variable visible, `slot`
+  queda en None.
+- `FuncCallNode.target` es el `FuncDeclNode` llamado, o None si la función
+  no está declarada o viene de un `import` (no hay nodo en este archivo).
+- `FuncDeclNode.frame_size` es la cantidad de parámetros y locales, y
+  `ProgramNode.frame_size` la de globales (incluidas las importadas).
+
+Los nombres sin resolver se juntan en `Resolver.unresolved`; los mensajes
+de error siguen siendo los del análisis semántico.
+
+Uso:
+    python resolver.py ARCHIVO
+"""
+import sys, argparse
+
+from lexer_parser import (Lexer, Parser, LexError, ParseError, Node, VarDeclNode,
+                          FuncDeclNode, AssignNode, ReturnNode, BinaryOpNode, FuncCallNode,
+                          NumberNode, IdentifierNode, ImportNode)
+
+GLOBAL, LOCAL = 0, 1
+
+class Resolver:
+    def __init__(self, interfaces=None):
+        self.interfaces = Node.interfaces if interfaces is None else interfaces
+        self.globals = {}     # nombre -> ('var', índice) | ('func', FuncDeclNode o None)
+        self.locals = None    # nombre -> índice, dentro de una función
+        self.global_count = 0
+        self.unresolved = []
+
+    def resolve(self, ast):
+        for d in ast.decls:
+            if isinstance(d, FuncDeclNode):
+                self.function(d)
+            elif isinstance(d, ImportNode):
+                self.import_(d)
+            else:
+                self.statement(d)
+        ast.frame_size = self.global_count
+        return ast
+
+    def _new_global(self, name):
+        entry = self.globals[name] = ('var', self.global_count)
+        self.global_count += 1
+        return entry
+
+    # Declaraciones
+    def import_(self, node):
+        iface = self.interfaces.get(node.module)
+        if iface is None:
+            return
+        for name in iface['functions']:
+            self.globals.setdefault(name, ('func', None))
+        for name in iface['globals']:
+            if name not in self.globals:
+                self._new_global(name)
+
+    def declare(self, node):
+        """Slot de una variable nueva; si ya existe en el ámbito, el de la primera."""
+        if self.locals is not None:
+            node.slot = (LOCAL, self.locals.setdefault(node.name, len(self.locals)))
+            return
+        entry = self.globals.get(node.name)
+        if entry is None:
+            entry = self._new_global(node.name)
+        node.slot = (GLOBAL, entry[1]) if entry[0] == 'var' else None
+
+    def function(self, node):
+        self.globals.setdefault(node.name, ('func', node))
+        self.locals = {}
+        for p in node.params:
+            self.declare(p)
+        for stmt in node.body:
+            self.statement(stmt)
+        node.frame_size = len(self.locals)
+        self.locals = None
+
+    # Sentencias y expresiones
+    def statement(self, node):
+        if isinstance(node, VarDeclNode):
+            self.declare(node)
+        elif isinstance(node, AssignNode):
+            node.slot = self.lookup(node)
+            self.expr(node.expr)
+        elif isinstance(node, ReturnNode):
+            self.expr(node.expr)
+        else:
+            self.expr(node)
+
+    def lookup(self, node):
+        if self.locals is not None:
+            i = self.locals.get(node.name)
+            if i is not None:
+                return (LOCAL, i)
+        entry = self.globals.get(node.name)
+        if entry is not None and entry[0] == 'var':
+            return (GLOBAL, entry[1])
+        self.unresolved.append(node)
+        return None
+
+    def expr(self, node):
+        if isinstance(node, IdentifierNode):
+            node.slot = self.lookup(node)
+        elif isinstance(node, BinaryOpNode):
+            self.expr(node.left)
+            self.expr(node.right)
+        elif isinstance(node, FuncCallNode):
+            for a in node.args:
+                self.expr(a)
+            entry = None
+            if self.locals is None or node.name not in self.locals:
+                entry = self.globals.get(node.name)
+            if entry is not None and entry[0] == 'func':
+                node.target = entry[1]      # None si es importada
+            else:
+                node.target = None
+                self.unresolved.append(node)
+        elif not isinstance(node, NumberNode):
+            raise TypeError(f"expresión inesperada: {type(node).__name__}")
+
+def resolve(ast, interfaces=None):
+    """Anota el AST en el lugar; retorna el Resolver (con `unresolved`)."""
+    r = Resolver(interfaces)
+    r.resolve(ast)
+    return r
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Resuelve nombres a slots (profundidad, índice)')
+    ap.add_argument('file')
+    args = ap.parse_args()
+    with open(args.file, encoding='utf-8') as f:
+        code = f.read()
+    try:
+        lexer = Lexer(code)
+        ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+    except (LexError, ParseError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    r = resolve(ast)
+    print(f"globales: {ast.frame_size}")
+    for d in ast.decls:
+        if isinstance(d, FuncDeclNode):
+            print(f"{d.name}: marco de {d.frame_size}")
+    for n in r.unresolved:
+        line, col = lexer.lines.position(n.pos)
+        print(f"{line}:{col}: '{n.name}' sin resolver")
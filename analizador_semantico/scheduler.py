@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Verificación en paralelo de un proyecto de módulos `.src` (ver modules.py),
+siguiendo el grafo de dependencias.
+
+1. Lectura rápida: de cada archivo solo se extraen los imports y la
+   interfaz (firmas y globales de nivel superior) con `modules.skim`, que
+   salta los cuerpos de las funciones sin tokenizarlos.
+2. Grafo de módulos: los ciclos de imports se agrupan en componentes
+   fuertemente conexas (`callgraph.tarjan`), y cada componente se verifica
+   como una sola tarea.
+3. Un pool de procesos recibe todas las componentes a la vez. Cada una se
+   verifica con las interfaces del paso 1, así que no espera a las que
+   importa. Los errores se reportan en orden de dependencias, sin importar
+   en qué orden terminen los workers.
+
+Con `--serial` se hace lo mismo en el proceso principal, sin pool, que es
+la línea base para medir la aceleración.
+
+Uso:
+    python scheduler.py PROYECTO [-j N] [--serial] [--stats]
+"""
+import os, sys, json, time, argparse
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer_parser import LexError, ParseError
+from callgraph import tarjan
+from modules import EXT, parse_source, skim, check_module
+
+# ------------------------------------------------
+# Grafo de dependencias
+# ------------------------------------------------
+def strongly_connected(graph):
+    """
+    Componentes fuertemente conexas de `graph` {nodo: [sucesores]}: se pasa
+    a arreglos CSR y se usa `callgraph.tarjan`. Cada componente sale después
+    de todas las que alcanza, o sea, primero lo importado. Se ignoran
+    sucesores que no son nodos.
+    """
+    nodes = list(graph)
+    number = {v: i for i, v in enumerate(nodes)}
+    offsets, targets = array('l', [0]), array('l')
+    for v in nodes:
+        targets.extend(number[w] for w in graph[v] if w in number)
+        offsets.append(len(targets))
+    return [sorted(nodes[i] for i in c) for c in tarjan(offsets, targets)]
+
+# ------------------------------------------------
+# Verificación de una componente (corre en un worker)
+# ------------------------------------------------
+def check_group(project, names, interfaces):
+    """{módulo: errores} de los módulos `names`, con las interfaces que importan."""
+    results = {}
+    for name in names:
+        with open(os.path.join(project, name + EXT), encoding='utf-8') as f:
+            text = f.read()
+        try:
+            ast, lines = parse_source(text)
+        except (LexError, ParseError) as e:
+            results[name] = [f"{name}{EXT}: Error: {e}"]
+            continue
+        errors = check_module(ast, lines, interfaces)
+        results[name] = [f"{name}{EXT}:{e}" for e in errors]
+    return results
+
+# ------------------------------------------------
+# Planificador
+# ------------------------------------------------
+def plan(project):
+    """Lee rápido el proyecto: (componentes en orden de dependencias, imports, interfaces)."""
+    imports, interfaces = {}, {}
+    for de in sorted(os.scandir(project), key=lambda de: de.name):
+        if de.name.endswith(EXT) and de.is_file():
+            name = de.name[:-len(EXT)]
+            with open(de.path, encoding='utf-8') as f:
+                imports[name], interfaces[name] = skim(f.read())
+    return strongly_connected(imports), imports, interfaces
+
+def _imported(group, imports, interfaces):
+    return {d: interfaces[d] for m in group for d in imports[m] if d in interfaces}
+
+def check_serial(project, components, imports, interfaces):
+    results = {}
+    for group in components:
+        results.update(check_group(project, group, _imported(group, imports, interfaces)))
+    return results
+
+def check_parallel(project, components, imports, interfaces, jobs=None):
+    """
+    Todas las componentes van al pool a la vez: cada una se verifica contra
+    las interfaces de `plan`, no contra el resultado de las que importa, así
+    que esperarlas solo serializaría las cadenas de imports.
+    """
+    results = {}
+    with ProcessPoolExecutor(jobs) as pool:
+        futures = [pool.submit(check_group, project, group, _imported(group, imports, interfaces))
+                   for group in components]
+        for fut in futures:
+            results.update(fut.result())
+    # Mismo orden que la verificación serial
+    return {m: results[m] for group in components for m in group}
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser(description='Verificación paralela de un proyecto de módulos .src')
+    ap.add_argument('project', help='directorio con los archivos .src')
+    ap.add_argument('-j', '--jobs', type=int, default=None, help='procesos (por defecto, uno por CPU)')
+    ap.add_argument('--serial', action='store_true', help='sin pool, en el proceso principal')
+    ap.add_argument('--stats', action='store_true', help='imprime en stderr tiempos y tamaño de las componentes')
+    args = ap.parse_args()
+    t0 = time.perf_counter()
+    components, imports, interfaces = plan(args.project)
+    t1 = time.perf_counter()
+    if args.serial:
+        results = check_serial(args.project, components, imports, interfaces)
+    else:
+        results = check_parallel(args.project, components, imports, interfaces, args.jobs)
+    t2 = time.perf_counter()
+    status = 0
+    for errors in results.values():
+        for e in errors:
+            print(e)
+            status = 1
+    if status == 0:
+        print(f"¡{len(results)} módulos sin errores!")
+    if args.stats:
+        print(json.dumps({'modules': len(results), 'components': len(components),
+                          'largest_component': max(map(len, components), default=0),
+                          'skim_seconds': round(t1 - t0, 4), 'check_seconds': round(t2 - t1, 4)}),
+              file=sys.stderr)
+    sys.exit(status)
@@ -0,0 +1,102 @@
+"""
+Pruebas de `compile_token_spec` (lexer_parser.py).
+
+- Los operadores de dos caracteres (`==`, `!=`, `<=`, `>=`) salen como un
+  solo token sin importar el orden de las reglas en `token_spec`.
+- Las reglas ocultas o inalcanzables lanzan TokenSpecError.
+
+Uso (desde la raíz del repositorio):
+    python -m pytest analizador_semantico/tests
+"""
+import itertools
+import os
+import random
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lexer_parser import Lexer, TokenSpecError, compile_token_spec, token_spec  # noqa: E402
+
+OPERATORS = [
+    ('ASSIGN', r"="), ('NOT', r"!"),
+    ('LT', r"<"), ('LE', r"<="),
+    ('GT', r">"), ('GE', r">="),
+    ('EQ', r"=="), ('NE', r"!="),
+]
+BASE = [('ID', r"[A-Za-z_][A-Za-z0-9_]*"), ('SKIP', r"[ \t\r\n]+")]
+SOURCE = "a==b!=c<=d>=e<f>g=h !i"
+EXPECTED = ['ID', 'EQ', 'ID', 'NE', 'ID', 'LE', 'ID', 'GE', 'ID', 'LT', 'ID', 'GT', 'ID',
+            'ASSIGN', 'ID', 'NOT', 'ID']
+
+def kinds(spec, text):
+    ordered = compile_token_spec(spec)
+    regex = re.compile("|".join(f"(?P<{n}>{r})" for n, r in ordered))
+    return [mo.lastgroup for mo in regex.finditer(text) if mo.lastgroup != 'SKIP']
+
+class MultiCharOperators(unittest.TestCase):
+    def test_every_order_of_the_comparison_rules(self):
+        comparisons = OPERATORS[2:]
+        for perm in itertools.permutations(comparisons):
+            spec = BASE + OPERATORS[:2] + list(perm)
+            self.assertEqual(kinds(spec, SOURCE), EXPECTED, perm)
+
+    def test_shuffled_specs(self):
+        rnd = random.Random(0)
+        for _ in range(200):
+            ops = OPERATORS[:]
+            rnd.shuffle(ops)
+            spec = BASE[:1] + ops + BASE[1:]
+            self.assertEqual(kinds(spec, SOURCE), EXPECTED, ops)
+
+    def test_single_char_first(self):
+        spec = BASE + sorted(OPERATORS, key=lambda nr: len(nr[1]))
+        self.assertEqual(kinds(spec, SOURCE), EXPECTED)
+
+    def test_lexer_token_spec(self):
+        toks = [t[0] for t in Lexer("a == b != c <= d >= e < f > g = h").tokenize()]
+        self.assertEqual(toks, ['ID', 'EQ', 'ID', 'NE', 'ID', 'LE', 'ID', 'GE', 'ID',
+                                'LT', 'ID', 'GT', 'ID', 'ASSIGN', 'ID', 'EOF'])
+
+    def test_module_spec_is_ordered(self):
+        names = [n for n, _ in token_spec]
+        for long_, short in (('EQ', 'ASSIGN'), ('LE', 'LT'), ('GE', 'GT')):
+            self.assertLess(names.index(long_), names.index(short))
+
+class InvalidSpecs(unittest.TestCase):
+    def check(self, spec, fragment):
+        with self.assertRaises(TokenSpecError) as cm:
+            compile_token_spec(spec)
+        self.assertIn(fragment, str(cm.exception))
+
+    def test_duplicate_names(self):
+        self.check([('A', r"a"), ('A', r"b")], 'duplicadas')
+
+    def test_empty_match(self):
+        self.check([('A', r"a*")], 'cadena vacía')
+
+    def test_capture_group(self):
+        self.check([('A', r"(a)b")], 'grupos de captura')
+
+    def test_literal_shadowed_by_regex(self):
+        self.check([('EQS', r"=+"), ('ASSIGN', r"=")], 'ASSIGN')
+
+    def test_keyword_that_is_also_an_identifier(self):
+        self.check(BASE + [('IF', r"if")], 'IF')
+
+    def test_rules_after_wildcard(self):
+        self.check([('ANY', r"."), ('PLUS', r"\+")], 'inalcanzables')
+
+    def test_regex_shadowed_by_earlier_regex(self):
+        self.check([('WORD', r"[a-z]+"), ('ABC', r"[a-c]+")], 'ABC')
+
+    def test_digits_shadowed_by_identifier_rule(self):
+        self.check([('ALNUM', r"[A-Za-z0-9]+"), ('NUMBER', r"\d+")], 'NUMBER')
+
+    def test_overlapping_regexes_are_fine(self):
+        # ALNUM pierde ante WORD en 'ab' pero gana en '1a'
+        spec = [('WORD', r"[a-z]+"), ('ALNUM', r"[a-z0-9]+")]
+        self.assertEqual([n for n, _ in compile_token_spec(spec)], ['WORD', 'ALNUM'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Utilidades comunes para los benchmarks del repositorio.
+
+Cada fase del curso vive en su propio directorio (con espacios y acentos en
+el nombre) y varios módulos se llaman igual (`main.py`, `lexer_parser.py`),
+así que aquí se cargan por ruta y con un nombre único.
+"""
+
+import os
+import runpy
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS = {
+    'semantico': os.path.join('analizador_semantico', 'lexer_parser.py'),
+    'traductor': os.path.join('construccion traductor', 'lexer_parser.py'),
+    'gramatica': os.path.join('Gramatica del compilador', 'main.py'),
+    'gramatica_ast': os.path.join('Gramatica del compilador', 'ast_semantico.py'),
+    'gramatica_glr': os.path.join('Gramatica del compilador', 'glr.py'),
+    'sintactico': os.path.join('Analizador Sintáctico', 'main.py'),
+    'avances': os.path.join('Avances en la Construcción de tu Traductor', 'main.py'),
+    'lexico': os.path.join('Analizador léxico', 'main.py'),
+}
+
+# El mismo cargador que usan los main.py
+importar = runpy.run_path(os.path.join(RAIZ, 'Analizador Sintáctico', 'cargador.py'))['importar']
+
+
+def cargar_modulo(clave):
+    """Importa uno de los módulos de `MODULOS` (una sola vez)."""
+    return importar(f"_bench_{clave}", os.path.join(RAIZ, MODULOS[clave]))
+
+
+def medir(func, *args, repeticiones=5):
+    """Ejecuta `func(*args)` varias veces; retorna (mejor tiempo, resultado)."""
+    mejor = float('inf')
+    resultado = None
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = func(*args)
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, resultado
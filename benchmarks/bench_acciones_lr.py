@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Costo de las acciones semánticas en `parser_lr` (Gramatica del compilador):
+
+- solo reconocer (sin pila de valores),
+- pila de valores con la tupla genérica (nt_name, hijos) por reducción,
+- constructores de ast_semantico.ACCIONES (nodos del analizador semántico).
+
+Uso:
+    python -m benchmarks.bench_acciones_lr [funciones]
+"""
+
+import os
+import sys
+
+from benchmarks import RAIZ, cargar_modulo, medir
+from benchmarks.generadores import programa_compilador
+
+
+def main():
+    funciones = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    ast_mod, gram = cargar_modulo('gramatica_ast'), cargar_modulo('gramatica')
+    rules, _, _, table = gram.leer_lr_file(os.path.join(RAIZ, 'Gramatica del compilador', 'compilador.lr'))
+    tokens = ast_mod.tokenizar(programa_compilador(semilla=5, globales=funciones, funciones=funciones), gram)
+
+    stats = {}
+    gram.parser_lr(tokens, rules, table, stats=stats, traza=False)
+    reducciones = stats['reductions']
+
+    t_solo, _ = medir(lambda: gram.parser_lr(tokens, rules, table, traza=False))
+    t_tuplas, _ = medir(lambda: gram.parser_lr(tokens, rules, table, valores=[], traza=False))
+    t_ast, raiz = medir(gram.parser_lr_ast, tokens, rules, table, ast_mod.ACCIONES)
+    assert raiz is not None
+    assert all(d.pos is not None for d in raiz.decls)
+
+    print(f"=== {len(tokens)} tokens, {reducciones} reducciones ===")
+    for nombre, t in (('solo reconocer', t_solo), ('tuplas genéricas', t_tuplas), ('AST (ACCIONES)', t_ast)):
+        extra = (t - t_solo) * 1e9 / reducciones
+        print(f"{nombre:18s} {t * 1000:9.2f} ms   +{extra:7.1f} ns/reducción")
+
+
+if __name__ == '__main__':
+    main()
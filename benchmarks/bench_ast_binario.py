@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AST binario (`analizador_semantico/ast_binary.py`) contra `pickle`.
+
+Sobre el AST de un fuente de prueba se mide:
+- tamaño en disco;
+- escritura (`dumps` / `pickle.dumps`);
+- carga: `pickle.loads` (reconstruye todos los objetos), `AstView.open`
+  (mapea el archivo y valida las tablas), recorrer todos los nodos por índice desde el
+  mmap y `to_node()` (reconstruir los objetos Node);
+- consulta puntual: nombres de las funciones del nivel superior, que con el
+  mmap solo toca esos nodos.
+
+Se verifica que `to_node()` y `pickle.loads` den el mismo árbol.
+
+Uso:
+    python -m benchmarks.bench_ast_binario [megabytes]
+"""
+
+import gc
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+from benchmarks import RAIZ
+from benchmarks.bench_lexer_bulk import generar_fuente
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+sys.setrecursionlimit(100000)   # pickle recorre el AST recursivamente
+from lexer_parser import Lexer, Parser, Node, FuncDeclNode  # noqa: E402
+import ast_binary  # noqa: E402
+
+
+def _medir(func):
+    gc.collect()
+    t0 = time.perf_counter()
+    resultado = func()
+    return time.perf_counter() - t0, resultado
+
+
+def _recorrer(vista):
+    total, pendientes = 0, [0]
+    while pendientes:
+        i = pendientes.pop()
+        total += 1
+        pendientes.extend(vista.children(i))
+    return total
+
+
+def _funciones(vista):
+    return [d.name for d in vista.root.decls if d.type is FuncDeclNode]
+
+
+def _plano(nodo):
+    pendientes, salida = [nodo], []
+    while pendientes:
+        n = pendientes.pop()
+        if isinstance(n, list):
+            salida.append(len(n))
+            pendientes.extend(n)
+        elif isinstance(n, Node):
+            atributos = sorted(vars(n).items())
+            salida.append((type(n).__name__, [(k, v) for k, v in atributos if not isinstance(v, (Node, list))]))
+            pendientes.extend(v for _, v in atributos if isinstance(v, (Node, list)))
+    return salida
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+    fuente = generar_fuente(mb)
+    lexer = Lexer(fuente)
+    ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+    print(f"=== Fuente de {len(fuente) / 1e6:.1f} MB ===")
+
+    t_pickle, datos_pickle = _medir(lambda: pickle.dumps(ast, pickle.HIGHEST_PROTOCOL))
+    t_bin, datos_bin = _medir(lambda: ast_binary.dumps(ast))
+    print(f"{'tamaño pickle':28s} {len(datos_pickle) / 1e6:8.2f} MB   escritura {t_pickle:7.3f} s")
+    print(f"{'tamaño binario':28s} {len(datos_bin) / 1e6:8.2f} MB   escritura {t_bin:7.3f} s"
+          f"   ({len(datos_bin) / len(datos_pickle):.2f} del pickle)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, 'ast.astb')
+        with open(ruta, 'wb') as f:
+            f.write(datos_bin)
+        del datos_bin
+
+        t_load, copia = _medir(lambda: pickle.loads(datos_pickle))
+        print(f"{'pickle.loads':28s} {t_load:8.3f} s")
+
+        t_open, vista = _medir(lambda: ast_binary.AstView.open(ruta))
+        t_walk, n = _medir(lambda: _recorrer(vista))
+        t_funcs, nombres = _medir(lambda: _funciones(vista))
+        t_nodes, arbol = _medir(vista.to_node)
+        print(f"{'AstView.open (mmap)':28s} {t_open:8.6f} s")
+        print(f"{'  recorrer {:,} nodos'.format(n):28s} {t_walk:8.3f} s")
+        print(f"{'  {:,} nombres de funciones'.format(len(nombres)):28s} {t_funcs:8.3f} s")
+        print(f"{'  to_node()':28s} {t_nodes:8.3f} s")
+        assert _plano(arbol) == _plano(copia)
+        del arbol, copia
+        vista.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diagnósticos estructurados (`analizador_semantico/lexer_parser.py`) sobre
+un fuente con un error semántico por línea.
+
+- "todo formateado": sin límite y pidiendo `errors`, que arma cada mensaje
+  como hacía el análisis antes (un `str` por error).
+- "registros": sin límite, solo los `Diagnostic` (código, offset,
+  argumentos), sin formatear.
+- "límite N": corta el análisis al llegar a N errores (`MAX_ERRORS` por
+  defecto).
+
+Por cada modo se mide el tiempo del análisis semántico y la memoria pico
+(tracemalloc). Formatear incluye armar una vez el `LineIndex` del fuente
+para el prefijo `línea:columna`.
+
+Uso:
+    python -m benchmarks.bench_diagnosticos [lineas] [--limite N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from benchmarks import RAIZ
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+from lexer_parser import Lexer, Parser, Node, SymbolTable, MAX_ERRORS  # noqa: E402
+
+
+def fuente_con_errores(lineas):
+    """Funciones `int` que retornan float y asignan a variables sin declarar (todos distintos)."""
+    out = []
+    for i in range(0, lineas, 3):
+        out.append(f"int f{i}() {{\n    x{i} = 1;\n    return 1.5;\n}}\n")
+    return ''.join(out)
+
+
+def _analizar(ast, lines, limite, formatear):
+    Node.tabla_simbolos = SymbolTable(lines, limite)
+    Node.ambito = ''
+    ast.validate_types()
+    tabla = Node.tabla_simbolos
+    return tabla.errors if formatear else tabla.diagnostics
+
+
+def _medir(ast, lines, limite, formatear):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    resultado = _analizar(ast, lines, limite, formatear)
+    t = time.perf_counter() - t0
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return t, pico, len(resultado)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('lineas', nargs='?', type=int, default=600000)
+    ap.add_argument('--limite', type=int, default=MAX_ERRORS)
+    args = ap.parse_args()
+
+    lexer = Lexer(fuente_con_errores(args.lineas))
+    ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+    print(f"=== {args.lineas:,} líneas ===")
+    modos = [('todo formateado', None, True), ('registros', None, False),
+             (f'límite {args.limite}', args.limite, True)]
+    for nombre, limite, formatear in modos:
+        t, pico, n = _medir(ast, lexer.lines, limite, formatear)
+        print(f"{nombre:20s} {t:8.3f} s   pico {pico / 1e6:8.1f} MB   {n:,} errores")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Escalamiento del análisis de flujo de datos
+(`analizador_semantico/dataflow.py`) con el tamaño de la función.
+
+Para funciones de `funcion_extensa()` con cada vez más locales (y cinco
+asignaciones por local) se mide la resolución de nombres, las definiciones
+alcanzantes (lecturas sin asignar) y las variables vivas (stores muertos).
+Con un costo casi lineal, el tiempo por sentencia se mantiene parejo al
+duplicar el tamaño.
+
+Uso:
+    python -m benchmarks.bench_flujo [max_locales]
+"""
+
+import os
+import sys
+
+from benchmarks import RAIZ, medir
+from benchmarks.generadores import funcion_extensa
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+from lexer_parser import Lexer, Parser  # noqa: E402
+from resolver import resolve  # noqa: E402
+from dataflow import FunctionFlow  # noqa: E402
+
+
+def main():
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 16000
+    print(f"{'locales':>8s} {'sentencias':>10s} {'resolver':>9s} {'sin asignar':>12s}"
+          f" {'muertos':>9s} {'µs/sentencia':>13s}")
+    locales = 1000
+    while locales <= maximo:
+        sentencias = 5 * locales
+        lexer = Lexer(funcion_extensa(locales, sentencias, semilla=locales))
+        ast = Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+        t_res, _ = medir(resolve, ast, repeticiones=1)
+        flujo = FunctionFlow(ast.decls[0])
+        t_ini, lecturas = medir(flujo.uninitialized, repeticiones=3)
+        t_muertos, stores = medir(flujo.dead_stores, repeticiones=3)
+        total = t_ini + t_muertos
+        print(f"{locales:8d} {sentencias + locales:10d} {t_res:8.3f}s {t_ini:11.3f}s"
+              f" {t_muertos:8.3f}s {total / (sentencias + locales) * 1e6:13.2f}"
+              f"   ({len(lecturas)} sin asignar, {len(stores)} muertos)")
+        locales *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parser GLR de `Gramatica del compilador/glr.py`:
+
+- determinista: tabla de compilador.lr (sin conflictos), `parser_lr` vs.
+  `parser_glr` sobre el mismo programa;
+- ambiguo por regiones: tabla SLR de GRAMATICA_COMPILADOR (expresiones sin
+  precedencia), el mismo programa;
+- totalmente ambiguo: E -> E + E | id con n identificadores (Catalan(n-1)
+  árboles en un bosque de tamaño polinomial).
+
+Uso:
+    python -m benchmarks.bench_glr [funciones]
+"""
+
+import os
+import sys
+
+from benchmarks import cargar_modulo, medir
+from benchmarks.generadores import programa_compilador
+
+
+def main():
+    funciones = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    glr, gram = cargar_modulo('gramatica_glr'), cargar_modulo('gramatica')
+    rules, _, _, table = gram.leer_lr_file(os.path.join(glr._AQUI, 'compilador.lr'))
+    tokens = glr.tokenizar(programa_compilador(semilla=6, globales=funciones, funciones=funciones), gram)
+
+    print(f"=== Programa de {len(tokens)} tokens ===")
+    t_lr, ok = medir(lambda: gram.parser_lr(tokens, rules, table, traza=False))
+    assert ok
+    t_val, _ = medir(lambda: gram.parser_lr(tokens, rules, table, valores=[], traza=False))
+    t_glr, raiz = medir(glr.parser_glr, tokens, rules, table)
+    assert raiz is not None
+    print(f"{'parser_lr (compilador.lr)':34s} {t_lr * 1000:9.2f} ms")
+    print(f"{'parser_lr con valores=[]':34s} {t_val * 1000:9.2f} ms  x{t_val / t_lr:.2f}")
+    print(f"{'parser_glr (compilador.lr)':34s} {t_glr * 1000:9.2f} ms  x{t_glr / t_lr:.2f}")
+
+    slr = glr.tabla_slr(glr.GRAMATICA_COMPILADOR, glr.TERMINALES, glr.NO_TERMINALES)
+    stats = {}
+    glr.parser_glr(tokens, *slr, stats=stats)
+    t_slr, raiz = medir(glr.parser_glr, tokens, *slr)
+    ambiguos = len(glr.nodos_ambiguos(raiz))
+    print(f"{'parser_glr (SLR, sin precedencia)':34s} {t_slr * 1000:9.2f} ms  x{t_slr / t_lr:.2f}"
+          f"  ({len(slr[2])} celdas en conflicto, {stats['forks']} tokens bifurcados,"
+          f" {ambiguos} nodos ambiguos)")
+
+    print("\n=== E -> E + E | id ===")
+    rules_e, table_e, conf_e = glr.tabla_slr([('E', ['E', '+', 'E']), ('E', ['id'])],
+                                             ['id', '+', '$'], ['E'])
+    for n in (10, 20, 40, 80):
+        toks = [(0, 'id')] + [(1, '+'), (0, 'id')] * (n - 1) + [(2, '$')]
+        t, raiz = medir(glr.parser_glr, toks, rules_e, table_e, conf_e, repeticiones=3)
+        print(f"n={n:3d} {t * 1000:9.2f} ms  {len(glr.nodos_ambiguos(raiz)):5d} nodos ambiguos"
+              f"  {glr.contar_arboles(raiz):.3e} árboles")
+
+
+if __name__ == '__main__':
+    main()
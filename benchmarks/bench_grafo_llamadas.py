@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Grafo de llamadas (`analizador_semantico/callgraph.py`) sobre programas de
+`programa_llamadas()` con muchas funciones.
+
+Se mide cada paso por separado: parseo, resolución de nombres, armado del
+grafo (arreglos CSR), componentes (Tarjan iterativo sobre los arreglos),
+funciones inalcanzables y niveles. Las componentes se comparan con
+`scheduler.strongly_connected`, que recibe el mismo grafo como diccionario
+y lo pasa a CSR antes de llamar a `tarjan`; la diferencia es el costo de
+esa conversión.
+
+Uso:
+    python -m benchmarks.bench_grafo_llamadas [funciones]
+"""
+
+import os
+import sys
+
+from benchmarks import RAIZ, medir
+from benchmarks.generadores import programa_llamadas
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+from lexer_parser import Lexer, Parser  # noqa: E402
+from resolver import resolve  # noqa: E402
+from callgraph import CallGraph  # noqa: E402
+from scheduler import strongly_connected  # noqa: E402
+
+
+def _parsear(fuente):
+    lexer = Lexer(fuente)
+    return Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    fuente = programa_llamadas(n, semilla=1, llamadas=3, recursivas=0.01)
+    print(f"=== {n:,} funciones, {len(fuente) / 1e6:.1f} MB ===")
+
+    t_parse, ast = medir(_parsear, fuente, repeticiones=1)
+    t_res, _ = medir(resolve, ast, repeticiones=1)
+    t_graph, g = medir(CallGraph, ast, repeticiones=3)
+    t_scc, comps = medir(g.components, repeticiones=3)
+    t_unr, sin_uso = medir(g.unreachable, repeticiones=3)
+    t_lv, niveles = medir(g.levels, comps, repeticiones=3)
+    recursivas = g.recursive(comps)
+
+    adyacencia = {i: list(g.callees(i)) for i in range(len(g))}
+    t_dict, ref = medir(strongly_connected, adyacencia, repeticiones=3)
+    assert sorted(ref) == sorted(comps)
+
+    print(f"{'parseo':28s} {t_parse:8.3f} s")
+    print(f"{'resolución':28s} {t_res:8.3f} s")
+    print(f"{'grafo ({:,} aristas)'.format(len(g.targets)):28s} {t_graph:8.3f} s")
+    print(f"{'componentes (arreglos)':28s} {t_scc:8.3f} s   {len(recursivas)} recursivas")
+    print(f"{'componentes (diccionarios)':28s} {t_dict:8.3f} s")
+    print(f"{'inalcanzables':28s} {t_unr:8.3f} s   {len(sin_uso):,} funciones")
+    print(f"{'niveles':28s} {t_lv:8.3f} s   {len(niveles)} niveles,"
+          f" el mayor con {max(len(lv) for lv in niveles):,} componentes")
+    print(f"{'grafo completo':28s} {t_graph + t_scc + t_unr + t_lv:8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
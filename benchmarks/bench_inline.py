@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Inlining (`analizador_semantico/inline.py`) sobre programas de
+`programa_llamadas()`: muchas funciones pequeñas que se llaman entre sí.
+
+- Nodos del AST y llamadas estáticas antes y después del inlining.
+- Análisis semántico del programa resultante: no debe tener errores, y
+  el texto de `to_source()` vuelve a parsear al mismo AST.
+- Tiempo de ejecución de `main` con un evaluador por slots (resolver.py),
+  antes y después: cuenta las llamadas dinámicas y compara el resultado.
+  El evaluador usa enteros de 32 bits, división por cero igual a 0, da a
+  las comparaciones el tipo de la operación y convierte al tipo declarado
+  al asignar, pasar argumentos y retornar.
+
+Uso:
+    python -m benchmarks.bench_inline [funciones] [--llamadas N] [--max-callee N] [--max-growth X]
+"""
+
+import argparse
+import math
+import os
+import sys
+
+from benchmarks import RAIZ, medir
+from benchmarks.generadores import programa_llamadas
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+from lexer_parser import (Lexer, Parser, Node, SymbolTable, FuncDeclNode, VarDeclNode,  # noqa: E402
+                          AssignNode, ReturnNode, BinaryOpNode, FuncCallNode, NumberNode,
+                          IdentifierNode, count_nodes)
+from resolver import resolve  # noqa: E402
+from callgraph import _calls  # noqa: E402
+from inline import inline, to_source  # noqa: E402
+
+
+def _parsear(fuente):
+    lexer = Lexer(fuente)
+    return Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+
+
+def _semantico(ast):
+    Node.tabla_simbolos = SymbolTable()
+    Node.ambito = ''
+    ast.validate_types()
+    return Node.tabla_simbolos.errors
+
+
+def _llamadas(ast):
+    return sum(1 for d in ast.decls if isinstance(d, FuncDeclNode) for _ in _calls(d.body))
+
+
+# ====================================================
+# Evaluador por slots
+# ====================================================
+def _a_tipo(tipo, v):
+    if tipo == 'float':
+        return float(v)
+    if isinstance(v, float):
+        v = int(v) if math.isfinite(v) else 0
+    return (v + 2**31) % 2**32 - 2**31
+
+
+def _binaria(op, a, b):
+    if op == 'PLUS':
+        r = a + b
+    elif op == 'MINUS':
+        r = a - b
+    elif op == 'TIMES':
+        r = a * b
+    elif op == 'DIVIDE':
+        if b == 0:
+            return 0
+        r = a / b if isinstance(a, float) or isinstance(b, float) else int(a / b)
+    else:   # comparación: 1 o 0, del tipo de la operación (float si hay un float)
+        r = {'LT': a < b, 'LE': a <= b, 'GT': a > b, 'GE': a >= b, 'EQ': a == b, 'NE': a != b}[op]
+        return float(r) if isinstance(a, float) or isinstance(b, float) else int(r)
+    return r if isinstance(r, float) else _a_tipo('int', r)
+
+
+class Evaluador:
+    def __init__(self, ast):
+        self.globales = [0] * ast.frame_size
+        self.tipos_globales = [None] * ast.frame_size
+        self.tipos = {}     # id(FuncDeclNode) -> tipo de cada slot local
+        for d in ast.decls:
+            if isinstance(d, VarDeclNode) and d.slot is not None:
+                self.tipos_globales[d.slot[1]] = d.vtype
+            elif isinstance(d, FuncDeclNode):
+                tipos = [None] * d.frame_size
+                for n in d.params + [s for s in d.body if isinstance(s, VarDeclNode)]:
+                    if tipos[n.slot[1]] is None:
+                        tipos[n.slot[1]] = getattr(n, 'ptype', None) or n.vtype
+                self.tipos[id(d)] = tipos
+        self.llamadas = 0
+
+    def llamar(self, f, valores):
+        self.llamadas += 1
+        tipos = self.tipos[id(f)]
+        marco = [0] * f.frame_size
+        for k, v in enumerate(valores):
+            marco[k] = _a_tipo(tipos[k], v)
+        for s in f.body:
+            if isinstance(s, AssignNode):
+                v = self.expr(s.expr, marco)
+                if s.slot[0]:
+                    marco[s.slot[1]] = _a_tipo(tipos[s.slot[1]], v)
+                else:
+                    self.globales[s.slot[1]] = _a_tipo(self.tipos_globales[s.slot[1]], v)
+            elif isinstance(s, ReturnNode):
+                return _a_tipo(f.return_type, self.expr(s.expr, marco))
+            elif isinstance(s, FuncCallNode):
+                self.expr(s, marco)
+        return 0
+
+    def expr(self, n, marco):
+        if isinstance(n, IdentifierNode):
+            return marco[n.slot[1]] if n.slot[0] else self.globales[n.slot[1]]
+        if isinstance(n, BinaryOpNode):
+            return _binaria(n.op, self.expr(n.left, marco), self.expr(n.right, marco))
+        if isinstance(n, NumberNode):
+            return n.value
+        return self.llamar(n.target, [self.expr(a, marco) for a in n.args])
+
+
+def _ejecutar(ast):
+    ev = Evaluador(ast)
+    main_ = next(d for d in ast.decls if isinstance(d, FuncDeclNode) and d.name == 'main')
+    return ev.llamar(main_, []), ev.llamadas
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('funciones', nargs='?', type=int, default=2000)
+    ap.add_argument('--llamadas', type=int, default=2, help='llamadas por función')
+    ap.add_argument('--max-callee', type=int, default=24)
+    ap.add_argument('--max-growth', type=float, default=4.0)
+    args = ap.parse_args()
+    sys.setrecursionlimit(100000)
+
+    fuente = programa_llamadas(args.funciones, semilla=1, llamadas=args.llamadas, llamadas_main=200)
+    print(f"=== {args.funciones:,} funciones, {args.llamadas} llamadas por función ===")
+    ast = _parsear(fuente)
+    nodos, llamadas = count_nodes(ast), _llamadas(ast)
+    t_sem, errores = medir(_semantico, ast, repeticiones=3)
+    assert not errores
+    resolve(ast)
+    t_run, (valor, dinamicas) = medir(_ejecutar, ast, repeticiones=3)
+
+    copia = _parsear(fuente)
+    t_inl, r = medir(inline, copia, args.max_callee, args.max_growth, repeticiones=1)
+    nodos2, llamadas2 = count_nodes(copia), _llamadas(copia)
+    t_sem2, errores2 = medir(_semantico, copia, repeticiones=3)
+    assert not errores2, errores2[:5]
+    impreso = to_source(copia)
+    assert to_source(_parsear(impreso)) == impreso
+    t_run2, (valor2, dinamicas2) = medir(_ejecutar, copia, repeticiones=3)
+    assert valor == valor2, (valor, valor2)
+
+    print(f"{'inlining':24s} {t_inl:8.3f} s   {r.inlined:,} llamadas reemplazadas")
+    print(f"{'nodos':24s} {nodos:10,} -> {nodos2:,} ({nodos2 / nodos - 1:+.0%})")
+    print(f"{'llamadas estáticas':24s} {llamadas:10,} -> {llamadas2:,} ({llamadas2 / llamadas - 1:+.0%})")
+    print(f"{'análisis semántico':24s} {t_sem:8.3f} s -> {t_sem2:.3f} s")
+    print(f"{'llamadas dinámicas':24s} {dinamicas:10,} -> {dinamicas2:,} ({dinamicas2 / dinamicas - 1:+.0%})")
+    print(f"{'ejecución de main':24s} {t_run:8.3f} s -> {t_run2:.3f} s   x{t_run / t_run2:4.2f}"
+          f"   (resultado {valor})")
+
+
+if __name__ == '__main__':
+    main()
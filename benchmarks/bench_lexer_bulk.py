@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lexer del analizador semántico: `tokenize` (un token por iteración, con
+ramas en Python) contra `tokenize_bulk` (buffer en columnas).
+
+Uso:
+    python -m benchmarks.bench_lexer_bulk [megabytes]
+"""
+
+import sys
+
+from benchmarks import cargar_modulo, medir
+
+FUNCION = """int suma{i}(int a, int b) {{
+    float t;
+    t = a * 2.5 + b / 3;
+    return a + b;
+}}
+"""
+
+
+def generar_fuente(megabytes):
+    partes = []
+    total = 0
+    i = 0
+    while total < megabytes * 1_000_000:
+        bloque = FUNCION.format(i=i)
+        partes.append(bloque)
+        total += len(bloque)
+        i += 1
+    return ''.join(partes)
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    sem = cargar_modulo('semantico')
+    fuente = generar_fuente(mb)
+    print(f"=== Fuente de {len(fuente) / 1e6:.1f} MB ===")
+
+    t_loop, tokens = medir(lambda: sem.Lexer(fuente).tokenize(), repeticiones=3)
+    t_bulk, buf = medir(lambda: sem.Lexer(fuente).tokenize_bulk(), repeticiones=3)
+    t_tup, tuplas = medir(buf.to_tuples, repeticiones=3)
+    assert tuplas == tokens
+
+    n = len(tokens)
+    print(f"tokenize           : {t_loop:.3f} s ({n / t_loop:,.0f} tokens/s)")
+    print(f"tokenize_bulk      : {t_bulk:.3f} s ({n / t_bulk:,.0f} tokens/s)")
+    print(f"bulk + to_tuples   : {t_bulk + t_tup:.3f} s"
+          f" ({n / (t_bulk + t_tup):,.0f} tokens/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lexer vectorizado (`analizador_semantico/lexer_numpy.py`) contra los
+lexers escalares, en tokens por segundo.
+
+- `Lexico.sig_simbolo` (Gramatica del compilador/main.py): un carácter por
+  llamada. Se mide sobre un prefijo de --prefijo MB y se extrapola.
+- `Lexer.tokenize_bulk`: una iteración de la regex por token.
+- `lexer_numpy.scan`: solo columnas (tipo, inicio, fin) en arreglos.
+- `lexer_numpy.tokenize`: el mismo TokenBuffer que `tokenize_bulk` (además
+  crea un `str` por lexema).
+
+Requiere NumPy. Sin NumPy, `lexer_numpy.tokenize` cae en `tokenize_bulk`
+y solo se miden los lexers escalares.
+
+Uso:
+    python -m benchmarks.bench_lexer_numpy [megabytes] [--prefijo MB]
+"""
+
+import argparse
+import gc
+import os
+import sys
+
+from benchmarks import RAIZ, cargar_modulo, medir
+from benchmarks.bench_lexer_bulk import generar_fuente
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+import lexer_numpy  # noqa: E402
+
+
+def _lexico(gramatica, fuente):
+    lexico = gramatica.Lexico(fuente)
+    n = 0
+    while not lexico.terminado():
+        lexico.sig_simbolo()
+        n += 1
+    return n
+
+
+def _reporte(nombre, t, n):
+    print(f"{nombre:28s} {t:8.3f} s   {n / t:14,.0f} tokens/s")
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('megabytes', nargs='?', type=float, default=100)
+    ap.add_argument('--prefijo', type=float, default=2, help='MB para Lexico (escalar por carácter)')
+    args = ap.parse_args()
+
+    sem = cargar_modulo('semantico')
+    gramatica = cargar_modulo('gramatica')
+    fuente = generar_fuente(args.megabytes)
+    print(f"=== Fuente de {len(fuente) / 1e6:.1f} MB, NumPy {'sí' if lexer_numpy.HAVE_NUMPY else 'no'} ===")
+
+    prefijo = fuente[:fuente.rfind('\n', 0, int(args.prefijo * 1e6)) + 1]
+    t, n = medir(_lexico, gramatica, prefijo, repeticiones=1)
+    _reporte(f"Lexico ({len(prefijo) / 1e6:.0f} MB)", t, n)
+
+    t, buf = medir(lambda: sem.Lexer(fuente).tokenize_bulk(), repeticiones=1)
+    n = len(buf) - 1
+    _reporte("Lexer.tokenize_bulk", t, n)
+    del buf
+    gc.collect()
+
+    if lexer_numpy.HAVE_NUMPY:
+        t, cols = medir(lexer_numpy.scan, fuente, repeticiones=3)
+        assert len(cols[0]) == n
+        _reporte("lexer_numpy.scan", t, n)
+        del cols
+        t, buf = medir(lexer_numpy.tokenize, fuente, repeticiones=1)
+        _reporte("lexer_numpy.tokenize", t, n)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+`Lexer.tokenize_bulk` en serie contra `ParallelLexer`
+(`analizador_semantico/parallel_lexer.py`) sobre un solo archivo grande.
+
+Para cada `-j` se mide con un pool nuevo (incluye arrancar los procesos) y
+con un pool ya arrancado. Se verifica que el TokenBuffer sea idéntico al
+serial. Con un solo CPU el paralelo solo agrega el costo de copiar
+columnas por memoria compartida y de armar los lexemas en el proceso
+principal.
+
+Uso:
+    python -m benchmarks.bench_lexer_paralelo [megabytes]
+"""
+
+import gc
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from benchmarks import RAIZ
+from benchmarks.bench_lexer_bulk import generar_fuente
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+from lexer_parser import Lexer  # noqa: E402
+from parallel_lexer import ParallelLexer  # noqa: E402
+
+
+def _medir(func):
+    gc.collect()
+    t0 = time.perf_counter()
+    resultado = func()
+    return time.perf_counter() - t0, resultado
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    fuente = generar_fuente(mb)
+    cpus = os.cpu_count() or 1
+    print(f"=== Fuente de {len(fuente) / 1e6:.1f} MB, {cpus} CPU ===")
+
+    t_serial, base = _medir(lambda: Lexer(fuente).tokenize_bulk())
+    n = len(base) - 1
+    print(f"{'serial (tokenize_bulk)':32s} {t_serial:8.3f} s   {n / t_serial:12,.0f} tokens/s")
+
+    for jobs in sorted({1, 2, 4, cpus}):
+        t, buf = _medir(lambda: ParallelLexer(fuente, jobs).tokenize_bulk())
+        assert buf.kinds == base.kinds and buf.starts == base.starts and buf.values == base.values
+        del buf
+        with ProcessPoolExecutor(jobs) as pool:
+            pool.submit(int).result()
+            t_pool, buf = _medir(lambda: ParallelLexer(fuente, jobs, pool).tokenize_bulk())
+        del buf
+        print(f"{f'paralelo -j {jobs}':32s} {t:8.3f} s   {n / t:12,.0f} tokens/s   x{t_serial / t:4.2f}"
+              f"   (pool arrancado: {t_pool:.3f} s, x{t_serial / t_pool:4.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+`Lexico` sobre bytes con tablas de clases (Gramatica del compilador, y el
+mismo de `Avances en la Construcción de tu Traductor`) contra el algoritmo
+anterior sobre `str` con `isspace`/`isalpha`/`isdigit`, del que se guarda
+aquí una copia de referencia.
+
+Por cada lexer se mide:
+- tokens/s y MB/s consumiendo los tokens sin guardarlos;
+- memoria pico (tracemalloc) de ese recorrido, que solo refleja los objetos
+  temporales (con bytes incluye la copia UTF-8 del fuente);
+- memoria pico y bloques vivos al guardar la lista de (tipo, símbolo).
+
+Uso:
+    python -m benchmarks.bench_lexico_bytes [megabytes]
+"""
+
+import sys
+import tracemalloc
+from types import SimpleNamespace
+
+from benchmarks import cargar_modulo, medir
+from benchmarks.generadores import programa_compilador
+
+
+# Copia de referencia del Lexico por caracteres, solo para comparar
+class _LexicoStr:
+    def __init__(self, fuente, tipos):
+        self.fuente, self.ind, self.simbolo, self.tipo = fuente, 0, "", None
+        self.t = tipos
+
+    def sig_caracter(self):
+        if self.terminado():
+            return '$'
+        c = self.fuente[self.ind]
+        self.ind += 1
+        return c
+
+    def retroceso(self):
+        if self.ind > 0:
+            self.ind -= 1
+
+    def sig_simbolo(self):
+        t = self.t
+        self.simbolo = ""
+        c = self.sig_caracter()
+        while c.isspace():
+            c = self.sig_caracter()
+        if c.isalpha():
+            self.simbolo += c
+            while not self.terminado():
+                c = self.sig_caracter()
+                if c.isalnum():
+                    self.simbolo += c
+                else:
+                    self.retroceso()
+                    break
+            self.tipo = t.PALABRAS_RESERVADAS.get(self.simbolo, t.identificador)
+            return self.tipo
+        elif c.isdigit():
+            self.simbolo += c
+            while not self.terminado():
+                c = self.sig_caracter()
+                if c.isdigit():
+                    self.simbolo += c
+                elif c == '.':
+                    self.simbolo += c
+                    c = self.sig_caracter()
+                    if c.isdigit():
+                        self.simbolo += c
+                        while not self.terminado():
+                            c = self.sig_caracter()
+                            if c.isdigit():
+                                self.simbolo += c
+                            else:
+                                self.retroceso()
+                                break
+                        self.tipo = t.real
+                        return self.tipo
+                    else:
+                        self.retroceso()
+                        break
+                else:
+                    self.retroceso()
+                    break
+            self.tipo = t.entero
+            return self.tipo
+        operadores = {
+            '+': t.opSuma, '-': t.opSuma, '*': t.opMul, '/': t.opMul,
+            '=': t.ASIG, ';': t.PYC, ',': t.COMA, '(': t.PA, ')': t.PC,
+            '{': t.LLA, '}': t.LLC, '!': t.opNot, '<': t.opRelac, '>': t.opRelac
+        }
+        if c in operadores:
+            self.simbolo = c
+            if c in ('<', '>', '!', '='):
+                c2 = self.sig_caracter()
+                if c2 == '=':
+                    self.simbolo += c2
+                    self.tipo = t.opIgualdad if c in ('!', '=') else t.opRelac
+                    return self.tipo
+                else:
+                    self.retroceso()
+            self.tipo = operadores[c]
+            return self.tipo
+        if c == '&' and self.sig_caracter() == '&':
+            self.simbolo, self.tipo = '&&', t.opAnd
+            return self.tipo
+        if c == '|' and self.sig_caracter() == '|':
+            self.simbolo, self.tipo = '||', t.opOr
+            return self.tipo
+        if c == '$':
+            self.simbolo, self.tipo = c, t.FIN
+            return self.tipo
+        self.simbolo, self.tipo = c, None
+        return None
+
+    def terminado(self):
+        return self.ind >= len(self.fuente)
+
+
+def recorrer(mod, fuente):
+    lexico = mod.Lexico(fuente)
+    n = 0
+    while not lexico.terminado():
+        lexico.sig_simbolo()
+        n += 1
+    return n
+
+
+def tokens(mod, fuente):
+    lexico = mod.Lexico(fuente)
+    out = []
+    while not lexico.terminado():
+        out.append((lexico.sig_simbolo(), lexico.simbolo))
+    return out
+
+
+def _memoria(func, *args):
+    tracemalloc.start()
+    antes = sys.getallocatedblocks()
+    resultado = func(*args)
+    bloques = sys.getallocatedblocks() - antes
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return pico, bloques, resultado
+
+
+def main():
+    mb = float(sys.argv[1]) if len(sys.argv) > 1 else 4
+    partes, total, k = [], 0, 0
+    while total < mb * 1e6:
+        parte = programa_compilador(semilla=k, globales=20, funciones=20).rstrip('$')
+        partes.append(parte)
+        total += len(parte)
+        k += 1
+    fuente = ''.join(partes) + '$'
+    print(f"=== Fuente de {len(fuente) / 1e6:.1f} MB ===")
+
+    gramatica = cargar_modulo('gramatica')
+    lexers = {'str + isalpha (referencia)': SimpleNamespace(Lexico=lambda f: _LexicoStr(f, gramatica.TokenType)),
+              'bytes + tabla (Gramatica)': gramatica,
+              'bytes + tabla (Avances)': cargar_modulo('avances')}
+    base = None
+    for nombre, mod in lexers.items():
+        t, n = medir(recorrer, mod, fuente, repeticiones=3)
+        pico_temp, _, _ = _memoria(recorrer, mod, fuente)
+        pico, bloques, lista = _memoria(tokens, mod, fuente)
+        base = base or lista
+        assert lista == base
+        print(f"{nombre:28s} {n / t:12,.0f} tokens/s {len(fuente) / t / 1e6:7.2f} MB/s"
+              f"   pico {pico_temp / 1024:8.1f} KB (guardando: {pico / 1e6:6.1f} MB,"
+              f" {bloques / n:4.2f} bloques/token)")
+
+
+if __name__ == '__main__':
+    main()
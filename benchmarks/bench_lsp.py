@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cliente LSP con guion para `analizador_semantico/lsp_server.py`: mide la
+latencia de tecla a diagnóstico sobre archivos grandes.
+
+Por cada tamaño:
+- didOpen y espera de los primeros diagnósticos;
+- ráfagas de tecleo (un carácter cada --intervalo ms, cambios
+  incrementales): latencia desde la última tecla hasta los diagnósticos de
+  esa versión, y cuántas veces se publicó durante la ráfaga (con debounce,
+  una);
+- ida y vuelta de textDocument/definition (la primera arma el índice).
+
+Uso:
+    python -m benchmarks.bench_lsp [--debounce 0.15] [--intervalo 30]
+"""
+
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks import RAIZ
+from benchmarks.generadores import programa_semantico
+
+SERVIDOR = os.path.join(RAIZ, 'analizador_semantico', 'lsp_server.py')
+URI = 'file:///bench.src'
+
+
+class ClienteLSP:
+    def __init__(self, debounce):
+        self.proc = subprocess.Popen([sys.executable, SERVIDOR, '--debounce', str(debounce)],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     cwd=os.path.dirname(SERVIDOR))
+        self.mensajes = queue.Queue()
+        self.siguiente_id = 0
+        threading.Thread(target=self._leer, daemon=True).start()
+
+    def _leer(self):
+        salida = self.proc.stdout
+        while True:
+            largo = None
+            while True:
+                linea = salida.readline()
+                if not linea:
+                    return
+                if not linea.strip():
+                    break
+                if linea.lower().startswith(b'content-length:'):
+                    largo = int(linea.split(b':')[1])
+            self.mensajes.put((time.perf_counter(), json.loads(salida.read(largo))))
+
+    def _enviar(self, mensaje):
+        datos = json.dumps(mensaje).encode('utf-8')
+        self.proc.stdin.write(b'Content-Length: %d\r\n\r\n' % len(datos) + datos)
+        self.proc.stdin.flush()
+
+    def notificar(self, metodo, params):
+        self._enviar({'jsonrpc': '2.0', 'method': metodo, 'params': params})
+
+    def pedir(self, metodo, params):
+        self.siguiente_id += 1
+        self._enviar({'jsonrpc': '2.0', 'id': self.siguiente_id, 'method': metodo, 'params': params})
+        return self.esperar(lambda m: m.get('id') == self.siguiente_id)
+
+    def esperar(self, condicion, descartados=None):
+        """Espera el primer mensaje que cumple `condicion`; (instante, mensaje)."""
+        while True:
+            t, m = self.mensajes.get(timeout=60)
+            if condicion(m):
+                return t, m
+            if descartados is not None:
+                descartados.append(m)
+
+    def cerrar(self):
+        self.pedir('shutdown', None)
+        self.notificar('exit', None)
+        self.proc.wait(timeout=10)
+
+
+def _diagnosticos(version):
+    return lambda m: m.get('method') == 'textDocument/publishDiagnostics' and m['params'].get('version') == version
+
+
+def medir(tam, args):
+    texto = programa_semantico(semilla=tam, globales=tam, funciones=tam, locales=5, sentencias=8)
+    lineas = texto.count('\n')
+    cliente = ClienteLSP(args.debounce)
+    try:
+        cliente.pedir('initialize', {'processId': os.getpid(), 'rootUri': None, 'capabilities': {}})
+        cliente.notificar('initialized', {})
+        t0 = time.perf_counter()
+        cliente.notificar('textDocument/didOpen', {'textDocument': {
+            'uri': URI, 'languageId': 'src', 'version': 1, 'text': texto}})
+        t, m = cliente.esperar(_diagnosticos(1))
+        print(f"--- {tam} funciones, {lineas} líneas, {len(texto)} caracteres ---")
+        print(f"didOpen -> diagnósticos          {(t - t0) * 1000:8.1f} ms"
+              f"  ({len(m['params']['diagnostics'])} diagnósticos)")
+
+        # Ráfagas de tecleo en la línea 1 (después de la primera declaración)
+        version, latencias, publicados = 1, [], 0
+        for rafaga in range(args.rafagas):
+            escrito = f"int z{rafaga};"
+            for k, c in enumerate(escrito):
+                version += 1
+                cliente.notificar('textDocument/didChange', {
+                    'textDocument': {'uri': URI, 'version': version},
+                    'contentChanges': [{'range': {'start': {'line': 1, 'character': k},
+                                                  'end': {'line': 1, 'character': k}}, 'text': c}]})
+                ultima = time.perf_counter()
+                time.sleep(args.intervalo / 1000)
+            version += 1
+            cliente.notificar('textDocument/didChange', {
+                'textDocument': {'uri': URI, 'version': version},
+                'contentChanges': [{'range': {'start': {'line': 1, 'character': len(escrito)},
+                                              'end': {'line': 1, 'character': len(escrito)}}, 'text': '\n'}]})
+            ultima = time.perf_counter()
+            otros = []
+            t, _ = cliente.esperar(_diagnosticos(version), otros)
+            latencias.append(t - ultima)
+            publicados += 1 + sum(1 for m in otros if m.get('method') == 'textDocument/publishDiagnostics')
+        latencias.sort()
+        print(f"tecla -> diagnósticos (mediana)  {latencias[len(latencias) // 2] * 1000:8.1f} ms"
+              f"  (máx {latencias[-1] * 1000:.1f} ms, debounce {args.debounce * 1000:.0f} ms)")
+        print(f"publicaciones por ráfaga         {publicados / args.rafagas:8.1f}")
+
+        # Destino de la última asignación del archivo (línea "    v = ...;")
+        linea = max(k for k, l in enumerate(texto.split('\n')) if ' = ' in l) + args.rafagas
+        for vez in ('primera', 'segunda'):
+            t0 = time.perf_counter()
+            _, m = cliente.pedir('textDocument/definition', {
+                'textDocument': {'uri': URI}, 'position': {'line': linea, 'character': 4}})
+            print(f"definition ({vez})              {(time.perf_counter() - t0) * 1000:8.1f} ms"
+                  f"  -> {m['result'] and m['result']['range']['start']}")
+    finally:
+        cliente.cerrar()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--debounce', type=float, default=0.15)
+    ap.add_argument('--intervalo', type=float, default=30, help='ms entre teclas')
+    ap.add_argument('--rafagas', type=int, default=5)
+    ap.add_argument('tamanos', nargs='*', type=int, default=[50, 500, 2000])
+    args = ap.parse_args()
+    for tam in args.tamanos:
+        medir(tam, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compilación incremental por módulos (`analizador_semantico/modules.py`) en
+un proyecto generado de muchos archivos.
+
+Casos:
+- en frío: sin caché;
+- sin cambios: solo stat de los archivos y lectura de la caché;
+- editar el cuerpo de una función de una hoja y de `m0` (lo importan
+  todos): la interfaz no cambia, así que se verifica un solo módulo;
+- agregar una función a una hoja y a `m0`: cambia la interfaz, así que se
+  verifican también sus importadores.
+
+Uso:
+    python -m benchmarks.bench_modulos [modulos]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import RAIZ
+from benchmarks.generadores import proyecto_modular
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+import modules  # noqa: E402
+
+
+def _editar(directorio, nombre, reemplazo=None, agregado=''):
+    ruta = os.path.join(directorio, nombre + '.src')
+    with open(ruta, encoding='utf-8') as f:
+        texto = f.read()
+    if reemplazo:
+        texto = texto.replace(*reemplazo, 1)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write(texto + agregado)
+    # Por si el sistema de archivos tiene mtime de baja resolución
+    st = os.stat(ruta)
+    os.utime(ruta, ns=(st.st_atime_ns, st.st_mtime_ns + 1000))
+
+
+def _compilar(nombre, directorio):
+    t0 = time.perf_counter()
+    resultados, stats = modules.build(directorio)
+    t = time.perf_counter() - t0
+    errores = sum(map(len, resultados.values()))
+    assert errores == 0, [e for es in resultados.values() for e in es][:5]
+    print(f"{nombre:34s} {t * 1000:10.1f} ms   leídos {stats['read']:5d}"
+          f"   parseados {stats['parsed']:5d}   verificados {stats['checked']:5d}")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    proyecto = proyecto_modular(modulos=n)
+    hoja = f"m{n - 1}"
+    importan_m0 = sum(1 for fuente in proyecto.values() if 'import m0;' in fuente)
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre, fuente in proyecto.items():
+            with open(os.path.join(directorio, nombre + '.src'), 'w', encoding='utf-8') as f:
+                f.write(fuente)
+        print(f"=== {n} módulos, {sum(map(len, proyecto.values())) // 1024} KB,"
+              f" {importan_m0} importan m0 ===")
+        _compilar("en frío", directorio)
+        _compilar("sin cambios", directorio)
+        _editar(directorio, hoja, ('return r;', 'r = r + 1;\n    return r;'))
+        _compilar(f"cuerpo de {hoja}", directorio)
+        _editar(directorio, 'm0', ('return r;', 'r = r + 1;\n    return r;'))
+        _compilar("cuerpo de m0", directorio)
+        _editar(directorio, hoja, agregado='int extra() { return 1; }\n')
+        _compilar(f"interfaz de {hoja}", directorio)
+        _editar(directorio, 'm0', agregado='int extra_m0() { return 1; }\n')
+        _compilar("interfaz de m0", directorio)
+        _compilar("sin cambios", directorio)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Extracción del esquema (funciones con sus firmas y globales) de archivos
+grandes: parseo completo (`tokenize_bulk` + `Parser.parse`) contra
+`SkimParser`, que salta los cuerpos de las funciones sin tokenizarlos.
+
+También se mide el costo de parsear después un solo cuerpo bajo demanda.
+
+Uso:
+    python -m benchmarks.bench_outline [funciones ...]
+"""
+
+import os
+import sys
+
+from benchmarks import RAIZ, medir
+from benchmarks.generadores import programa_semantico
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+import lexer_parser as lp  # noqa: E402
+from modules import summarize  # noqa: E402
+
+
+def completo(texto):
+    lexer = lp.Lexer(texto)
+    return summarize(lp.Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse())
+
+
+def skim(texto):
+    return summarize(lp.SkimParser(texto).parse())
+
+
+def main():
+    tamanos = [int(a) for a in sys.argv[1:]] or [1000, 10000]
+    for funciones in tamanos:
+        texto = programa_semantico(semilla=funciones, globales=funciones // 10, funciones=funciones,
+                                   locales=5, sentencias=20)
+        print(f"--- {funciones} funciones, {len(texto) / 1e6:.1f} MB ---")
+        t_completo, esquema = medir(completo, texto, repeticiones=3)
+        t_skim, esquema_skim = medir(skim, texto, repeticiones=3)
+        assert esquema == esquema_skim
+        print(f"parseo completo   {t_completo * 1000:10.1f} ms")
+        print(f"SkimParser        {t_skim * 1000:10.1f} ms   x{t_completo / t_skim:.1f}")
+        ast = lp.SkimParser(texto).parse()
+        func = ast.decls[-1]
+        t_cuerpo, _ = medir(lambda: lp.BodySpan(texto, func._body.start, func._body.end).parse(),
+                            repeticiones=3)
+        print(f"un cuerpo         {t_cuerpo * 1e6:10.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
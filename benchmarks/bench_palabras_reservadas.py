@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Clasificación de palabras reservadas en la ruta de identificadores.
+
+Compara el recorrido lineal de una tupla (lo que hacía `Lexer.tokenize` de
+`construccion traductor`) contra la búsqueda en un dict, con 4 y con 150
+palabras reservadas, sobre una entrada formada casi solo por identificadores.
+Con el dict el costo por identificador se mantiene constante.
+
+Uso:
+    python -m benchmarks.bench_palabras_reservadas [num_identificadores]
+"""
+
+import random
+import sys
+
+from benchmarks import cargar_modulo, medir
+
+
+def generar_identificadores(n, palabras, semilla=0):
+    rnd = random.Random(semilla)
+    letras = 'abcdefghijklmnopqrstuvwxyz_'
+    ids = []
+    for _ in range(n):
+        if rnd.random() < 0.3:
+            ids.append(rnd.choice(palabras))
+        else:
+            ids.append(''.join(rnd.choice(letras) for _ in range(rnd.randint(1, 10))))
+    return ids
+
+
+def clasificar_tupla(ids, palabras):
+    return [p.upper() if p in palabras else 'ID' for p in ids]
+
+
+def clasificar_dict(ids, tabla):
+    get = tabla.get
+    return [get(p, 'ID') for p in ids]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    traductor = cargar_modulo('traductor')
+
+    base = tuple(traductor.KEYWORDS)
+    extendidas = base + tuple(f"kw{i:03d}" for i in range(150 - len(base)))
+
+    print(f"=== Clasificación de {n} identificadores ===")
+    for palabras in (base, extendidas):
+        ids = generar_identificadores(n, palabras)
+        tabla = {p: p.upper() for p in palabras}
+        t_tupla, _ = medir(clasificar_tupla, ids, palabras)
+        t_dict, _ = medir(clasificar_dict, ids, tabla)
+        print(f"{len(palabras):4d} palabras | tupla: {t_tupla * 1e9 / n:7.1f} ns/id"
+              f" | dict: {t_dict * 1e9 / n:7.1f} ns/id")
+
+    # Lexer completo sobre una fuente densa en identificadores
+    ids = generar_identificadores(n, base)
+    fuente = '\n'.join(f"{a} = {b};" for a, b in zip(ids[::2], ids[1::2]))
+    t_lex, tokens = medir(lambda: traductor.Lexer(fuente).tokenize(), repeticiones=3)
+    print(f"Lexer.tokenize: {len(tokens)} tokens en {t_lex:.3f} s"
+          f" ({len(tokens) / t_lex:,.0f} tokens/s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Driver LR de `Analizador Sintáctico/`: la pila de objetos original
+(Estado/Terminal/NoTerminal en una Pila, con `muestra()` en cada paso),
+la pila array('i') con la tabla como dict {(estado, símbolo): ('s', n)}, y
+`analizar` actual (array('i') + filas de enteros de compilar_tabla).
+
+Uso:
+    python -m benchmarks.bench_pila_lr [n1 n2 ...]
+"""
+
+import contextlib
+import os
+import sys
+from array import array
+
+from benchmarks import cargar_modulo, medir
+from benchmarks.generadores import cadena_suma
+
+
+# Copias de referencia de los drivers anteriores, solo para comparar
+class _Terminal:
+    def __init__(self, tipo, lexema):
+        self.tipo, self.lexema = tipo, lexema
+
+    def muestra(self):
+        print(f"Terminal({self.lexema})", end=' ')
+
+
+class _NoTerminal:
+    def __init__(self, simbolo, nombre):
+        self.simbolo, self.nombre = simbolo, nombre
+
+    def muestra(self):
+        print(f"NoTerminal({self.nombre})", end=' ')
+
+
+class _Estado:
+    def __init__(self, numero):
+        self.numero = numero
+
+    def muestra(self):
+        print(f"Estado({self.numero})", end=' ')
+
+
+def analizar_objetos(tokens, tabla, reglas):
+    pila = [_Estado(0)]
+    i = 0
+    while True:
+        if not isinstance(pila[-1], _Estado):
+            return False
+        estado = pila[-1].numero
+        tipo, lexema = tokens[i]
+        accion = tabla.get((estado, tipo))
+        if accion is None:
+            return False
+        print("Contenido de la pila (base -> tope):")
+        for elem in pila:
+            elem.muestra()
+        print("\n")
+        print(f"Token actual: {lexema} (tipo={tipo})")
+        print(f"Acción: {accion}\n")
+        if accion[0] == 's':
+            pila.append(_Terminal(tipo, lexema))
+            pila.append(_Estado(accion[1]))
+            i += 1
+        elif accion[0] == 'r':
+            lhs, lon, nombre = reglas[accion[1]]
+            for _ in range(lon):
+                pila.pop()
+                pila.pop()
+            goto = tabla[(pila[-1].numero, lhs)]
+            pila.append(_NoTerminal(lhs, nombre))
+            pila.append(_Estado(goto[1]))
+        else:
+            return accion[0] == 'acc'
+
+
+def analizar_dict(tokens, tabla, reglas):
+    estados = array('i', [0])
+    i = 0
+    while True:
+        tipo, _ = tokens[i]
+        accion = tabla.get((estados[-1], tipo))
+        if accion is None:
+            return False
+        if accion[0] == 's':
+            estados.append(accion[1])
+            i += 1
+        elif accion[0] == 'r':
+            lhs, lon, _ = reglas[accion[1]]
+            if lon:
+                del estados[-lon:]
+            goto = tabla.get((estados[-1], lhs))
+            if goto is None or goto[0] != 'g':
+                return False
+            estados.append(goto[1])
+        else:
+            return accion[0] == 'acc'
+
+
+def main():
+    tamanos = [int(x) for x in sys.argv[1:]] or [100, 400, 1600]
+    mod = cargar_modulo('sintactico')
+    print(f"{'n':>6} | {'objetos+muestra':>16} | {'array+TrazaPila':>16} |"
+          f" {'array+dict':>12} | {'array+enteros':>13}")
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        filas = []
+        for n in tamanos:
+            tokens = mod.lexico_rapido(cadena_suma(n))
+            t_obj, _ = medir(analizar_objetos, tokens, mod.tabla, mod.reglas, repeticiones=3)
+            t_traza, _ = medir(lambda: mod.analizar(tokens, traza=mod.TrazaPila()), repeticiones=3)
+            t_dict, _ = medir(analizar_dict, tokens, mod.tabla, mod.reglas, repeticiones=5)
+            t_int, _ = medir(mod.analizar, tokens, repeticiones=5)
+            filas.append((n, t_obj, t_traza, t_dict, t_int))
+    for n, t_obj, t_traza, t_dict, t_int in filas:
+        print(f"{n:6d} | {t_obj * 1000:13.2f} ms | {t_traza * 1000:13.2f} ms |"
+              f" {t_dict * 1000:9.3f} ms | {t_int * 1000:10.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
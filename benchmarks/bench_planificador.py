@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Verificación serial contra paralela (`analizador_semantico/scheduler.py`)
+en un proyecto generado con ciclos de imports.
+
+Se mide la lectura rápida de declaraciones (común a los dos modos) y la
+verificación completa: serial en el proceso principal y con el pool de
+procesos para varios `-j`. La aceleración se calcula sobre el tiempo total
+(pared). En una máquina de un solo CPU el pool solo agrega costo de
+comunicación entre procesos.
+
+Uso:
+    python -m benchmarks.bench_planificador [modulos]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import RAIZ
+from benchmarks.generadores import proyecto_modular
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+import scheduler  # noqa: E402
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    proyecto = proyecto_modular(modulos=n, funciones=8, ciclos=0.2)
+    cpus = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre, fuente in proyecto.items():
+            with open(os.path.join(directorio, nombre + '.src'), 'w', encoding='utf-8') as f:
+                f.write(fuente)
+
+        t0 = time.perf_counter()
+        componentes, imports, interfaces = scheduler.plan(directorio)
+        lectura = time.perf_counter() - t0
+        print(f"=== {n} módulos, {len(componentes)} componentes (la mayor de "
+              f"{max(map(len, componentes))}), {cpus} CPU ===")
+        print(f"{'lectura rápida':24s} {lectura * 1000:10.1f} ms")
+
+        t0 = time.perf_counter()
+        base = scheduler.check_serial(directorio, componentes, imports, interfaces)
+        serial = lectura + time.perf_counter() - t0
+        assert not any(base.values())
+        print(f"{'serial':24s} {serial * 1000:10.1f} ms")
+
+        for jobs in sorted({1, 2, 4, cpus}):
+            t0 = time.perf_counter()
+            resultado = scheduler.check_parallel(directorio, componentes, imports, interfaces, jobs)
+            total = lectura + time.perf_counter() - t0
+            assert resultado == base
+            print(f"{f'paralelo -j {jobs}':24s} {total * 1000:10.1f} ms   x{serial / total:5.2f}")
+
+
+if __name__ == '__main__':
+    main()
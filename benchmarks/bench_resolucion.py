@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resolución estática (`analizador_semantico/resolver.py`) contra búsquedas
+por nombre.
+
+- Costo de la pasada de resolución frente al análisis semántico completo
+  (que hace una búsqueda en la pila de ámbitos por cada uso).
+- Lectura repetida de todas las variables usadas en los cuerpos de función,
+  como lo haría un evaluador: por nombre, recorriendo los ámbitos como
+  `SymbolTable.lookup`, o por slot, con `marcos[profundidad][índice]`.
+
+Uso:
+    python -m benchmarks.bench_resolucion [funciones] [--lecturas N]
+"""
+
+import argparse
+import os
+import sys
+
+from benchmarks import RAIZ, medir
+from benchmarks.generadores import programa_semantico
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+from lexer_parser import (Lexer, Parser, Node, SymbolTable, FuncDeclNode, VarDeclNode,  # noqa: E402
+                          AssignNode, IdentifierNode, BinaryOpNode, FuncCallNode, ReturnNode)
+from resolver import resolve  # noqa: E402
+
+
+def _parsear(fuente):
+    lexer = Lexer(fuente)
+    return Parser(lexer.tokenize_bulk().to_tuples(), lexer.lines).parse()
+
+
+def _semantico(ast):
+    Node.tabla_simbolos = SymbolTable()
+    Node.ambito = ''
+    ast.validate_types()
+    return Node.tabla_simbolos.errors
+
+
+def _usos(ast):
+    """Por función: [(nombre, slot)] de cada IdentifierNode del cuerpo."""
+    por_funcion = []
+    for d in ast.decls:
+        if not isinstance(d, FuncDeclNode):
+            continue
+        usos, pendientes = [], [s.expr for s in d.body if isinstance(s, (AssignNode, ReturnNode))]
+        while pendientes:
+            n = pendientes.pop()
+            if isinstance(n, IdentifierNode):
+                usos.append((n.name, n.slot))
+            elif isinstance(n, BinaryOpNode):
+                pendientes += (n.left, n.right)
+            elif isinstance(n, FuncCallNode):
+                pendientes += n.args
+        por_funcion.append((d, usos))
+    return por_funcion
+
+
+def _por_nombre(globales, por_funcion, lecturas):
+    total = 0
+    for d, usos in por_funcion:
+        locales = {p.name: 1 for p in d.params}
+        locales.update((s.name, 1) for s in d.body if isinstance(s, VarDeclNode))
+        ambitos = [globales, locales]
+        for _ in range(lecturas):
+            for nombre, _ in usos:
+                for ambito in reversed(ambitos):
+                    if nombre in ambito:
+                        total += ambito[nombre]
+                        break
+    return total
+
+
+def _por_slot(globales, por_funcion, lecturas):
+    total = 0
+    for d, usos in por_funcion:
+        marcos = [globales, [1] * d.frame_size]
+        for _ in range(lecturas):
+            for _, (profundidad, indice) in usos:
+                total += marcos[profundidad][indice]
+    return total
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('funciones', nargs='?', type=int, default=2000)
+    ap.add_argument('--lecturas', type=int, default=50, help='veces que se lee cada uso')
+    args = ap.parse_args()
+
+    fuente = programa_semantico(semilla=1, globales=200, funciones=args.funciones,
+                                locales=20, sentencias=20, largo_expr=6)
+    ast = _parsear(fuente)
+    print(f"=== {args.funciones} funciones, {len(fuente) / 1e6:.1f} MB ===")
+
+    t_sem, errores = medir(_semantico, ast, repeticiones=3)
+    assert not errores
+    t_res, resolutor = medir(resolve, ast, repeticiones=3)
+    assert not resolutor.unresolved
+    print(f"{'análisis semántico':24s} {t_sem:8.3f} s")
+    print(f"{'resolución (una vez)':24s} {t_res:8.3f} s")
+
+    por_funcion = _usos(ast)
+    n = sum(len(u) for _, u in por_funcion) * args.lecturas
+    t_nombre, a = medir(_por_nombre, {f"g{i}": 1 for i in range(200)}, por_funcion, args.lecturas,
+                        repeticiones=3)
+    t_slot, b = medir(_por_slot, [1] * ast.frame_size, por_funcion, args.lecturas, repeticiones=3)
+    assert a == b == n
+    print(f"{'lecturas por nombre':24s} {t_nombre:8.3f} s   {n / t_nombre:14,.0f} lecturas/s")
+    print(f"{'lecturas por slot':24s} {t_slot:8.3f} s   {n / t_slot:14,.0f} lecturas/s"
+          f"   x{t_nombre / t_slot:4.2f}")
+
+
+if __name__ == '__main__':
+    main()
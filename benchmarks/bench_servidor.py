@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor de compilación (servidor/servidor.py) contra un proceso por archivo.
+
+- proceso por archivo: `python servidor.py --local check <lenguaje> archivo`,
+  que paga arranque del intérprete, imports y lectura de compilador.lr;
+- servidor, una petición a la vez (ventana 1);
+- servidor con pipelining (varias peticiones pendientes por conexión).
+
+Cada petición lleva un programa distinto, así que la caché no interviene.
+Se reportan peticiones por segundo y latencias p50/p99.
+
+Uso:
+    python -m benchmarks.bench_servidor [peticiones]
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks import RAIZ
+from benchmarks.generadores import programa_compilador, programa_semantico
+
+SERVIDOR = os.path.join(RAIZ, 'servidor', 'servidor.py')
+
+
+def _percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))]
+
+
+def _reporte(nombre, total, latencias):
+    print(f"{nombre:34s} {len(latencias) / total:9.1f} pet/s   p50 {_percentil(latencias, 0.5) * 1000:8.2f} ms"
+          f"   p99 {_percentil(latencias, 0.99) * 1000:8.2f} ms")
+
+
+def por_proceso(lenguaje, fuentes, directorio):
+    latencias = []
+    t0 = time.perf_counter()
+    for k, fuente in enumerate(fuentes):
+        ruta = os.path.join(directorio, f"p{k}.src")
+        with open(ruta, 'w', encoding='utf-8') as f:
+            f.write(fuente)
+        t = time.perf_counter()
+        subprocess.run([sys.executable, SERVIDOR, '--local', 'check', lenguaje, ruta],
+                       check=True, stdout=subprocess.DEVNULL)
+        latencias.append(time.perf_counter() - t)
+    return time.perf_counter() - t0, latencias
+
+
+async def por_servidor(ruta, lenguaje, fuentes, ventana):
+    reader, writer = await asyncio.open_unix_connection(ruta, limit=64 * 1024 * 1024)
+    enviado, latencias = {}, []
+    cupo = asyncio.Semaphore(ventana)
+
+    async def leer():
+        for _ in fuentes:
+            respuesta = json.loads(await reader.readline())
+            assert respuesta['ok'], respuesta
+            latencias.append(time.perf_counter() - enviado[respuesta['id']])
+            cupo.release()
+
+    t0 = time.perf_counter()
+    lector = asyncio.create_task(leer())
+    for k, fuente in enumerate(fuentes):
+        await cupo.acquire()
+        enviado[k] = time.perf_counter()
+        writer.write(json.dumps({'id': k, 'op': 'check', 'lenguaje': lenguaje, 'fuente': fuente}).encode() + b'\n')
+        await writer.drain()
+    await lector
+    total = time.perf_counter() - t0
+    writer.close()
+    await writer.wait_closed()
+    return total, latencias
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    fuentes = {
+        'semantico': [programa_semantico(semilla=k, globales=5, funciones=10) for k in range(n)],
+        'gramatica': [programa_compilador(semilla=k, globales=5, funciones=5) for k in range(n)],
+    }
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, 'compilador.sock')
+        servidor = subprocess.Popen([sys.executable, SERVIDOR, '--socket', ruta, '--cache', '0'],
+                                    stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(ruta):
+                time.sleep(0.05)
+            for lenguaje, lista in fuentes.items():
+                print(f"=== check {lenguaje}: {n} programas (~{sum(map(len, lista)) // n} caracteres) ===")
+                muestra = lista[:max(1, n // 10)]
+                total, lat = por_proceso(lenguaje, muestra, directorio)
+                _reporte(f"proceso por archivo ({len(muestra)})", total, lat)
+                for ventana in (1, 8, 64):
+                    total, lat = asyncio.run(por_servidor(ruta, lenguaje, lista, ventana))
+                    _reporte(f"servidor, ventana {ventana}", total, lat)
+        finally:
+            servidor.terminate()
+            servidor.wait()
+
+
+if __name__ == '__main__':
+    main()
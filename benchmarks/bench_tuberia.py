@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Léxico + sintaxis en serie contra la tubería de
+`analizador_semantico/pipeline.py` (lexer en otro proceso, anillo en
+memoria compartida).
+
+Se mide por separado el léxico (`tokenize_bulk().to_tuples()`) y la
+sintaxis sobre esos tokens; su suma es el costo en serie. La tubería
+tiende a max(léxico, sintaxis) con dos CPU libres; con uno solo, los dos
+procesos se turnan y queda la suma más el costo del anillo. Se verifica
+que la cantidad de declaraciones coincida.
+
+Uso:
+    python -m benchmarks.bench_tuberia [megabytes] [--slots 64] [--batch 4096]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+
+from benchmarks import RAIZ
+from benchmarks.bench_lexer_bulk import generar_fuente
+
+sys.path.insert(0, os.path.join(RAIZ, 'analizador_semantico'))
+from lexer_parser import Lexer, Parser  # noqa: E402
+from pipeline import pipelined_parse  # noqa: E402
+
+
+def _medir(func):
+    gc.collect()
+    t0 = time.perf_counter()
+    resultado = func()
+    return time.perf_counter() - t0, resultado
+
+
+def _serie(fuente):
+    """(t_léxico, t_sintaxis, declaraciones); los tokens se liberan al salir."""
+    lexer = Lexer(fuente)
+    t_lex, tokens = _medir(lambda: lexer.tokenize_bulk().to_tuples())
+    t_parse, ast = _medir(lambda: Parser(tokens, lexer.lines).parse())
+    return t_lex, t_parse, len(ast.decls)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('megabytes', nargs='?', type=float, default=20)
+    ap.add_argument('--slots', type=int, default=64, help='ranuras del anillo')
+    ap.add_argument('--batch', type=int, default=4096, help='tokens por ranura')
+    args = ap.parse_args()
+
+    fuente = generar_fuente(args.megabytes)
+    print(f"=== Fuente de {len(fuente) / 1e6:.1f} MB, {os.cpu_count() or 1} CPU ===")
+
+    t_lex, t_parse, decls = _serie(fuente)
+    t_tub, (ast, _) = _medir(lambda: pipelined_parse(fuente, args.slots, args.batch))
+    assert len(ast.decls) == decls
+
+    suma = t_lex + t_parse
+    print(f"{'léxico':24s} {t_lex:8.3f} s")
+    print(f"{'sintaxis':24s} {t_parse:8.3f} s")
+    print(f"{'serie (suma)':24s} {suma:8.3f} s")
+    print(f"{'tubería':24s} {t_tub:8.3f} s   x{suma / t_tub:4.2f}"
+          f"   (ideal max: {max(t_lex, t_parse):.3f} s)")
+
+
+if __name__ == '__main__':
+    main()
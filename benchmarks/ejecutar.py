@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Suite de benchmarks: todos los lexers, parsers y el verificador semántico,
+sobre programas sintéticos de `benchmarks.generadores` (ancho, profundo,
+largo).
+
+Uso:
+    python -m benchmarks.ejecutar                      # todo, escala 1
+    python -m benchmarks.ejecutar --filtro semantico   # solo los que coinciden
+    python -m benchmarks.ejecutar --guardar            # benchmarks/resultados/<fecha>.json
+    python -m benchmarks.ejecutar --comparar benchmarks/resultados/base.json
+
+Con --comparar se marca como REGRESIÓN todo benchmark cuyo tiempo supere al
+de la corrida base en más del --umbral (10 % por defecto) y el proceso sale
+con código 1.
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import sys
+
+from benchmarks import RAIZ, cargar_modulo, medir
+from benchmarks import generadores as gen
+
+RESULTADOS = os.path.join(RAIZ, 'benchmarks', 'resultados')
+
+# nombre -> preparar(escala) -> (función sin argumentos, unidades procesadas)
+# Las unidades son caracteres para los lexers y tokens para parsers/verificador.
+BENCHMARKS = {}
+
+
+def benchmark(nombre):
+    def registrar(preparar):
+        BENCHMARKS[nombre] = preparar
+        return preparar
+    return registrar
+
+
+def _escalar(kw, escala, claves):
+    return {k: max(1, int(v * escala)) if k in claves else v for k, v in kw.items()}
+
+
+@contextlib.contextmanager
+def _silencio():
+    # Los parsers LR y `construccion traductor` imprimen cada paso
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        yield
+
+
+def _lexico_tokens(mod, fuente):
+    lexico = mod.Lexico(fuente)
+    tokens = []
+    while not lexico.terminado():
+        t = lexico.sig_simbolo()
+        if t is None:
+            break
+        tokens.append((t, lexico.simbolo))
+    return tokens
+
+
+# ====================================================
+# analizador_semantico
+# ====================================================
+FORMAS_SEMANTICO = {
+    'ancho': dict(globales=2000, funciones=200, locales=20, sentencias=5),
+    'profundo': dict(globales=5, funciones=40, sentencias=3, profundidad=80),
+    'largo': dict(globales=5, funciones=20, sentencias=5, largo_expr=400),
+}
+
+
+def _registrar_semantico(forma, kw):
+    claves = ('globales', 'funciones')
+
+    def fuente(escala):
+        return gen.programa_semantico(semilla=1, **_escalar(kw, escala, claves))
+
+    @benchmark(f"semantico.{forma}.lex")
+    def _(escala):
+        sem, code = cargar_modulo('semantico'), fuente(escala)
+        return (lambda: sem.Lexer(code).tokenize()), len(code)
+
+    @benchmark(f"semantico.{forma}.lex_bulk")
+    def _(escala):
+        sem, code = cargar_modulo('semantico'), fuente(escala)
+        return (lambda: sem.Lexer(code).tokenize_bulk()), len(code)
+
+    @benchmark(f"semantico.{forma}.parse")
+    def _(escala):
+        sem = cargar_modulo('semantico')
+        tokens = sem.Lexer(fuente(escala)).tokenize()
+        return (lambda: sem.Parser(tokens).parse()), len(tokens)
+
+    @benchmark(f"semantico.{forma}.check")
+    def _(escala):
+        sem = cargar_modulo('semantico')
+        tokens = sem.Lexer(fuente(escala)).tokenize()
+        ast = sem.Parser(tokens).parse()
+
+        def check():
+            sem.Node.tabla_simbolos = sem.SymbolTable()
+            sem.Node.ambito = ''
+            ast.validate_types()
+        return check, len(tokens)
+
+
+for _forma, _kw in FORMAS_SEMANTICO.items():
+    _registrar_semantico(_forma, _kw)
+
+
+# ====================================================
+# construccion traductor
+# ====================================================
+FORMAS_TRADUCTOR = {
+    'ancho': dict(sentencias=20000, profundidad=0),
+    'profundo': dict(sentencias=50, profundidad=8),
+    'largo': dict(sentencias=200, largo_expr=300, profundidad=1),
+}
+
+
+def _registrar_traductor(forma, kw):
+    def fuente(escala):
+        return gen.programa_traductor(semilla=2, **_escalar(kw, escala, ('sentencias',)))
+
+    @benchmark(f"traductor.{forma}.lex")
+    def _(escala):
+        tr, code = cargar_modulo('traductor'), fuente(escala)
+        return (lambda: tr.Lexer(code).tokenize()), len(code)
+
+    @benchmark(f"traductor.{forma}.parse")
+    def _(escala):
+        tr = cargar_modulo('traductor')
+        tokens = tr.Lexer(fuente(escala)).tokenize()
+
+        def parse():
+            with _silencio():
+                tr.Parser(tokens).parse()
+        return parse, len(tokens)
+
+
+for _forma, _kw in FORMAS_TRADUCTOR.items():
+    _registrar_traductor(_forma, _kw)
+
+
+# ====================================================
+# Gramatica del compilador (Lexico + compilador.lr)
+# ====================================================
+FORMAS_COMPILADOR = {
+    'ancho': dict(globales=500, funciones=100, sentencias=5, profundidad=0),
+    'profundo': dict(globales=5, funciones=20, sentencias=5, profundidad=6),
+    'largo': dict(globales=5, funciones=10, sentencias=5, largo_expr=200),
+}
+
+
+def _tabla_lr():
+    gram = cargar_modulo('gramatica')
+    ruta = os.path.join(RAIZ, 'Gramatica del compilador', 'compilador.lr')
+    rules, _, _, table = gram.leer_lr_file(ruta)
+    return gram, rules, table
+
+
+def _registrar_compilador(forma, kw):
+    def fuente(escala):
+        return gen.programa_compilador(semilla=3, **_escalar(kw, escala, ('globales', 'funciones')))
+
+    @benchmark(f"gramatica.{forma}.lex")
+    def _(escala):
+        gram, code = cargar_modulo('gramatica'), fuente(escala)
+        return (lambda: _lexico_tokens(gram, code)), len(code)
+
+    @benchmark(f"gramatica.{forma}.parse_lr")
+    def _(escala):
+        gram, rules, table = _tabla_lr()
+        tokens = _lexico_tokens(gram, fuente(escala))
+
+        def parse():
+            with _silencio():
+                assert gram.parser_lr(tokens, rules, table, traza=False)
+        return parse, len(tokens)
+
+
+for _forma, _kw in FORMAS_COMPILADOR.items():
+    _registrar_compilador(_forma, _kw)
+
+
+@benchmark("lexico.ancho.lex")
+def _(escala):
+    lex = cargar_modulo('lexico')
+    code = gen.programa_compilador(semilla=4, globales=int(500 * escala), funciones=int(100 * escala))
+    return (lambda: _lexico_tokens(lex, code)), len(code)
+
+
+@benchmark("avances.ancho.lex")
+def _(escala):
+    av = cargar_modulo('avances')
+    code = gen.programa_compilador(semilla=4, globales=int(500 * escala), funciones=int(100 * escala))
+    return (lambda: _lexico_tokens(av, code)), len(code)
+
+
+# ====================================================
+# Analizador Sintáctico / Avances (E -> id + E | id)
+# ====================================================
+def _registrar_suma(clave):
+    @benchmark(f"{clave}.largo.analizar")
+    def _(escala):
+        mod = cargar_modulo(clave)
+        tokens = mod.lexico_rapido(gen.cadena_suma(max(1, int(200 * escala))))
+
+        def analizar():
+            with _silencio():
+                assert mod.analizar(tokens)
+        return analizar, len(tokens)
+
+
+_registrar_suma('sintactico')
+_registrar_suma('avances')
+
+
+@benchmark("sintactico.compilador.analizar")
+def _(escala):
+    # El mismo driver con la tabla de compilador.lr, vía cargar_tabla()
+    mod, gram = cargar_modulo('sintactico'), cargar_modulo('gramatica')
+    reglas, filas = mod.cargar_tabla(os.path.join(RAIZ, 'Gramatica del compilador', 'compilador.lr'))
+    code = gen.programa_compilador(semilla=3, globales=int(500 * escala), funciones=int(100 * escala))
+    tokens = _lexico_tokens(gram, code)
+
+    def analizar():
+        with _silencio():
+            assert mod.analizar(tokens, reglas=reglas, filas=filas)
+    return analizar, len(tokens)
+
+
+# ====================================================
+# Ejecución, almacenamiento y comparación
+# ====================================================
+def ejecutar(filtro='', escala=1.0, repeticiones=3):
+    resultados = {}
+    for nombre, preparar in BENCHMARKS.items():
+        if filtro not in nombre:
+            continue
+        func, unidades = preparar(escala)
+        segundos, _ = medir(func, repeticiones=repeticiones)
+        resultados[nombre] = {
+            'segundos': round(segundos, 6),
+            'unidades': unidades,
+            'por_segundo': round(unidades / segundos) if segundos else None,
+        }
+        print(f"{nombre:34s} {segundos * 1000:10.2f} ms  {unidades / segundos:14,.0f} u/s")
+    return resultados
+
+
+def comparar(resultados, base, umbral):
+    regresiones = []
+    print(f"\n=== Comparación (umbral {umbral:.0%}) ===")
+    for nombre, r in resultados.items():
+        if nombre not in base:
+            continue
+        antes, ahora = base[nombre]['segundos'], r['segundos']
+        cambio = (ahora - antes) / antes if antes else 0.0
+        marca = 'REGRESIÓN' if cambio > umbral else ''
+        if marca:
+            regresiones.append(nombre)
+        print(f"{nombre:34s} {antes * 1000:10.2f} -> {ahora * 1000:10.2f} ms  {cambio:+7.1%} {marca}")
+    return regresiones
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--filtro', default='', help='solo benchmarks cuyo nombre contenga este texto')
+    ap.add_argument('--escala', type=float, default=1.0, help='multiplica el tamaño de las entradas')
+    ap.add_argument('--repeticiones', type=int, default=3)
+    ap.add_argument('--guardar', nargs='?', const='', default=None, metavar='RUTA',
+                    help='guardar resultados en JSON (por defecto en benchmarks/resultados/)')
+    ap.add_argument('--comparar', metavar='RUTA', help='JSON de una corrida anterior')
+    ap.add_argument('--umbral', type=float, default=0.10)
+    args = ap.parse_args(argv)
+
+    resultados = ejecutar(args.filtro, args.escala, args.repeticiones)
+    corrida = {
+        'fecha': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'escala': args.escala,
+        'resultados': resultados,
+    }
+
+    if args.guardar is not None:
+        ruta = args.guardar or os.path.join(
+            RESULTADOS, datetime.datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+        os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump(corrida, f, indent=2)
+        print(f"\nResultados guardados en {ruta}")
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            base = json.load(f)
+        if base.get('escala') != args.escala:
+            print(f"Aviso: la corrida base usó escala {base.get('escala')}")
+        if comparar(resultados, base['resultados'], args.umbral):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+Generadores de programas sintéticos (válidos) para cada dialecto del repo.
+
+Todos reciben una `semilla`, así que la misma llamada produce siempre el
+mismo texto. Las tres formas que interesan para medir son:
+
+- ancho:    muchas declaraciones (globales, funciones, sentencias).
+- profundo: anidamiento profundo (paréntesis o bloques).
+- largo:    expresiones muy largas.
+"""
+
+import random
+
+OPS_ARIT = ('+', '-', '*', '/')
+
+
+def _nombre(prefijo, i):
+    return f"{prefijo}{i}"
+
+
+# ====================================================
+# Dialecto del analizador semántico (analizador_semantico/)
+# ====================================================
+def programa_semantico(semilla=0, globales=10, funciones=20, locales=5,
+                       sentencias=10, largo_expr=4, profundidad=0):
+    """
+    Programa sin errores semánticos: solo se usan variables declaradas,
+    las llamadas respetan número y tipo de argumentos, y los `return` solo
+    combinan valores del tipo de retorno de la función.
+    """
+    rnd = random.Random(semilla)
+    out = []
+    for g in range(globales):
+        out.append(f"{rnd.choice(('int', 'float'))} {_nombre('g', g)};\n")
+
+    firmas = []    # (nombre, tipo_retorno, [tipos de parámetros])
+    for f in range(funciones):
+        rtype = rnd.choice(('int', 'float'))
+        ptypes = [rnd.choice(('int', 'float')) for _ in range(rnd.randint(0, 3))]
+        nombre = _nombre('f', f)
+        params = ', '.join(f"{t} p{i}" for i, t in enumerate(ptypes))
+        out.append(f"{rtype} {nombre}({params}) {{\n")
+
+        variables = {'int': [], 'float': []}
+        for i, t in enumerate(ptypes):
+            variables[t].append(f"p{i}")
+        for i in range(locales):
+            t = rnd.choice(('int', 'float'))
+            out.append(f"    {t} v{i};\n")
+            variables[t].append(f"v{i}")
+        todas = variables['int'] + variables['float']
+
+        def operando(tipo=None):
+            # Con `tipo` solo se usan valores de ese tipo (para `return`)
+            pool = variables[tipo] if tipo else todas
+            if pool and rnd.random() < 0.7:
+                return rnd.choice(pool)
+            if tipo == 'float' or (tipo is None and rnd.random() < 0.3):
+                return f"{rnd.randint(0, 99)}.{rnd.randint(0, 9)}"
+            return str(rnd.randint(0, 999))
+
+        def argumento(tipo):
+            pool = variables[tipo]
+            if pool and rnd.random() < 0.7:
+                return rnd.choice(pool)
+            return f"{rnd.randint(0, 9)}.5" if tipo == 'float' else str(rnd.randint(0, 9))
+
+        def expresion(n, tipo=None):
+            partes = [operando(tipo)]
+            for _ in range(n - 1):
+                op = rnd.choice(OPS_ARIT)
+                if tipo is None and firmas and rnd.random() < 0.1:
+                    fn, _, fp = rnd.choice(firmas)
+                    partes.append(f" {op} {fn}({', '.join(argumento(t) for t in fp)})")
+                else:
+                    partes.append(f" {op} {operando(tipo)}")
+            expr = ''.join(partes)
+            for _ in range(profundidad):
+                expr = f"({expr} {rnd.choice(OPS_ARIT)} {operando(tipo)})"
+            return expr
+
+        for _ in range(sentencias):
+            if todas:
+                destino = rnd.choice(todas)
+                out.append(f"    {destino} = {expresion(largo_expr)};\n")
+            elif firmas:
+                fn, _, fp = rnd.choice(firmas)
+                out.append(f"    {fn}({', '.join(argumento(t) for t in fp)});\n")
+        out.append(f"    return {expresion(largo_expr, rtype)};\n}}\n")
+        firmas.append((nombre, rtype, ptypes))
+    return ''.join(out)
+
+
+def proyecto_modular(modulos=100, semilla=0, importes=3, funciones=4, globales=2,
+                     ciclos=0.0):
+    """
+    Proyecto de varios archivos para `analizador_semantico/modules.py`:
+    {nombre de módulo: fuente}. El módulo `mK` importa `m0` y hasta
+    `importes` módulos anteriores, y sus funciones llaman a las de ellos.
+    Con probabilidad `ciclos` importa además a `mK+1`, lo que cierra un
+    ciclo de imports. Los nombres llevan el prefijo del módulo, así que no
+    hay choques entre lo importado.
+    """
+    rnd = random.Random(semilla)
+    firmas = []     # por módulo: [(nombre, tipo_retorno, [tipos de parámetros])]
+    proyecto = {}
+    for k in range(modulos):
+        importados = sorted({0} | {rnd.randrange(k) for _ in range(importes)}) if k else []
+        visibles = [f for m in importados for f in firmas[m]]
+        out = [f"import m{m};\n" for m in importados]
+        if k + 1 < modulos and rnd.random() < ciclos:
+            out.append(f"import m{k + 1};\n")
+        for g in range(globales):
+            out.append(f"{rnd.choice(('int', 'float'))} m{k}_g{g};\n")
+        propias = []
+        for f in range(funciones):
+            rtype = rnd.choice(('int', 'float'))
+            ptypes = [rnd.choice(('int', 'float')) for _ in range(rnd.randint(0, 3))]
+            params = ', '.join(f"{t} p{i}" for i, t in enumerate(ptypes))
+            nombre = f"m{k}_f{f}"
+            out.append(f"{rtype} {nombre}({params}) {{\n    {rtype} r;\n")
+            for fn, _, fp in rnd.sample(visibles, min(3, len(visibles))):
+                args = ', '.join('1' if t == 'int' else '1.5' for t in fp)
+                out.append(f"    r = r + {fn}({args});\n")
+            out.append("    return r;\n}\n")
+            propias.append((nombre, rtype, ptypes))
+        firmas.append(propias)
+        proyecto[f"m{k}"] = ''.join(out)
+    return proyecto
+
+
+def funcion_extensa(locales=1000, sentencias=5000, semilla=0, sin_asignar=0.01):
+    """
+    Una sola función con `locales` variables `int` y `sentencias`
+    asignaciones para `analizador_semantico/dataflow.py`. Cada local se
+    asigna antes de leerse, salvo con probabilidad `sin_asignar`; algunas
+    asignaciones quedan sin leer (stores muertos).
+    """
+    rnd = random.Random(semilla)
+    out = ["int f(int p0) {\n"]
+    out.extend(f"    int v{i};\n" for i in range(locales))
+    asignadas = ['p0']
+    for i in range(sentencias):
+        destino = f"v{i % locales}" if i < locales else f"v{rnd.randrange(locales)}"
+        ops = [rnd.choice(asignadas) for _ in range(2)]
+        if rnd.random() < sin_asignar:
+            ops[0] = f"v{rnd.randrange(locales)}"
+        out.append(f"    {destino} = {ops[0]} {rnd.choice(OPS_ARIT)} {ops[1]};\n")
+        asignadas.append(destino)
+    out.append(f"    return {rnd.choice(asignadas)};\n}}\n")
+    return ''.join(out)
+
+
+def programa_llamadas(funciones=1000, semilla=0, llamadas=2, recursivas=0.0, sin_uso=0.1,
+                      llamadas_main=100):
+    """
+    Muchas funciones pequeñas que se llaman entre sí, más un `main`, para
+    `callgraph.py` e `inline.py`. La función `fK` llama hasta `llamadas`
+    veces a funciones anteriores del mismo tipo de retorno; con
+    probabilidad `recursivas` se llama además a sí misma. Con probabilidad
+    `sin_uso` una función no se llama desde ninguna otra ni desde `main`.
+    Sin errores semánticos: las expresiones solo mezclan valores del tipo
+    de retorno.
+    """
+    rnd = random.Random(semilla)
+    out = []
+    firmas = {'int': [], 'float': []}    # (nombre, [tipos de parámetros])
+
+    def literal(tipo):
+        return f"{rnd.randint(1, 9)}.5" if tipo == 'float' else str(rnd.randint(1, 9))
+
+    def llamada(nombre, ptypes, valores):
+        args = ', '.join(rnd.choice(valores[t]) if valores[t] and rnd.random() < 0.7 else literal(t)
+                         for t in ptypes)
+        return f"{nombre}({args})"
+
+    for f in range(funciones):
+        rtype = rnd.choice(('int', 'float'))
+        ptypes = [rnd.choice(('int', 'float')) for _ in range(rnd.randint(0, 2))]
+        nombre = _nombre('f', f)
+        valores = {'int': [], 'float': []}
+        for i, t in enumerate(ptypes):
+            valores[t].append(f"p{i}")
+        params = ', '.join(f"{t} p{i}" for i, t in enumerate(ptypes))
+        partes = [rnd.choice(valores[rtype]) if valores[rtype] else literal(rtype)]
+        for fn, fp in rnd.sample(firmas[rtype], min(llamadas, len(firmas[rtype]))):
+            partes.append(llamada(fn, fp, valores))
+        if rnd.random() < recursivas:
+            partes.append(llamada(nombre, ptypes, valores))
+        expr = f" {rnd.choice(OPS_ARIT)} ".join(partes)
+        out.append(f"{rtype} {nombre}({params}) {{\n    {rtype} r;\n    r = {expr};\n    return r;\n}}\n")
+        if rnd.random() >= sin_uso:
+            firmas[rtype].append((nombre, ptypes))
+
+    out.append("int main() {\n    int s;\n    float t;\n    s = 0;\n    t = 0.0;\n")
+    vacio = {'int': [], 'float': []}
+    for _ in range(llamadas_main):
+        tipo = rnd.choice(('int', 'float'))
+        if firmas[tipo]:
+            fn, fp = rnd.choice(firmas[tipo])
+            destino = 's' if tipo == 'int' else 't'
+            out.append(f"    {destino} = {destino} + {llamada(fn, fp, vacio)};\n")
+    out.append("    return s;\n}\n")
+    return ''.join(out)
+
+
+# ====================================================
+# Dialecto de `construccion traductor`
+# ====================================================
+def programa_traductor(semilla=0, sentencias=50, profundidad=2, largo_expr=4):
+    """Asignaciones, `print`, `if/else` y `while` anidados `profundidad` niveles."""
+    rnd = random.Random(semilla)
+    ops = OPS_ARIT + ('<', '<=', '>', '>=', '==', '!=')
+
+    def expresion():
+        partes = [rnd.choice(('x', 'y', 'z', str(rnd.randint(0, 99))))]
+        for _ in range(largo_expr - 1):
+            partes.append(f" {rnd.choice(ops)} {rnd.choice(('x', 'y', '(x - 1)', '3.5'))}")
+        return ''.join(partes)
+
+    def bloque(nivel, sangria):
+        out = []
+        for _ in range(sentencias if nivel == 0 else 2):
+            r = rnd.random()
+            if nivel < profundidad and r < 0.3:
+                out.append(f"{sangria}if ({expresion()}) {{\n")
+                out.extend(bloque(nivel + 1, sangria + '    '))
+                out.append(f"{sangria}}} else {{\n")
+                out.extend(bloque(nivel + 1, sangria + '    '))
+                out.append(f"{sangria}}}\n")
+            elif nivel < profundidad and r < 0.5:
+                out.append(f"{sangria}while ({expresion()}) {{\n")
+                out.extend(bloque(nivel + 1, sangria + '    '))
+                out.append(f"{sangria}}}\n")
+            elif r < 0.8:
+                out.append(f"{sangria}{rnd.choice('xyz')} = {expresion()};\n")
+            else:
+                out.append(f"{sangria}print({expresion()});\n")
+        return out
+
+    return ''.join(bloque(0, ''))
+
+
+# ====================================================
+# Dialecto de compilador.lr (Gramatica del compilador/)
+# ====================================================
+def programa_compilador(semilla=0, globales=10, funciones=10, sentencias=10,
+                        profundidad=1, largo_expr=4):
+    """
+    Texto que acepta la tabla de `compilador.lr`, terminado en '$'. Se
+    tokeniza con `Lexico` para obtener el flujo de tokens del parser LR.
+    """
+    rnd = random.Random(semilla)
+    ops = ('+', '-', '*', '/', '<', '>=', '==', '!=', '&&', '||')
+
+    def termino():
+        r = rnd.random()
+        if r < 0.5:
+            return rnd.choice(('a', 'b', 'c'))
+        if r < 0.7:
+            return str(rnd.randint(0, 99))
+        if r < 0.9:
+            return f"{rnd.randint(0, 9)}.{rnd.randint(0, 9)}"
+        return f"f0({rnd.choice(('a', 'b'))}, 1)"
+
+    def expresion():
+        partes = [termino()]
+        for _ in range(largo_expr - 1):
+            partes.append(f" {rnd.choice(ops)} {termino()}")
+        return ''.join(partes)
+
+    def sentencia(nivel):
+        r = rnd.random()
+        if nivel < profundidad and r < 0.25:
+            cuerpo = ' '.join(sentencia(nivel + 1) for _ in range(2))
+            return f"if ({expresion()}) {{ {cuerpo} }} else {{ {sentencia(nivel + 1)} }}"
+        if nivel < profundidad and r < 0.4:
+            cuerpo = ' '.join(sentencia(nivel + 1) for _ in range(2))
+            return f"while ({expresion()}) {{ {cuerpo} }}"
+        if r < 0.9:
+            return f"{rnd.choice('abc')} = {expresion()};"
+        return f"f0({expresion()}, 2);"
+
+    out = []
+    for g in range(globales):
+        out.append(f"{rnd.choice(('int', 'float'))} {_nombre('g', g)}, {_nombre('h', g)};\n")
+    for f in range(funciones):
+        out.append(f"int {_nombre('f', f)}(int a, float b) {{\n    int c;\n")
+        for _ in range(sentencias):
+            out.append(f"    {sentencia(0)}\n")
+        out.append("    return a;\n}\n")
+    out.append('$')
+    return ''.join(out)
+
+
+# ====================================================
+# Gramática de juguete E -> id + E | id
+# ====================================================
+def cadena_suma(n):
+    """'id + id + ... + id $' con `n` identificadores."""
+    return ' + '.join(['id'] * n) + ' $'
@@ -1,5 +1,6 @@
 import re
 import sys
+from bisect import bisect_right
 
 # Token specification
 token_specification = [
@@ -28,66 +29,88 @@ token_specification = [
 
 Token = re.compile('|'.join('(?P<%s>%s)' % pair for pair in token_specification))
 
+# Palabras reservadas: lexema -> tipo de token. La búsqueda en el dict es
+# una sola operación de hash, sin importar cuántas palabras se agreguen.
+KEYWORDS = {
+    'if': 'IF',
+    'else': 'ELSE',
+    'while': 'WHILE',
+    'print': 'PRINT',
+}
+
 class LexError(Exception):
     pass
 
+class LineIndex:
+    """
+    Tabla de inicios de línea de un texto fuente.
+
+    Los tokens solo guardan su offset; la línea y la columna se calculan
+    bajo demanda (p. ej. al reportar un error) con búsqueda binaria. La
+    tabla se construye una única vez, la primera vez que se necesita.
+    """
+    def __init__(self, text):
+        self.text = text
+        self.starts = None
+
+    def _build(self):
+        self.starts = [0]
+        self.starts.extend(mo.end() for mo in re.finditer('\n', self.text))
+
+    def position(self, offset):
+        if self.starts is None:
+            self._build()
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
 class Lexer:
     def __init__(self, code):
         self.code = code
-        self.line = 1
-        self.col = 1
+        self.lines = LineIndex(code)
         self.tokens = []
 
     def tokenize(self):
         for mo in Token.finditer(self.code):
             kind = mo.lastgroup
+            if kind == 'SKIP' or kind == 'NEWLINE':
+                continue
             value = mo.group()
+            pos = mo.start()
             if kind == 'NUMBER':
-                tok = ('NUMBER', float(value), self.line, self.col)
+                tok = ('NUMBER', float(value), pos)
             elif kind == 'ID':
-                if value in ('if','else','while','print'):
-                    tok = (value.upper(), value, self.line, self.col)
-                else:
-                    tok = ('ID', value, self.line, self.col)
-            elif kind == 'SKIP':
-                self._advance(value)
-                continue
-            elif kind == 'NEWLINE':
-                self.line += 1
-                self.col = 1
-                continue
+                tok = (KEYWORDS.get(value, 'ID'), value, pos)
             elif kind == 'MISMATCH':
-                raise LexError(f"Unexpected character '{value}' at {self.line}:{self.col}")
+                line, col = self.lines.position(pos)
+                raise LexError(f"Unexpected character '{value}' at {line}:{col}")
             else:
-                tok = (kind, value, self.line, self.col)
+                tok = (kind, value, pos)
             self.tokens.append(tok)
-            self._advance(value)
-        self.tokens.append(('EOF', '', self.line, self.col))
+        self.tokens.append(('EOF', '', len(self.code)))
         return self.tokens
 
-    def _advance(self, text):
-        lines = text.split('\n')
-        if len(lines) > 1:
-            self.line += len(lines) - 1
-            self.col = len(lines[-1]) + 1
-        else:
-            self.col += len(text)
-
 class ParseError(Exception):
     pass
 
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, lines=None):
         self.tokens = tokens
+        self.lines = lines
         self.pos = 0
         self.current = tokens[0]
 
+    def where(self, tok):
+        if self.lines is None:
+            return f"offset {tok[2]}"
+        line, col = self.lines.position(tok[2])
+        return f"{line}:{col}"
+
     def eat(self, kind):
         if self.current[0] == kind:
             self.pos += 1
             self.current = self.tokens[self.pos]
         else:
-            raise ParseError(f"Expected {kind} at {self.current[2]}:{self.current[3]}, got {self.current[0]}")
+            raise ParseError(f"Expected {kind} at {self.where(self.current)}, got {self.current[0]}")
 
     def parse(self):
         self.program()
@@ -109,7 +132,7 @@ class Parser:
         elif self.current[0] == 'PRINT':
             self.print_stmt()
         else:
-            raise ParseError(f"Invalid statement start: {self.current[0]} at {self.current[2]}:{self.current[3]}")
+            raise ParseError(f"Invalid statement start: {self.current[0]} at {self.where(self.current)}")
 
     def assignment(self):
         self.eat('ID')
@@ -189,7 +212,7 @@ class Parser:
             self.expression()
             self.eat('RPAREN')
         else:
-            raise ParseError(f"Unexpected token {self.current[0]} in expression at {self.current[2]}:{self.current[3]}")
+            raise ParseError(f"Unexpected token {self.current[0]} in expression at {self.where(self.current)}")
 
 if __name__ == '__main__':
     if len(sys.argv) != 2:
@@ -201,9 +224,9 @@ if __name__ == '__main__':
         lexer = Lexer(code)
         tokens = lexer.tokenize()
         print("Tokens:")
-        for t in tokens:
-            print(t)
-        parser = Parser(tokens)
+        for kind, value, pos in tokens:
+            print((kind, value) + lexer.lines.position(pos))
+        parser = Parser(tokens, lexer.lines)
         parser.parse()
     except (LexError, ParseError) as e:
         print(f"Error: {e}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cliente (bloqueante) del servidor de compilación.
+
+Uso:
+    python cliente.py check semantico archivo.src [--socket RUTA]
+    python cliente.py stats
+"""
+
+import argparse
+import json
+import socket
+import sys
+
+from servidor import SOCKET_POR_DEFECTO
+
+
+class ErrorServidor(Exception):
+    pass
+
+
+class Cliente:
+    def __init__(self, ruta=SOCKET_POR_DEFECTO):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(ruta)
+        self.archivo = self.sock.makefile('rwb')
+        self.siguiente_id = 0
+
+    def cerrar(self):
+        self.archivo.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def _enviar(self, op, lenguaje=None, fuente=None):
+        self.siguiente_id += 1
+        peticion = {'id': self.siguiente_id, 'op': op, 'lenguaje': lenguaje, 'fuente': fuente}
+        self.archivo.write(json.dumps(peticion, ensure_ascii=False).encode('utf-8') + b'\n')
+        return self.siguiente_id
+
+    def _recibir(self):
+        linea = self.archivo.readline()
+        if not linea:
+            raise ErrorServidor("el servidor cerró la conexión")
+        return json.loads(linea)
+
+    def pedir(self, op, lenguaje=None, fuente=None):
+        """Una petición; retorna `resultado` o lanza ErrorServidor."""
+        self._enviar(op, lenguaje, fuente)
+        self.archivo.flush()
+        respuesta = self._recibir()
+        if not respuesta['ok']:
+            raise ErrorServidor(respuesta['error'])
+        return respuesta['resultado']
+
+    def pedir_varios(self, peticiones, ventana=32):
+        """
+        Envía `peticiones` [(op, lenguaje, fuente), ...] sin esperar cada
+        respuesta, con a lo más `ventana` pendientes (así el cliente nunca
+        se bloquea escribiendo mientras el servidor espera que lea).
+        Retorna las respuestas completas en el orden de las peticiones.
+        """
+        respuestas, orden = {}, []
+        pendientes = 0
+        for op, lenguaje, fuente in peticiones:
+            orden.append(self._enviar(op, lenguaje, fuente))
+            pendientes += 1
+            if pendientes >= ventana:
+                self.archivo.flush()
+                r = self._recibir()
+                respuestas[r['id']] = r
+                pendientes -= 1
+        self.archivo.flush()
+        for _ in range(pendientes):
+            r = self._recibir()
+            respuestas[r['id']] = r
+        return [respuestas[i] for i in orden]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('op', choices=('tokenize', 'parse', 'check', 'stats'))
+    ap.add_argument('lenguaje', nargs='?', choices=('semantico', 'gramatica'))
+    ap.add_argument('archivo', nargs='?')
+    ap.add_argument('--socket', default=SOCKET_POR_DEFECTO)
+    args = ap.parse_args(argv)
+
+    fuente = None
+    if args.op != 'stats':
+        if not args.lenguaje or not args.archivo:
+            ap.error("faltan LENGUAJE y ARCHIVO")
+        with open(args.archivo, encoding='utf-8') as f:
+            fuente = f.read()
+    try:
+        with Cliente(args.socket) as cliente:
+            resultado = cliente.pedir(args.op, args.lenguaje, fuente)
+    except (OSError, ErrorServidor) as e:
+        print(f"Error: {e}")
+        return 1
+    print(json.dumps(resultado, ensure_ascii=False, indent=2))
+    return 1 if resultado.get('errores') else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servidor de compilación: mantiene cargados los analizadores y la tabla de
+`compilador.lr` y atiende peticiones JSON por un socket Unix.
+
+Protocolo: una petición por línea y una respuesta por línea.
+
+    {"id": 1, "op": "check", "lenguaje": "semantico", "fuente": "int x;"}
+    {"id": 1, "ok": true, "resultado": {"errores": []}}
+
+- op: "tokenize", "parse" o "check".
+- lenguaje: "semantico" (analizador_semantico/lexer_parser.py) o
+  "gramatica" (Gramatica del compilador: Lexico + compilador.lr).
+
+El cliente puede mandar varias peticiones sin esperar las respuestas
+(pipelining). Las respuestas llevan el mismo `id` y pueden llegar en otro
+orden. Con más de --en-vuelo peticiones pendientes en una conexión, el
+servidor deja de leer esa conexión hasta que termine alguna. Eso es la
+contrapresión: el socket se llena y el cliente se bloquea al escribir.
+
+El trabajo de CPU se hace en un pool de procesos. Cada proceso importa los
+módulos y lee la tabla LR una sola vez, al arrancar. Los resultados se
+guardan en una caché LRU por (op, lenguaje, hash del fuente), con un límite
+de entradas (--cache) y otro de bytes de los resultados en JSON
+(--cache-mb). La clave no guarda el fuente, que puede medir hasta
+LIMITE_LINEA.
+
+Uso:
+    python servidor.py [--socket RUTA] [--procesos N] [--en-vuelo N] [--cache N] [--cache-mb N]
+    python servidor.py --local check semantico archivo.src   # una vez, sin servidor
+"""
+
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import os
+import runpy
+import signal
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIR_GRAMATICA = os.path.join(RAIZ, 'Gramatica del compilador')
+
+SOCKET_POR_DEFECTO = '/tmp/compilador.sock'
+OPERACIONES = ('tokenize', 'parse', 'check')
+LENGUAJES = ('semantico', 'gramatica')
+LIMITE_LINEA = 64 * 1024 * 1024     # tamaño máximo de una petición
+
+
+# ====================================================
+# 1) TRABAJO EN LOS PROCESOS DEL POOL
+# ====================================================
+_cargado = {}
+
+
+def inicializar():
+    """
+    Importa los analizadores y lee compilador.lr (una vez por proceso).
+    ast_semantico.py se carga por ruta y trae consigo la gramática (`main.py`)
+    y lexer_parser.py, con nombres únicos y sin tocar sys.path.
+    """
+    if _cargado:
+        return
+    importar = runpy.run_path(os.path.join(RAIZ, 'Analizador Sintáctico', 'cargador.py'))['importar']
+    ast_semantico = importar('ast_semantico', os.path.join(DIR_GRAMATICA, 'ast_semantico.py'))
+    gramatica = ast_semantico.gramatica
+    rules, _, _, table = gramatica.leer_lr_file(os.path.join(DIR_GRAMATICA, 'compilador.lr'))
+    _cargado.update(sem=gramatica.semantico, gram=gramatica, ast=ast_semantico,
+                    rules=rules, table=table)
+
+
+def procesar(op, lenguaje, fuente):
+    """Atiende una petición ya validada; retorna un dict serializable en JSON."""
+    inicializar()
+    if lenguaje == 'semantico':
+        return _semantico(op, fuente)
+    return _gramatica(op, fuente)
+
+
+def _semantico(op, fuente):
+    sem = _cargado['sem']
+    lexer = sem.Lexer(fuente)
+    try:
+        tokens = lexer.tokenize_bulk().to_tuples()
+        if op == 'tokenize':
+            return {'tokens': tokens}
+        ast = sem.Parser(tokens, lexer.lines).parse()
+        if op == 'parse':
+            return {'nodos': sem.count_nodes(ast)}
+        sem.Node.tabla_simbolos = sem.SymbolTable(lexer.lines)
+        sem.Node.ambito = ''
+        ast.validate_types()
+        return {'errores': sem.Node.tabla_simbolos.errors}
+    except (sem.LexError, sem.ParseError) as e:
+        return {'errores': [f"Error: {e}"]}
+
+
+def _gramatica(op, fuente):
+    gram, sem, ast = _cargado['gram'], _cargado['sem'], _cargado['ast']
+    try:
+        tokens = ast.tokenizar(fuente, gram)    # lexemas con su offset (Lexema)
+    except ValueError as e:
+        return {'errores': [str(e)]}
+    if op == 'tokenize':
+        return {'tokens': [(t, str(lexema)) for t, lexema in tokens]}
+
+    # parser_lr informa con print(); aquí los mensajes se devuelven
+    salida = io.StringIO()
+    with redirect_stdout(salida):
+        if op == 'parse':
+            arbol = gram.parser_lr(tokens, _cargado['rules'], _cargado['table'], traza=False)
+        else:
+            arbol = gram.parser_lr_ast(tokens, _cargado['rules'], _cargado['table'], ast.ACCIONES)
+    if not arbol:
+        errores = [m for m in salida.getvalue().splitlines() if m.startswith('Error')]
+        return {'aceptada': False, 'errores': errores}
+    if op == 'parse':
+        return {'aceptada': True}
+    sem.Node.tabla_simbolos = sem.SymbolTable(sem.LineIndex(fuente))
+    sem.Node.ambito = ''
+    arbol.validate_types()
+    return {'aceptada': True, 'errores': sem.Node.tabla_simbolos.errors}
+
+
+# ====================================================
+# 2) SERVIDOR ASYNCIO
+# ====================================================
+class Servidor:
+    def __init__(self, ruta=SOCKET_POR_DEFECTO, procesos=None, en_vuelo=64, cache=256,
+                 cache_bytes=256 * 1024 * 1024):
+        self.ruta = ruta
+        self.procesos = procesos or os.cpu_count() or 1
+        self.en_vuelo = en_vuelo
+        self.tam_cache = cache
+        self.max_bytes_cache = cache_bytes
+        self.cache = OrderedDict()      # clave -> (resultado, bytes)
+        self.bytes_cache = 0
+        self.pool = None
+        self.estadisticas = {'peticiones': 0, 'aciertos_cache': 0, 'errores': 0}
+
+    async def servir(self, detener):
+        """Atiende conexiones hasta que se active el evento `detener`."""
+        self.pool = ProcessPoolExecutor(self.procesos, initializer=inicializar)
+        loop = asyncio.get_running_loop()
+        # Arranca todos los procesos ahora, no en la primera petición
+        await asyncio.gather(*(loop.run_in_executor(self.pool, inicializar)
+                               for _ in range(self.procesos)))
+        if os.path.exists(self.ruta):
+            os.unlink(self.ruta)
+        servidor = await asyncio.start_unix_server(self.atender, path=self.ruta, limit=LIMITE_LINEA)
+        print(f"Escuchando en {self.ruta} ({self.procesos} procesos)", file=sys.stderr)
+        try:
+            async with servidor:
+                await detener.wait()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            if os.path.exists(self.ruta):
+                os.unlink(self.ruta)
+
+    async def atender(self, reader, writer):
+        cupo = asyncio.Semaphore(self.en_vuelo)
+        escritura = asyncio.Lock()
+        tareas = set()
+        try:
+            while True:
+                # Contrapresión: no se lee la siguiente petición sin cupo libre
+                await cupo.acquire()
+                try:
+                    linea = await reader.readline()
+                except (ValueError, ConnectionError):
+                    linea = b''
+                if not linea:
+                    cupo.release()
+                    break
+                tarea = asyncio.create_task(self.responder(linea, writer, escritura, cupo))
+                tareas.add(tarea)
+                tarea.add_done_callback(tareas.discard)
+            if tareas:
+                await asyncio.gather(*tareas, return_exceptions=True)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def responder(self, linea, writer, escritura, cupo):
+        try:
+            respuesta = await self.resolver(linea)
+            datos = json.dumps(respuesta, ensure_ascii=False).encode('utf-8') + b'\n'
+            async with escritura:
+                writer.write(datos)
+                await writer.drain()
+        finally:
+            cupo.release()
+
+    async def resolver(self, linea):
+        self.estadisticas['peticiones'] += 1
+        try:
+            peticion = json.loads(linea)
+        except ValueError as e:
+            return self._error(None, f"JSON inválido: {e}")
+        if not isinstance(peticion, dict):
+            return self._error(None, "la petición debe ser un objeto JSON")
+        id_ = peticion.get('id')
+        op, lenguaje, fuente = peticion.get('op'), peticion.get('lenguaje'), peticion.get('fuente')
+        if op == 'stats':
+            return {'id': id_, 'ok': True, 'resultado': dict(self.estadisticas, cache=len(self.cache),
+                                                             bytes_cache=self.bytes_cache)}
+        if op not in OPERACIONES:
+            return self._error(id_, f"op desconocida: {op!r}")
+        if lenguaje not in LENGUAJES:
+            return self._error(id_, f"lenguaje desconocido: {lenguaje!r}")
+        if not isinstance(fuente, str):
+            return self._error(id_, "falta 'fuente' (texto)")
+
+        clave = (op, lenguaje, hashlib.sha256(fuente.encode('utf-8', 'surrogatepass')).digest())
+        guardado = self.cache.get(clave)
+        if guardado is not None:
+            self.cache.move_to_end(clave)
+            self.estadisticas['aciertos_cache'] += 1
+            return {'id': id_, 'ok': True, 'resultado': guardado[0]}
+        loop = asyncio.get_running_loop()
+        try:
+            resultado = await loop.run_in_executor(self.pool, procesar, op, lenguaje, fuente)
+        except Exception as e:
+            return self._error(id_, f"{type(e).__name__}: {e}")
+        if self.tam_cache:
+            self._guardar(clave, resultado)
+        return {'id': id_, 'ok': True, 'resultado': resultado}
+
+    def _guardar(self, clave, resultado):
+        """Guarda en la caché y saca las entradas más viejas hasta respetar ambos límites."""
+        # Con ensure_ascii el largo es una cota de los bytes en UTF-8
+        tam = len(json.dumps(resultado))
+        if tam > self.max_bytes_cache:
+            return
+        anterior = self.cache.pop(clave, None)
+        if anterior is not None:
+            self.bytes_cache -= anterior[1]
+        self.cache[clave] = (resultado, tam)
+        self.bytes_cache += tam
+        while len(self.cache) > self.tam_cache or self.bytes_cache > self.max_bytes_cache:
+            self.bytes_cache -= self.cache.popitem(last=False)[1][1]
+
+    def _error(self, id_, mensaje):
+        self.estadisticas['errores'] += 1
+        return {'id': id_, 'ok': False, 'error': mensaje}
+
+
+# ====================================================
+# 3) MAIN
+# ====================================================
+async def _principal(args):
+    detener = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, detener.set)
+    await Servidor(args.socket, args.procesos, args.en_vuelo, args.cache,
+                   args.cache_mb * 1024 * 1024).servir(detener)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--socket', default=SOCKET_POR_DEFECTO)
+    ap.add_argument('--procesos', type=int, default=None, help='procesos del pool (por defecto, uno por CPU)')
+    ap.add_argument('--en-vuelo', type=int, default=64, help='peticiones pendientes por conexión')
+    ap.add_argument('--cache', type=int, default=256, help='resultados guardados (0 = sin caché)')
+    ap.add_argument('--cache-mb', type=int, default=256, help='megabytes de resultados guardados')
+    ap.add_argument('--local', nargs=3, metavar=('OP', 'LENGUAJE', 'ARCHIVO'),
+                    help='procesar un archivo en este proceso y salir')
+    args = ap.parse_args(argv)
+
+    if args.local:
+        op, lenguaje, archivo = args.local
+        if op not in OPERACIONES or lenguaje not in LENGUAJES:
+            ap.error(f"op en {OPERACIONES}, lenguaje en {LENGUAJES}")
+        with open(archivo, encoding='utf-8') as f:
+            fuente = f.read()
+        print(json.dumps(procesar(op, lenguaje, fuente), ensure_ascii=False))
+        return 0
+
+    asyncio.run(_principal(args))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())